@@ -0,0 +1,38 @@
+import tracemalloc
+from src.profiling.FrameProfiler import FrameProfiler
+
+class AllocationProfiler(FrameProfiler):
+    """FrameProfiler that also tracks the peak memory each span allocated.
+
+    Every recorded span stores how far tracemalloc's peak rose above the
+    traced size at the end of the previous span, then resets the peak, so
+    the figure belongs to that command or layer alone. Whole-tick spans are
+    skipped because their peak has already been split up. Only meaningful
+    while tracemalloc is tracing.
+    """
+    def __init__(self, capacity=600):
+        super().__init__(capacity)
+        self.peaks = {}
+        self.baseline = 0
+        # Largest traced heap seen at any point, in bytes
+        self.max_traced = 0
+
+    def begin_frame(self, epoch):
+        frame = super().begin_frame(epoch)
+        self.mark()
+        return frame
+
+    def mark(self):
+        tracemalloc.reset_peak()
+        self.baseline = tracemalloc.get_traced_memory()[0]
+
+    def record(self, category, name, start, end):
+        super().record(category, name, start, end)
+        if category == 'tick':
+            return
+        key = (category, name)
+        peak = tracemalloc.get_traced_memory()[1]
+        self.max_traced = max(self.max_traced, peak)
+        if peak - self.baseline > self.peaks.get(key, 0):
+            self.peaks[key] = peak - self.baseline
+        self.mark()
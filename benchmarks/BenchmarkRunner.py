@@ -0,0 +1,143 @@
+import tracemalloc
+from time import perf_counter
+import pygame
+from src.assets.AssetManager import AssetManager
+from src.profiling.FrameProfiler import FrameProfiler
+from .AllocationProfiler import AllocationProfiler
+from .OffscreenView import OffscreenView
+
+class BenchmarkRunner:
+    """Runs Scenarios and compares their results against a stored baseline.
+
+    Each scenario runs twice. The timing pass measures every tick (the
+    simulation step plus, if render is set, a full offscreen redraw) with a
+    FrameProfiler attached for the per-subsystem split. The memory pass
+    repeats a shorter run under tracemalloc, which is too slow to leave on
+    while timing. Results are plain dicts so they can be stored as JSON.
+    """
+    # Metrics compared against the baseline: (path, higher is better, threshold factor)
+    CHECKS = (
+        (('ticks_per_second',), True, 1),
+        (('frame_ms', 'p50'), False, 1),
+        # Tail latency is noisier, so it gets twice the slack
+        (('frame_ms', 'p99'), False, 2),
+        (('peak_kib',), False, 1),
+    )
+
+    def __init__(self, render=True, memory_ticks=60, adaptive=False):
+        self.render = render
+        # Feeds frame times to the scenario's QualityGovernor, as the game's render loop does
+        self.adaptive = adaptive
+        self.memory_ticks = memory_ticks
+        # Sprites are only converted to the display format, as in the game,
+        # once a mode is set; under the dummy video driver this opens no window
+        if render and pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+        # Shared so every scenario draws from the same decoded sheets
+        self.assets = AssetManager()
+
+    @staticmethod
+    def percentile(values, fraction):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    @classmethod
+    def summarize(cls, seconds):
+        milliseconds = [value * 1000 for value in seconds]
+        return {'mean': round(sum(milliseconds) / len(milliseconds), 4),
+                'p50': round(cls.percentile(milliseconds, 0.5), 4),
+                'p99': round(cls.percentile(milliseconds, 0.99), 4)}
+
+    def play(self, scenario, ticks, profiler, before_render=None):
+        """Builds the scenario, warms it up and runs ticks measured ticks."""
+        simulation = scenario.build()
+        view = OffscreenView(simulation.game_state, assets=self.assets) if self.render else None
+        input_source = scenario.input_source()
+        game_state = simulation.game_state
+        for _ in range(scenario.warmup):
+            simulation.step(*input_source(game_state.epoch))
+            scenario.refill(game_state)
+            if view is not None:
+                view.render()
+        simulation.profiler = profiler
+        if view is not None:
+            view.profiler = profiler
+        tick_seconds = []
+        frame_seconds = []
+        for _ in range(ticks):
+            direction, shoot = input_source(game_state.epoch)
+            start = perf_counter()
+            simulation.step(direction, shoot)
+            stepped = perf_counter()
+            if view is not None:
+                if before_render is not None:
+                    before_render()
+                view.render()
+            tick_seconds.append(stepped - start)
+            frame_seconds.append(perf_counter() - start)
+            if self.adaptive:
+                game_state.quality.record_frame(frame_seconds[-1])
+            scenario.refill(game_state)
+        return tick_seconds, frame_seconds, game_state.quality.level
+
+    def run(self, scenario):
+        profiler = FrameProfiler(capacity=scenario.ticks)
+        tick_seconds, frame_seconds, quality = self.play(scenario, scenario.ticks, profiler)
+        totals = profiler.totals()
+
+        allocations = AllocationProfiler(capacity=self.memory_ticks)
+        tracemalloc.start()
+        try:
+            # Rendering starts from the end of the step's last span
+            self.play(scenario, self.memory_ticks, allocations, before_render=allocations.mark)
+        finally:
+            tracemalloc.stop()
+
+        subsystems = {}
+        for (category, name), (seconds, calls) in sorted(totals.items()):
+            if category == 'tick':
+                continue
+            subsystems[f"{category}/{name}"] = {
+                'mean_ms': round(seconds * 1000 / scenario.ticks, 4),
+                'peak_kib': round(allocations.peaks.get((category, name), 0) / 1024, 1),
+            }
+        return {
+            'scenario': scenario.to_dict(),
+            'ticks_per_second': round(len(frame_seconds) / sum(frame_seconds), 1),
+            'tick_ms': self.summarize(tick_seconds),
+            'frame_ms': self.summarize(frame_seconds),
+            'peak_kib': round(allocations.max_traced / 1024, 1),
+            'quality': quality,
+            'subsystems': subsystems,
+        }
+
+    def run_all(self, scenarios, report=None):
+        results = {}
+        for scenario in scenarios:
+            results[scenario.name] = self.run(scenario)
+            if report is not None:
+                report(scenario.name, results[scenario.name])
+        return results
+
+    @classmethod
+    def compare(cls, results, baseline, threshold=0.25):
+        """Returns a message for every metric that regressed by more than threshold.
+
+        Scenarios missing from either side are skipped.
+        """
+        regressions = []
+        for name, result in results.items():
+            expected = baseline.get(name)
+            if expected is None:
+                continue
+            for path, higher_is_better, factor in cls.CHECKS:
+                current, reference = result, expected
+                for key in path:
+                    current, reference = current.get(key), reference.get(key)
+                if current is None or reference is None or reference == 0:
+                    continue
+                limit = threshold * factor
+                change = current / reference - 1
+                if (higher_is_better and change < -limit / (1 + limit)) or (not higher_is_better and change > limit):
+                    regressions.append(f"{name}: {'.'.join(path)} {reference} -> {current} ({change:+.0%})")
+        return regressions
@@ -0,0 +1,48 @@
+from time import perf_counter
+import pygame
+from pygame import Vector2
+from src.assets.AssetManager import AssetManager
+from src.layers.BulletsLayer import BulletsLayer
+from src.layers.ParticlesLayer import ParticlesLayer
+from src.layers.SpriteAtlas import SpriteAtlas
+from src.layers.SpriteEffectCache import SpriteEffectCache
+from src.layers.TileMapLayer import TileMapLayer
+from src.layers.UnitsLayer import UnitsLayer
+from src.ui.Camera import Camera
+
+class OffscreenView:
+    """The UserInterface layer stack drawing into a plain Surface, without a window.
+
+    Provides the attributes layers read from their user interface (camera,
+    cell_size, sprite_atlas), so the same drawing code is measured as in the
+    game. Every frame is a full redraw.
+    """
+    def __init__(self, game_state, viewport_size=(16, 16), assets=None, profiler=None):
+        self.game_state = game_state
+        self.profiler = profiler
+        self.cell_size = Vector2(32, 32)
+        self.camera = Camera(game_state.world_size, viewport_size, self.cell_size)
+        self.surface = pygame.Surface(self.camera.screen_size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.sprite_atlas = SpriteAtlas(self.cell_size, SpriteEffectCache(),
+                                        assets=assets if assets is not None else AssetManager())
+        self.layers = [
+            TileMapLayer(self, "assets/tiles.png", game_state),
+            UnitsLayer(self, "assets/player_sprites.png", game_state, game_state.units),
+            BulletsLayer(self, "assets/fireball.png", game_state, game_state.bullets),
+            ParticlesLayer(self, "assets/particle.png", game_state),
+        ]
+        for layer in self.layers:
+            game_state.add_observer(layer)
+
+    def render(self):
+        self.camera.follow(self.game_state.player_unit.position)
+        self.surface.fill((0, 0, 0))
+        for layer in self.layers:
+            if self.profiler is None:
+                layer.render(self.surface)
+                continue
+            start = perf_counter()
+            layer.render(self.surface)
+            self.profiler.record('layer', type(layer).__name__, start, perf_counter())
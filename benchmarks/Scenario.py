@@ -0,0 +1,75 @@
+import random
+from pygame import Vector2
+from src.simulation.Simulation import Simulation
+from src.simulation.ScriptedInput import ScriptedInput
+from src.state.GameState import GameState
+
+class Scenario:
+    """A reproducible workload: world size plus enemy, bullet and particle counts.
+
+    The counts are held steady while the scenario runs: enemies that die are
+    respawned, bullets are fired from random enemies until bullets are in
+    flight and particles are re-emitted around units as they expire, so
+    every measured tick sees the same load. The player walks a loop and
+    cannot die, which keeps the camera and chunk streaming moving.
+    """
+    def __init__(self, name, world_size=(16, 16), enemies=4, bullets=0, particles=0, ticks=300, warmup=30, seed=1):
+        self.name = name
+        self.world_size = (int(world_size[0]), int(world_size[1]))
+        self.enemies = enemies
+        self.bullets = bullets
+        self.particles = particles
+        self.ticks = ticks
+        self.warmup = warmup
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    @classmethod
+    def suite(cls):
+        """The standard scenarios, from an idle 16x16 world up to a 512x512 one."""
+        return [
+            cls('idle-16', (16, 16)),
+            cls('enemies-64', (64, 64), enemies=300),
+            cls('bullets-64', (64, 64), enemies=40, bullets=600),
+            cls('particles-64', (64, 64), enemies=40, particles=20000),
+            cls('mixed-128', (128, 128), enemies=400, bullets=200, particles=5000),
+            cls('crowd-256', (256, 256), enemies=800, bullets=100, particles=2000),
+            cls('world-512', (512, 512), enemies=200, bullets=50, particles=1000),
+        ]
+
+    def build(self):
+        """Returns a Simulation populated to the scenario's counts."""
+        game_state = GameState(self.world_size, seed=self.seed)
+        self.random = random.Random(self.seed)
+        simulation = Simulation(game_state)
+        self.refill(game_state)
+        return simulation
+
+    def input_source(self):
+        side = max(2, min(self.world_size) // 4)
+        script = ([((1, 0), False)] * side + [((0, 1), True)] * side +
+                  [((-1, 0), False)] * side + [((0, -1), True)] * side)
+        return ScriptedInput(script, loop=True)
+
+    def refill(self, game_state):
+        """Tops the entity counts back up; called between ticks, outside the timed step."""
+        game_state.player_unit.health = 100
+        enemies = [unit for unit in game_state.units if unit.health != 0 and unit not in game_state.players]
+        for _ in range(self.enemies - len(enemies)):
+            game_state.spawn_enemy()
+            enemies.append(game_state.units[-1])
+        if enemies:
+            directions = (Vector2(1, 0), Vector2(-1, 0), Vector2(0, 1), Vector2(0, -1))
+            for _ in range(self.bullets - len(game_state.bullets)):
+                shooter = self.random.choice(enemies)
+                game_state.bullets.append(game_state.bullet_pool.acquire(
+                    game_state, shooter, self.random.choice(directions)))
+        missing = self.particles - len(game_state.particles)
+        if missing > 0:
+            centers = [self.random.choice(game_state.units).position for _ in range(min(missing, 64))]
+            counts = [missing // len(centers) + (index < missing % len(centers)) for index in range(len(centers))]
+            game_state.particles.emit_many(centers, counts, 1.0)
+
+    def to_dict(self):
+        return {'world_size': list(self.world_size), 'enemies': self.enemies, 'bullets': self.bullets,
+                'particles': self.particles, 'ticks': self.ticks}
@@ -0,0 +1,6 @@
+from .Scenario import Scenario
+from .OffscreenView import OffscreenView
+from .AllocationProfiler import AllocationProfiler
+from .BenchmarkRunner import BenchmarkRunner
+
+__all__ = ['Scenario', 'OffscreenView', 'AllocationProfiler', 'BenchmarkRunner']
@@ -0,0 +1,81 @@
+# python -m benchmarks
+import argparse
+import json
+import os
+import sys
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from .Scenario import Scenario
+from .BenchmarkRunner import BenchmarkRunner
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+def report(name, result):
+    tick, frame = result['tick_ms'], result['frame_ms']
+    print(f"{name:<14} {result['ticks_per_second']:>9.1f} {tick['p50']:>9.3f} {tick['p99']:>9.3f} "
+          f"{frame['p50']:>9.3f} {frame['p99']:>9.3f} {result['peak_kib']:>10.1f}")
+
+def report_subsystems(results):
+    for name, result in results.items():
+        print(f"\n{name}")
+        for subsystem, timing in sorted(result['subsystems'].items(), key=lambda item: -item[1]['mean_ms']):
+            print(f"  {subsystem:<40} {timing['mean_ms']:>9.3f} ms {timing['peak_kib']:>10.1f} KiB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the simulation and render benchmarks")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO", help="scenario names to run (default: all)")
+    parser.add_argument("--ticks", type=int, help="override the measured ticks per scenario")
+    parser.add_argument("--no-render", action="store_true", help="time the simulation only")
+    parser.add_argument("--governor", action="store_true", help="let the quality governor scale effects to the frame budget")
+    parser.add_argument("--subsystems", action="store_true", help="also print the per-command and per-layer split")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", default=BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with these results")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a scenario counts as regressed (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    scenarios = Scenario.suite()
+    if args.scenarios:
+        names = {scenario.name for scenario in scenarios}
+        unknown = [name for name in args.scenarios if name not in names]
+        if unknown:
+            parser.error(f"unknown scenarios: {', '.join(unknown)} (choose from {', '.join(sorted(names))})")
+        scenarios = [scenario for scenario in scenarios if scenario.name in args.scenarios]
+    if args.ticks:
+        for scenario in scenarios:
+            scenario.ticks = args.ticks
+
+    pygame.init()
+    print(f"{'scenario':<14} {'ticks/s':>9} {'tick p50':>9} {'tick p99':>9} "
+          f"{'frame p50':>9} {'frame p99':>9} {'peak KiB':>10}")
+    results = BenchmarkRunner(render=not args.no_render, adaptive=args.governor).run_all(scenarios, report)
+    if args.subsystems:
+        report_subsystems(results)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(args.baseline, 'w') as file:
+            json.dump(baseline, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    with open(args.baseline) as file:
+        regressions = BenchmarkRunner.compare(results, json.load(file), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}")
+
+if __name__ == "__main__":
+    main()
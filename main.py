@@ -1,11 +1,186 @@
 # main.py
+import time
+STARTED = time.perf_counter()
+import argparse
+import asyncio
+import os
 import pygame
 from src.ui.UserInterface import UserInterface
+from src.simulation.Simulation import Simulation
+from src.state.GameState import GameState
+from src.state.TileMap import TileMap
+from src.profiling.FrameProfiler import FrameProfiler
+from src.replay.InputRecorder import InputRecorder
+from src.replay.ReplayPlayer import ReplayPlayer
+from src.net.GameServer import GameServer
+from src.net.GameClient import GameClient
+from src.simulation.ScriptedInput import ScriptedInput
+from src.profiling.StartupProfiler import StartupProfiler
+from src.assets.AssetManager import AssetManager
+from src.ai.PathService import PathService
+IMPORTED = time.perf_counter()
+
+def report_profile(profiler, trace_path):
+    print(profiler.summary())
+    if trace_path:
+        profiler.export_chrome_trace(trace_path)
+        print(f"Trace written to {trace_path}")
+
+def run_headless(simulation, ticks):
+    start = time.perf_counter()
+    simulation.run(ticks)
+    elapsed = time.perf_counter() - start
+    print(f"{ticks} ticks in {elapsed:.3f}s ({ticks / elapsed:.0f} ticks/s)")
+
+def run_replay(path, profiler=None):
+    replay = ReplayPlayer.load(path)
+    simulation = replay.create_simulation()
+    simulation.profiler = profiler
+    replay.run(simulation)
+    print(f"Replayed {replay.ticks} ticks in {replay.elapsed:.3f}s, "
+          f"{replay.checkpoints} checkpoints, {len(replay.mismatches)} mismatches")
+    for epoch, expected, actual in replay.mismatches[:10]:
+        print(f"  epoch {epoch}: expected {expected:08x}, got {actual:08x}")
+    return not replay.mismatches
+
+def parse_address(address):
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+async def serve(game_state, address, tick_rate, ticks):
+    server = GameServer(game_state, tick_rate=tick_rate)
+    host, port = parse_address(address)
+    await server.start(host, port)
+    print(f"Serving on {host}:{server.port} at {tick_rate} ticks/s")
+    try:
+        await server.run(ticks)
+    finally:
+        await server.close()
+
+async def run_bots(address, count, ticks):
+    host, port = parse_address(address)
+    bots = [GameClient() for _ in range(count)]
+    for bot in bots:
+        await bot.connect(host, port)
+    scripts = [ScriptedInput([((1, 0), index % 3 == 0)] * (10 + index) + [((0, 1), True)] * 15 +
+                             [((-1, 0), False)] * 10 + [((0, -1), True)] * 15, loop=True)
+               for index in range(count)]
+    try:
+        await asyncio.gather(*(bot.run(script, ticks) for bot, script in zip(bots, scripts)))
+    finally:
+        for bot in bots:
+            await bot.close()
+    received = sum(bot.bytes_received for bot in bots)
+    states = sum(bot.states_received for bot in bots)
+    print(f"{count} bots received {states} states, {received / max(states, 1):.0f} bytes each on average")
 
 def main():
-    ui = UserInterface()
-    ui.run()
-    pygame.quit()
+    parser = argparse.ArgumentParser(description="2D Retro RPG")
+    parser.add_argument("--headless", action="store_true", help="run the simulation without a window")
+    parser.add_argument("--ticks", type=int, default=3600, help="number of ticks to simulate in headless mode")
+    parser.add_argument("--full-redraw", action="store_true", help="redraw and flip the whole window every frame")
+    parser.add_argument("--world-size", type=int, nargs=2, default=(16, 16), metavar=("WIDTH", "HEIGHT"),
+                        help="world size in tiles; larger worlds scroll and stream map chunks")
+    parser.add_argument("--map", metavar="PATH", help="load the world from a binary map file instead of generating it")
+    parser.add_argument("--save-map", metavar="PATH", help="write the generated world to a binary map file and exit")
+    parser.add_argument("--seed", type=int, help="seed for all game randomness")
+    parser.add_argument("--record", metavar="PATH", help="record per-tick inputs and state checksums to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="replay a recorded session headless and verify its checksums")
+    parser.add_argument("--profile", action="store_true", help="time commands and layers and print a summary on exit")
+    parser.add_argument("--trace", metavar="PATH", help="with --profile, also write a Chrome trace JSON file")
+    parser.add_argument("--serve", metavar="[HOST:]PORT", help="host a multiplayer game server instead of playing")
+    parser.add_argument("--tick-rate", type=int, default=60, help="simulation ticks per second")
+    parser.add_argument("--frame-rate", type=int, default=60, help="rendered frames per second")
+    parser.add_argument("--single-thread", action="store_true",
+                        help="tick the simulation once per rendered frame instead of on its own thread")
+    parser.add_argument("--path-workers", type=int, default=0, metavar="N",
+                        help="run enemy pathfinding on N worker processes instead of inline")
+    parser.add_argument("--asset-cache", metavar="DIR", default=".cache/assets",
+                        help="directory for decoded asset pixels; pass an empty string to disable")
+    parser.add_argument("--startup-report", action="store_true", help="print where cold-start time went on exit")
+    parser.add_argument("--connect", metavar="[HOST:]PORT", help="join a game server as a thin client")
+    parser.add_argument("--bots", type=int, metavar="N", help="with --connect, run N scripted bot clients for --ticks ticks")
+    args = parser.parse_args()
+    if args.serve and args.map:
+        # Clients rebuild the world from the seed and can't load the server's map
+        parser.error("--map cannot be used with --serve")
+    profiler = FrameProfiler() if args.profile else None
+    startup = StartupProfiler(STARTED)
+    startup.record('imports', STARTED, IMPORTED)
+    assets = AssetManager(args.asset_cache or None)
+    with startup.phase('map load'):
+        tile_map = TileMap.from_file(args.map) if args.map else None
+    map_path = os.path.abspath(args.map) if args.map else None
+
+    if args.save_map:
+        GameState(args.world_size, tile_map, args.seed).tile_map.save(args.save_map)
+        return
+
+    if args.serve:
+        game_state = GameState(args.world_size, tile_map, args.seed)
+        if args.path_workers:
+            game_state.path_service = PathService(game_state.tile_map, args.path_workers)
+        try:
+            asyncio.run(serve(game_state, args.serve, args.tick_rate, args.ticks if args.headless else None))
+        finally:
+            if game_state.path_service is not None:
+                game_state.path_service.close()
+        return
+
+    if args.connect and args.bots:
+        asyncio.run(run_bots(args.connect, args.bots, args.ticks))
+        return
+
+    if args.connect:
+        client = GameClient()
+        client.start_thread(*parse_address(args.connect))
+        UserInterface(dirty_rects=not args.full_redraw, client=client, frame_rate=args.frame_rate,
+                      assets=assets, startup=startup).run()
+        pygame.quit()
+        if args.startup_report:
+            print(startup.summary())
+        return
+
+    if args.replay:
+        succeeded = run_replay(args.replay, profiler)
+        if profiler is not None:
+            report_profile(profiler, args.trace)
+        raise SystemExit(0 if succeeded else 1)
+
+    if args.headless:
+        simulation = Simulation(GameState(args.world_size, tile_map, args.seed))
+    else:
+        ui = UserInterface(dirty_rects=not args.full_redraw, profiler=profiler,
+                           world_size=args.world_size, tile_map=tile_map, seed=args.seed,
+                           threaded=not args.single_thread, tick_rate=args.tick_rate, frame_rate=args.frame_rate,
+                           assets=assets, startup=startup)
+        simulation = ui.simulation
+    simulation.profiler = profiler
+    if args.record:
+        simulation.recorder = InputRecorder(simulation.game_state, map_path=map_path)
+        # Particles are checksummed, so effects stay at full quality for replays to match
+        simulation.game_state.quality.enabled = False
+    elif args.path_workers:
+        # Replays plan paths inline, so recordings do too
+        simulation.game_state.path_service = PathService(simulation.game_state.tile_map, args.path_workers)
+
+    try:
+        if args.headless:
+            run_headless(simulation, args.ticks)
+        else:
+            ui.run()
+            pygame.quit()
+    finally:
+        if simulation.game_state.path_service is not None:
+            simulation.game_state.path_service.close()
+
+    if args.record:
+        simulation.recorder.save(args.record)
+        print(f"Recorded {simulation.recorder.ticks} ticks to {args.record}")
+    if profiler is not None:
+        report_profile(profiler, args.trace)
+    if args.startup_report and not args.headless:
+        print(startup.summary())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,86 @@
+from collections import deque
+from math import inf
+from ..entities.Enemy import Enemy
+
+class AIScheduler:
+    """Distance-based level of detail for enemy updates.
+
+    Each enemy falls into the first tier whose radius (Chebyshev distance to
+    the player, in tiles) contains it and moves only every interval ticks,
+    covering the distance of the skipped ticks in one go. Enemies get
+    round-robin phase offsets so a tier's work is spread evenly over its
+    interval. Enemies off the flow field replan every path_update_delay times
+    their interval ticks. Replans are queued, and each tick runs them until
+    expansion_budget A* node expansions have been spent. Enemies keep their
+    old path while they wait. The budget counts work rather than time so
+    that replays stay deterministic. With a PathService on the GameState,
+    queued replans are handed to its workers instead, as many as it has
+    room for, and no budget applies.
+    """
+    TIERS = ((24, 1), (64, 4), (inf, 12))
+
+    def __init__(self, tiers=TIERS, expansion_budget=4000):
+        self.tiers = tiers
+        self.expansion_budget = expansion_budget
+        self.next_offset = 0
+        self.replan_queue = deque()
+        self.queued = set()
+        self.updates = 0
+        self.replans = 0
+        self.expansions = 0
+
+    def interval(self, enemy, target_pos):
+        distance = max(abs(enemy.position.x - target_pos.x), abs(enemy.position.y - target_pos.y))
+        for radius, interval in self.tiers:
+            if distance <= radius:
+                return interval
+        return self.tiers[-1][1]
+
+    def update(self, game_state, flow_field, target_pos):
+        epoch = game_state.epoch
+        max_interval = self.tiers[-1][1]
+        path_service = game_state.path_service
+        if path_service is not None:
+            path_service.collect(epoch)
+        for unit in game_state.units:
+            if not isinstance(unit, Enemy):
+                continue
+            if unit.ai_offset is None:
+                unit.ai_offset = self.next_offset
+                self.next_offset += 1
+            interval = self.interval(unit, target_pos)
+            if (epoch + unit.ai_offset) % interval:
+                continue
+            ticks = min(epoch - unit.last_ai_update, max_interval) if interval > 1 else 1
+            unit.last_ai_update = epoch
+            self.updates += 1
+            unit.follow_flow_field(flow_field, target_pos, max(ticks, 1), replan=False)
+            if (unit not in self.queued and unit.needs_path(unit.path_update_delay * interval) and
+                    flow_field.next_step(unit.position) is None):
+                self.queued.add(unit)
+                self.replan_queue.append(unit)
+        if path_service is not None:
+            self.request_replans(path_service, flow_field, target_pos, epoch)
+        else:
+            self.run_replans(flow_field, target_pos)
+
+    def request_replans(self, path_service, flow_field, target_pos, epoch):
+        while self.replan_queue and path_service.has_capacity():
+            enemy = self.replan_queue.popleft()
+            self.queued.discard(enemy)
+            if enemy.health == 0 or flow_field.next_step(enemy.position) is not None:
+                continue
+            path_service.request(enemy, target_pos, epoch)
+            self.replans += 1
+
+    def run_replans(self, flow_field, target_pos):
+        budget = self.expansion_budget
+        while budget > 0 and self.replan_queue:
+            enemy = self.replan_queue.popleft()
+            self.queued.discard(enemy)
+            if enemy.health == 0 or flow_field.next_step(enemy.position) is not None:
+                continue
+            enemy.replan(target_pos)
+            self.replans += 1
+            self.expansions += enemy.path_expansions
+            budget -= max(enemy.path_expansions, 1)
@@ -0,0 +1,103 @@
+import heapq
+from math import inf
+
+class FlowField:
+    """Shared distance field toward a single target cell.
+
+    The field covers the cells within radius of the target and is rebuilt
+    only when the target changes cell or the tile map changes. Every cell
+    stores the neighbour one step closer to the target, so following the
+    field costs a single lookup per unit per tick.
+    """
+    NEIGHBOURS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+    def __init__(self, tile_map, radius=24):
+        self.tile_map = tile_map
+        self.radius = radius
+        self.target_cell = None
+        self.map_version = -1
+        self.origin = (0, 0)
+        self.width = 0
+        self.height = 0
+        self.stride = 0
+        self.distances = []
+        self.next_cells = []
+        self.rebuild_count = 0
+
+    def update(self, target_position):
+        target_cell = (int(target_position.x), int(target_position.y))
+        if target_cell == self.target_cell and self.map_version == self.tile_map.version:
+            return
+        self.rebuild(target_cell)
+
+    def rebuild(self, target_cell):
+        self.target_cell = target_cell
+        self.map_version = self.tile_map.version
+        self.rebuild_count += 1
+
+        x0 = max(0, target_cell[0] - self.radius)
+        y0 = max(0, target_cell[1] - self.radius)
+        x1 = min(self.tile_map.width, target_cell[0] + self.radius + 1)
+        y1 = min(self.tile_map.height, target_cell[1] + self.radius + 1)
+        width = max(0, x1 - x0)
+        height = max(0, y1 - y0)
+        self.origin = (x0, y0)
+        self.width = width
+        self.height = height
+
+        # Work on a flat grid padded with an impassable border so neighbour
+        # lookups need no bounds checks
+        stride = width + 2
+        costs = [0.0] * (stride * (height + 2))
+        for row, values in enumerate(self.tile_map.cost_region(x0, y0, x1, y1).tolist()):
+            start = (row + 1) * stride + 1
+            costs[start:start + width] = values
+        distances = [inf] * len(costs)
+        next_cells = [None] * len(costs)
+        self.stride = stride
+        self.distances = distances
+        self.next_cells = next_cells
+
+        tx, ty = target_cell[0] - x0, target_cell[1] - y0
+        if not (0 <= tx < width and 0 <= ty < height):
+            return
+
+        # Dijkstra outward from the target; a cell's next step is the cell it
+        # was reached from, i.e. its neighbour on the way back to the target.
+        target_index = (ty + 1) * stride + tx + 1
+        distances[target_index] = 0
+        next_cells[target_index] = target_cell
+        offsets = (1, -1, stride, -stride)
+        frontier = [(0, target_index)]
+        heappop, heappush = heapq.heappop, heapq.heappush
+        while frontier:
+            distance, index = heappop(frontier)
+            if distance > distances[index]:
+                continue
+            cell = ((index % stride) - 1 + x0, (index // stride) - 1 + y0)
+            for offset in offsets:
+                neighbour = index + offset
+                cost = costs[neighbour]
+                if cost <= 0:
+                    continue
+                new_distance = distance + cost
+                if new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    next_cells[neighbour] = cell
+                    heappush(frontier, (new_distance, neighbour))
+
+    def cell_index(self, position):
+        x = int(position.x) - self.origin[0]
+        y = int(position.y) - self.origin[1]
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return (y + 1) * self.stride + x + 1
+
+    def next_step(self, position):
+        """Returns the cell to head for from position, or None off the field."""
+        index = self.cell_index(position)
+        return None if index is None else self.next_cells[index]
+
+    def distance(self, position):
+        index = self.cell_index(position)
+        return inf if index is None else self.distances[index]
@@ -0,0 +1,132 @@
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from time import perf_counter
+from ..entities.Enemy import Enemy, find_path
+
+# The tile map each worker process searches, set once by init_worker
+worker_tile_map = None
+
+def init_worker(tile_map):
+    global worker_tile_map
+    worker_tile_map = tile_map
+
+def plan_path(start, goal, max_expansions):
+    return find_path(worker_tile_map, start, goal, max_expansions)
+
+class PathService:
+    """Runs enemy A* searches on a pool of worker processes.
+
+    request() submits a search from the enemy's cell to the goal cell and
+    returns immediately; the enemy keeps following its current path. The
+    result is applied by collect() exactly latency ticks later, waiting for
+    the worker if it isn't done yet, so runs stay deterministic however
+    long the searches take. A newer request from the same enemy supersedes
+    a pending one. Finished paths are cached by (start, goal, map version)
+    in an LRU; a cache hit skips the search but is still applied after
+    latency ticks, so the cache never changes what happens. Workers get a
+    copy of the tile map; when its version changes, the pool is restarted.
+    """
+    def __init__(self, tile_map, workers=None, latency=8, cache_size=4096, max_pending=None,
+                 max_expansions=Enemy.max_path_expansions):
+        self.tile_map = tile_map
+        self.workers = workers or max(1, multiprocessing.cpu_count() - 1)
+        self.latency = latency
+        self.cache_size = cache_size
+        # Requests beyond this stay in the AIScheduler's queue
+        self.max_pending = max_pending or 8 * self.workers
+        self.max_expansions = max_expansions
+        self.cache = OrderedDict()
+        # enemy -> (start, goal, map version, due epoch, future), in submission order
+        self.pending = {}
+        self.executor = None
+        self.executor_version = None
+        self.requests = 0
+        self.cache_hits = 0
+        self.superseded = 0
+        self.completed = 0
+        self.expansions = 0
+        self.wait_seconds = 0.0
+        self.start_workers()
+
+    def start_workers(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context(),
+                                            initializer=init_worker, initargs=(self.tile_map,))
+        self.executor_version = self.tile_map.version
+
+    def has_capacity(self):
+        return len(self.pending) < self.max_pending
+
+    def request(self, enemy, goal, epoch):
+        start = (int(enemy.position.x), int(enemy.position.y))
+        self.submit(enemy, start, (int(goal.x), int(goal.y)), epoch + self.latency)
+        enemy.last_path_update = epoch
+
+    def submit(self, enemy, start, goal, due):
+        self.requests += 1
+        previous = self.pending.pop(enemy, None)
+        if previous is not None:
+            previous[4].cancel()
+            self.superseded += 1
+        version = self.tile_map.version
+        if self.executor_version != version:
+            # Paths planned on the old map would never be applied anyway
+            self.drop_pending()
+            self.start_workers()
+        cached = self.cache.get((start, goal, version))
+        if cached is not None:
+            self.cache.move_to_end((start, goal, version))
+            self.cache_hits += 1
+            future = Future()
+            future.set_result(cached)
+        else:
+            future = self.executor.submit(plan_path, start, goal, self.max_expansions)
+        self.pending[enemy] = (start, goal, version, due, future)
+
+    def collect(self, epoch):
+        """Applies every request due by epoch, in submission order."""
+        while self.pending:
+            enemy, (start, goal, version, due, future) = next(iter(self.pending.items()))
+            if due > epoch:
+                break
+            del self.pending[enemy]
+            if not future.done():
+                start_wait = perf_counter()
+                path = future.result()
+                self.wait_seconds += perf_counter() - start_wait
+            else:
+                path = future.result()
+            self.completed += 1
+            self.expansions += path[1]
+            self.cache[(start, goal, version)] = path
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            if enemy.health != 0 and version == self.tile_map.version:
+                self.apply(enemy, path)
+
+    def apply(self, enemy, result):
+        path, expansions = result
+        # The enemy kept moving while it waited; skip the cells it has passed
+        cell = (int(enemy.position.x), int(enemy.position.y))
+        if cell in path:
+            path = path[:path.index(cell)]
+        enemy.path = list(path)
+        enemy.path_expansions = expansions
+
+    def pending_requests(self):
+        """Yields (enemy, start, goal, due epoch) for every request not yet applied."""
+        for enemy, (start, goal, _, due, _) in self.pending.items():
+            yield enemy, start, goal, due
+
+    def drop_pending(self):
+        for request in self.pending.values():
+            request[4].cancel()
+        self.pending.clear()
+
+    def close(self):
+        self.drop_pending()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,5 @@
+from .FlowField import FlowField
+from .AIScheduler import AIScheduler
+from .PathService import PathService
+
+__all__ = ['FlowField', 'AIScheduler', 'PathService']
@@ -0,0 +1,116 @@
+import hashlib
+import io
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+import pygame
+
+class AssetManager:
+    """Loads each image once and hands out the same display-format Surface.
+
+    Decoding goes through an optional on-disk cache of raw pixels keyed by
+    the SHA-1 of the file, so a cold start only hashes and copies bytes
+    instead of inflating PNGs. preload() decodes non-critical assets on a
+    background thread; image() picks up the result, or decodes on the spot
+    if nothing was preloaded. Conversion to the display format happens on
+    the calling thread, once a display mode is set.
+    """
+    CACHE_HEADER = struct.Struct("<4sBII")
+    CACHE_MAGIC = b"RPGA"
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.images = {}
+        self.pending = {}
+        self.executor = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Seconds spent decoding (on any thread) and blocked in image() on this one
+        self.decode_seconds = 0.0
+        self.load_seconds = 0.0
+
+    def preload(self, paths):
+        """Starts decoding paths on a background thread."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='assets')
+        for path in paths:
+            if path not in self.images and path not in self.pending:
+                self.pending[path] = self.executor.submit(self.decode, path)
+
+    def image(self, path):
+        surface = self.images.get(path)
+        if surface is not None:
+            return surface
+        start = perf_counter()
+        future = self.pending.pop(path, None)
+        pixel_format, size, pixels = future.result() if future is not None else self.decode(path)
+        surface = pygame.image.frombytes(pixels, size, pixel_format)
+        # Conversion needs a display mode; headless tools keep the decoded format
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if pixel_format == 'RGBA' else surface.convert()
+        self.images[path] = surface
+        self.load_seconds += perf_counter() - start
+        return surface
+
+    def decode(self, path):
+        """Returns (format, size, pixels) for path, from the raw cache when possible."""
+        start = perf_counter()
+        with open(path, 'rb') as file:
+            data = file.read()
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = os.path.join(self.cache_dir, hashlib.sha1(data).hexdigest() + '.raw')
+            decoded = self.read_cache(cache_path)
+            if decoded is not None:
+                self.cache_hits += 1
+                self.decode_seconds += perf_counter() - start
+                return decoded
+            self.cache_misses += 1
+        surface = pygame.image.load(io.BytesIO(data), os.path.basename(path))
+        pixel_format = 'RGBA' if surface.get_flags() & pygame.SRCALPHA else 'RGB'
+        decoded = (pixel_format, surface.get_size(), pygame.image.tobytes(surface, pixel_format))
+        if cache_path is not None:
+            self.write_cache(cache_path, decoded)
+        self.decode_seconds += perf_counter() - start
+        return decoded
+
+    def read_cache(self, cache_path):
+        try:
+            with open(cache_path, 'rb') as file:
+                header = file.read(self.CACHE_HEADER.size)
+                pixels = file.read()
+        except OSError:
+            return None
+        if len(header) != self.CACHE_HEADER.size:
+            return None
+        magic, version, width, height = self.CACHE_HEADER.unpack(header)
+        if magic != self.CACHE_MAGIC or version != self.CACHE_VERSION:
+            return None
+        # Entries are named by content, so only the channel count needs recovering
+        channels = len(pixels) // max(width * height, 1)
+        if channels not in (3, 4) or len(pixels) != width * height * channels:
+            return None
+        return ('RGBA' if channels == 4 else 'RGB'), (width, height), pixels
+
+    def write_cache(self, cache_path, decoded):
+        _, (width, height), pixels = decoded
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temporary_path, 'wb') as file:
+                file.write(self.CACHE_HEADER.pack(self.CACHE_MAGIC, self.CACHE_VERSION, width, height))
+                file.write(pixels)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            # A read-only or full cache directory only costs the speed-up
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -0,0 +1,3 @@
+from .AssetManager import AssetManager
+
+__all__ = ['AssetManager']
@@ -1,9 +1,14 @@
 from .Command import Command
 
 class DeleteDestroyedUnitsCommand(Command):
-    def __init__(self, item_list):
+    def __init__(self, item_list, on_delete=None):
         self.item_list = item_list
+        self.on_delete = on_delete
     
     def run(self):
         new_list = [item for item in self.item_list if item.health != 0]
-        self.item_list[:] = new_list
\ No newline at end of file
+        if self.on_delete is not None and len(new_list) != len(self.item_list):
+            for item in self.item_list:
+                if item.health == 0:
+                    self.on_delete(item)
+        self.item_list[:] = new_list
@@ -0,0 +1,207 @@
+import numpy as np
+from pygame import Vector2
+from .Command import Command
+
+class MoveBulletsCommand(Command):
+    """Advances every live bullet in one batch.
+
+    Bullet state is gathered into arrays, moved and culled against the world
+    bounds and each bullet's range together, and tested against units with a
+    swept segment-versus-circle check so fast bullets cannot tunnel through
+    a unit between two ticks.
+    """
+    collision_radius = 1.0
+    impact_particles = 25
+    impact_spread = 0.3
+    trail_interval = 3
+    trail_spread = 0.15
+    # Scaled down with the rest of the effects by the quality governor
+    particle_lifetime = (100, 300)
+    # Below this many bullets the NumPy broadphase costs more than it saves
+    vectorize_threshold = 32
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+
+    def run(self):
+        bullets = [bullet for bullet in self.game_state.bullets if bullet.health != 0]
+        if not bullets:
+            return
+
+        state = np.array([(bullet.position.x, bullet.position.y,
+                           bullet.direction.x, bullet.direction.y,
+                           bullet.start_position.x, bullet.start_position.y,
+                           bullet.velocity, bullet.range) for bullet in bullets], dtype=np.float64)
+        positions = state[:, 0:2]
+        steps = state[:, 2:4] * state[:, 6:7]
+        new_positions = positions + steps
+
+        world_size = self.game_state.world_size
+        inside = ((new_positions[:, 0] >= 0) & (new_positions[:, 0] < world_size.x) &
+                  (new_positions[:, 1] >= 0) & (new_positions[:, 1] < world_size.y))
+        travelled = np.hypot(*(new_positions - state[:, 4:6]).T)
+        expired = ~inside | (travelled >= state[:, 7])
+
+        if len(bullets) < self.vectorize_threshold:
+            hits = self.find_hits_scalar(bullets, positions, steps, expired)
+        else:
+            hits = self.find_hits(bullets, positions, steps, expired)
+
+        impacts = []
+        survivors = []
+        for index, bullet in enumerate(bullets):
+            if expired[index]:
+                impacts.append(index)
+                bullet.health = 0
+                continue
+            unit = hits.get(index)
+            if unit is not None and unit.health != 0:
+                impacts.append(index)
+                self.handle_collision(bullet, unit)
+                continue
+            bullet.position = Vector2(new_positions[index, 0], new_positions[index, 1])
+            bullet.update()
+            survivors.append(index)
+
+        particles = self.game_state.particles
+        quality = self.game_state.quality
+        lifetime_range = (quality.scale(self.particle_lifetime[0]), quality.scale(self.particle_lifetime[1]))
+        if impacts:
+            particles.emit_many(positions[impacts], quality.scale(self.impact_particles),
+                                self.impact_spread, lifetime_range)
+        if survivors and self.game_state.epoch % self.trail_interval == 0:
+            counts = particles.rng.integers(1, 4, size=len(survivors))
+            if quality.level < 1.0:
+                counts = np.floor(counts * quality.level + 0.5).astype(np.int64)
+            particles.emit_many(new_positions[survivors], counts, self.trail_spread, lifetime_range)
+
+    def find_hits(self, bullets, positions, steps, expired):
+        """Maps bullet index to the first unit its path this tick enters.
+
+        Broadphase joins the grid cells each bullet's swept box covers with
+        the cells units occupy, using the spatial index's cell size, entirely
+        in NumPy; the narrow phase is the segment-versus-circle test.
+        """
+        units = [unit for unit in self.game_state.spatial_index.unit_cells if unit.health != 0]
+        if not units:
+            return {}
+        radius = self.collision_radius
+        cell_size = self.game_state.spatial_index.cell_size
+
+        unit_positions = np.array([(unit.position.x, unit.position.y) for unit in units])
+        unit_keys = self.cell_keys(*np.floor(unit_positions / cell_size).astype(np.int64).T)
+        unit_order = np.argsort(unit_keys, kind='stable')
+        sorted_keys = unit_keys[unit_order]
+
+        ends = positions + steps
+        low = np.floor((np.minimum(positions, ends) - radius) / cell_size).astype(np.int64)
+        high = np.floor((np.maximum(positions, ends) + radius) / cell_size).astype(np.int64)
+        spans = high - low + 1
+        active = np.flatnonzero(~expired)
+
+        # Swept boxes are at most 3x3 cells unless a bullet moves more than
+        # a cell per tick; those few are expanded with an explicit loop
+        short = active[(spans[active] <= 3).all(axis=1)]
+        long = active[(spans[active] > 3).any(axis=1)]
+        pair_bullets = [np.repeat(short, 9)]
+        offsets = np.tile(np.array([(dx, dy) for dy in range(3) for dx in range(3)]), (len(short), 1))
+        cells = np.repeat(low[short], 9, axis=0) + offsets
+        within = (offsets < np.repeat(spans[short], 9, axis=0)).all(axis=1)
+        pair_bullets[0] = pair_bullets[0][within]
+        pair_cells = [cells[within]]
+        for index in long:
+            xs, ys = np.meshgrid(np.arange(low[index, 0], high[index, 0] + 1),
+                                 np.arange(low[index, 1], high[index, 1] + 1))
+            pair_cells.append(np.column_stack((xs.ravel(), ys.ravel())))
+            pair_bullets.append(np.full(xs.size, index))
+        pair_bullets = np.concatenate(pair_bullets)
+        pair_cells = np.concatenate(pair_cells)
+        if len(pair_bullets) == 0:
+            return {}
+
+        keys = self.cell_keys(pair_cells[:, 0], pair_cells[:, 1])
+        first = np.searchsorted(sorted_keys, keys, side='left')
+        counts = np.searchsorted(sorted_keys, keys, side='right') - first
+        total = counts.sum()
+        if total == 0:
+            return {}
+        pair_bullets = np.repeat(pair_bullets, counts)
+        group_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        pair_units = unit_order[np.repeat(first, counts) + np.arange(total) - group_starts]
+
+        unit_indices = {unit: index for index, unit in enumerate(units)}
+        owners = np.array([unit_indices.get(bullet.unit, -1) for bullet in bullets])
+        not_owner = owners[pair_bullets] != pair_units
+        pair_bullets = pair_bullets[not_owner]
+        pair_units = pair_units[not_owner]
+
+        times = self.segment_circle_entry(positions[pair_bullets], steps[pair_bullets],
+                                          unit_positions[pair_units], radius)
+        hit = ~np.isnan(times)
+        pair_bullets, pair_units, times = pair_bullets[hit], pair_units[hit], times[hit]
+        order = np.lexsort((times, pair_bullets))
+        hit_bullets, first_hits = np.unique(pair_bullets[order], return_index=True)
+        return {int(index): units[pair_units[order][hit]]
+                for index, hit in zip(hit_bullets, first_hits)}
+
+    def find_hits_scalar(self, bullets, positions, steps, expired):
+        """Same result as find_hits, with the broadphase querying the spatial index bullet by bullet."""
+        radius = self.collision_radius
+        spatial_index = self.game_state.spatial_index
+        pair_bullets = []
+        pair_units = []
+        for index, bullet in enumerate(bullets):
+            if expired[index]:
+                continue
+            x0, y0 = positions[index]
+            dx, dy = steps[index]
+            x1, y1 = x0 + dx, y0 + dy
+            for unit in spatial_index.candidates(min(x0, x1) - radius, min(y0, y1) - radius,
+                                                 max(x0, x1) + radius, max(y0, y1) + radius):
+                if unit is bullet.unit or unit.health == 0:
+                    continue
+                pair_bullets.append(index)
+                pair_units.append(unit)
+        if not pair_units:
+            return {}
+
+        centers = np.array([(unit.position.x, unit.position.y) for unit in pair_units])
+        times = self.segment_circle_entry(positions[pair_bullets], steps[pair_bullets], centers, radius)
+        hits = {}
+        best_times = {}
+        for index, unit, time in zip(pair_bullets, pair_units, times.tolist()):
+            if time == time and time < best_times.get(index, 2.0):
+                best_times[index] = time
+                hits[index] = unit
+        return hits
+
+    @staticmethod
+    def cell_keys(cell_x, cell_y):
+        return (cell_x + (1 << 24)) * (1 << 26) + (cell_y + (1 << 24))
+
+    @staticmethod
+    def segment_circle_entry(starts, steps, centers, radius):
+        """Returns, per row, the segment parameter t in [0, 1] at which
+        starts + t * steps first comes within radius of centers, or NaN."""
+        offsets = starts - centers
+        a = np.einsum('ij,ij->i', steps, steps)
+        b = 2 * np.einsum('ij,ij->i', offsets, steps)
+        c = np.einsum('ij,ij->i', offsets, offsets) - radius * radius
+        times = np.full(len(starts), np.nan)
+
+        inside = c < 0
+        times[inside] = 0.0
+
+        discriminant = b * b - 4 * a * c
+        crossing = ~inside & (a > 0) & (discriminant >= 0)
+        entry = (-b[crossing] - np.sqrt(discriminant[crossing])) / (2 * a[crossing])
+        entry[(entry < 0) | (entry > 1)] = np.nan
+        times[crossing] = entry
+        return times
+
+    def handle_collision(self, bullet, unit):
+        unit.health -= bullet.damage
+        unit.last_hit_epoch = self.game_state.epoch
+        knockback_direction = bullet.direction.normalize()
+        self.game_state.move_unit(unit, unit.position + knockback_direction)
+        bullet.health = 0
@@ -1,12 +1,11 @@
 from .Command import Command
-from ..entities.Enemy import Enemy
 
 class MoveEnemiesCommand(Command):
     def __init__(self, game_state):
         self.game_state = game_state
     
     def run(self):
-        for unit in self.game_state.units:
-            if isinstance(unit, Enemy):
-                unit.update_path(self.game_state.player_unit.position)
-                unit.move_along_path()
\ No newline at end of file
+        target_pos = self.game_state.player_unit.position
+        flow_field = self.game_state.flow_field
+        flow_field.update(target_pos)
+        self.game_state.ai_scheduler.update(self.game_state, flow_field, target_pos)
@@ -10,10 +10,10 @@ class MoveUnitCommand(Command):
     def run(self):
         if self.direction.length() > 0:
             new_position = self.unit.position + self.direction.normalize() * self.unit.velocity
-            new_position.x = max(0, min(new_position.x, self.game_state.world_size.x - 1))
-            new_position.y = max(0, min(new_position.y, self.game_state.world_size.y - 1))
-            self.unit.position = new_position
+            self.game_state.move_unit(self.unit, new_position)
             self.unit.orientation = self.direction.normalize()
+            self.unit.is_moving = True
             self.game_state.notify_unit_move(self.unit, self.direction)
         else:
-            self.game_state.notify_unit_stop(self.unit)
\ No newline at end of file
+            self.unit.is_moving = False
+            self.game_state.notify_unit_stop(self.unit)
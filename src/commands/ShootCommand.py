@@ -1,5 +1,4 @@
 from .Command import Command
-from ..entities.Fireball import Fireball
 
 class ShootCommand(Command):
     def __init__(self, game_state, unit, direction):
@@ -13,5 +12,5 @@ class ShootCommand(Command):
             return
         
         self.unit.last_bullet_epoch = self.game_state.epoch
-        bullet = Fireball(self.game_state, self.unit, self.unit.orientation)
+        bullet = self.game_state.bullet_pool.acquire(self.game_state, self.unit, self.unit.orientation)
         self.game_state.bullets.append(bullet)
\ No newline at end of file
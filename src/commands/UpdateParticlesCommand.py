@@ -5,6 +5,4 @@ class UpdateParticlesCommand(Command):
         self.particles = particles
     
     def run(self):
-        for particle in self.particles:
-            if particle.lifetime > 0:
-                particle.update()
\ No newline at end of file
+        self.particles.update()
@@ -1,7 +1,7 @@
 from .Command import Command
 from .MoveUnitCommand import MoveUnitCommand
 from .ShootCommand import ShootCommand
-from .MoveBulletCommand import MoveBulletCommand
+from .MoveBulletsCommand import MoveBulletsCommand
 from .MoveEnemiesCommand import MoveEnemiesCommand
 from .EnemyDamageCommand import EnemyDamageCommand
 from .UpdateParticlesCommand import UpdateParticlesCommand
@@ -11,7 +11,7 @@ __all__ = [
     'Command',
     'MoveUnitCommand',
     'ShootCommand',
-    'MoveBulletCommand',
+    'MoveBulletsCommand',
     'MoveEnemiesCommand',
     'EnemyDamageCommand',
     'UpdateParticlesCommand',
@@ -3,64 +3,127 @@ import heapq
 from .Player import Player
 
 class Enemy(Player):
+    __slots__ = ('path', 'last_path_update', 'path_expansions', 'ai_offset', 'last_ai_update')
+    path_update_delay = 30
+    max_path_expansions = 20000
+
     def __init__(self, game_state, position):
         super().__init__(game_state, position, Vector2(2, 2))
         self.velocity = 0.03
         self.path = []
-        self.path_update_delay = 30
         self.last_path_update = 0
+        self.path_expansions = 0
+        # Set by the AIScheduler: phase within the update interval, and the
+        # last epoch whose movement has been applied
+        self.ai_offset = None
+        self.last_ai_update = game_state.epoch - 1
     
+    def follow_flow_field(self, flow_field, target_pos, ticks=1, replan=True):
+        """Covers ticks worth of distance along the field, or along the private A* path off it.
+
+        With replan=False a stale path is kept; the AIScheduler replans it later.
+        """
+        remaining = self.velocity * ticks
+        while remaining > 1e-9:
+            waypoint = flow_field.next_step(self.position)
+            if waypoint is None:
+                # Off the shared field: fall back to a private A* path
+                if replan:
+                    self.update_path(target_pos)
+                    replan = False
+                if not self.path:
+                    return
+                waypoint = self.path[-1]
+            else:
+                self.path.clear()
+            distance = self.position.distance_to(waypoint)
+            if distance == 0:
+                return
+            if not self.move_towards(waypoint, remaining):
+                return
+            if self.path and self.path[-1] == waypoint:
+                self.path.pop()
+            remaining -= distance
+
+    def needs_path(self, delay=None):
+        if delay is None:
+            delay = self.path_update_delay
+        return self.game_state.epoch - self.last_path_update >= delay
+
     def update_path(self, target_pos):
         if self.game_state.epoch - self.last_path_update < self.path_update_delay:
             return
+        self.replan(target_pos)
+
+    def replan(self, target_pos):
         self.last_path_update = self.game_state.epoch
         self.path = self.find_path(self.position, target_pos)
     
-    # A* pathfinding implementation
     def find_path(self, start, end):
-        def heuristic(a, b): return abs(a[0] - b[0]) + abs(a[1] - b[1])
-        
-        start_pos = (int(start.x), int(start.y))
-        end_pos = (int(end.x), int(end.y))
-        
-        frontier = [(0, start_pos)]
-        came_from = {start_pos: None}
-        cost_so_far = {start_pos: 0}
-        
-        while frontier:
-            _, current = heapq.heappop(frontier)
-            if current == end_pos: break
-            
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                next_pos = (current[0] + dx, current[1] + dy)
-                if (0 <= next_pos[0] < self.game_state.world_size.x and 
-                    0 <= next_pos[1] < self.game_state.world_size.y):
-                    new_cost = cost_so_far[current] + 1
-                    if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
-                        cost_so_far[next_pos] = new_cost
-                        priority = new_cost + heuristic(end_pos, next_pos)
-                        heapq.heappush(frontier, (priority, next_pos))
-                        came_from[next_pos] = current
-        
-        path = []
-        current = end_pos
-        while current != start_pos:
-            if current not in came_from: return []
-            path.append(Vector2(current[0], current[1]))
-            current = came_from[current]
-        path.reverse()
+        path, self.path_expansions = find_path(self.game_state.tile_map, (int(start.x), int(start.y)),
+                                               (int(end.x), int(end.y)), self.max_path_expansions)
         return path
     
     def move_along_path(self):
         if not self.path: return
-        target = self.path[0]
-        direction = target - self.position
+        if self.move_towards(self.path[-1]):
+            self.path.pop()
+
+    def move_towards(self, cell, step=None):
+        """Steps toward cell; returns True once the cell has been reached."""
+        if step is None:
+            step = self.velocity
+        direction = Vector2(cell[0] - self.position.x, cell[1] - self.position.y)
         
-        if direction.length() < self.velocity:
-            self.position = target
-            self.path.pop(0)
-        else:
-            self.is_moving = True
-            normalized_dir = direction.normalize()
-            self.position += normalized_dir * self.velocity
-            self.orientation = normalized_dir
\ No newline at end of file
+        if direction.length() < step:
+            self.game_state.move_unit(self, Vector2(cell))
+            return True
+        self.is_moving = True
+        normalized_dir = direction.normalize()
+        self.game_state.move_unit(self, self.position + normalized_dir * step)
+        self.orientation = normalized_dir
+        return False
+
+
+# A* pathfinding implementation; the path is returned goal-first so that
+# move_along_path can consume it with pop(). Ties on f are broken toward
+# the goal so open ground doesn't flood the whole start-goal rectangle,
+# and the search gives up after max_expansions cells on huge maps. A plain
+# function of the map and two cells so PathService workers can run it too.
+def find_path(tile_map, start_pos, end_pos, max_expansions):
+    """Returns (path, expanded cell count); the path is empty when there is none."""
+    def heuristic(a, b): return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    if not tile_map.is_passable(*end_pos):
+        return [], 0
+
+    frontier = [(0, 0, start_pos)]
+    came_from = {start_pos: None}
+    cost_so_far = {start_pos: 0}
+    closed = set()
+
+    while frontier:
+        _, _, current = heapq.heappop(frontier)
+        if current == end_pos: break
+        if current in closed: continue
+        closed.add(current)
+        if len(closed) > max_expansions: return [], len(closed)
+
+        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            next_pos = (current[0] + dx, current[1] + dy)
+            if next_pos in closed or not tile_map.is_passable(*next_pos):
+                continue
+            new_cost = cost_so_far[current] + tile_map.cost(*next_pos)
+            if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
+                cost_so_far[next_pos] = new_cost
+                remaining = heuristic(end_pos, next_pos)
+                heapq.heappush(frontier, (new_cost + remaining, remaining, next_pos))
+                came_from[next_pos] = current
+
+    path = []
+    current = end_pos
+    while current != start_pos:
+        if current not in came_from: return [], len(closed)
+        path.append(current)
+        current = came_from[current]
+    return path, len(closed)
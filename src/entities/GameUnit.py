@@ -1,9 +1,11 @@
 from pygame import Vector2
 
 class GameUnit:
+    __slots__ = ('game_state', 'health', 'position', 'tile', 'last_hit_epoch')
+
     def __init__(self, game_state, position, tile):
         self.game_state = game_state
         self.health = 100
         self.position = position
         self.tile = tile
-        self.last_hit_epoch = 0
\ No newline at end of file
+        self.last_hit_epoch = 0
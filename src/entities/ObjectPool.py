@@ -0,0 +1,43 @@
+class ObjectPool:
+    """Free list of reusable objects.
+
+    acquire() hands out a released object after calling its reset() with the
+    same arguments the constructor takes, and only constructs a new one when
+    the free list is empty. created, reused and released count what happened
+    so allocation rates can be measured.
+    """
+    def __init__(self, factory, max_free=4096):
+        self.factory = factory
+        self.max_free = max_free
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args):
+        if self.free:
+            item = self.free.pop()
+            item.reset(*args)
+            self.reused += 1
+            return item
+        self.created += 1
+        return self.factory(*args)
+
+    def take(self):
+        """Pops a released object without resetting it, or returns None."""
+        if not self.free:
+            return None
+        self.reused += 1
+        return self.free.pop()
+
+    def release(self, item):
+        self.released += 1
+        if len(self.free) < self.max_free:
+            self.free.append(item)
+
+    def stats(self):
+        return {'created': self.created, 'reused': self.reused,
+                'released': self.released, 'free': len(self.free)}
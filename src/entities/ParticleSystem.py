@@ -0,0 +1,125 @@
+import numpy as np
+
+class ParticleSystem:
+    """Struct-of-arrays particle store.
+
+    Every live particle is a row in the position, lifetime and next_move_time
+    arrays. Rows [0, count) are live; update() ages and moves all of them in
+    one batch and compacts dead rows away, keeping emission order so the
+    oldest particles are always at the front. At most max_particles are
+    live; emitting past that evicts the oldest.
+    """
+    MOVES = np.array([[0.0, -0.1], [0.1, 0.0]], dtype=np.float32)
+    MOVE_INTERVAL = 12
+    MOVE_JITTER = 2
+
+    def __init__(self, game_state, capacity=1024, max_particles=8192):
+        self.game_state = game_state
+        self.rng = game_state.np_random
+        self.tile = (0, 0)
+        self.count = 0
+        self.max_particles = max_particles
+        # Number of times the arrays had to grow; steady state should be zero
+        self.reallocations = 0
+        # Particles dropped by the cap, oldest first, since creation
+        self.evicted = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetimes = np.zeros(capacity, dtype=np.int32)
+        self.next_move_times = np.zeros(capacity, dtype=np.int32)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def reserve(self, capacity):
+        if capacity <= len(self.lifetimes):
+            return
+        capacity = max(capacity, 2 * len(self.lifetimes))
+        self.reallocations += 1
+        for name in ('positions', 'lifetimes', 'next_move_times'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, positions, lifetimes):
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        lifetimes = np.broadcast_to(np.asarray(lifetimes, dtype=np.int32), len(positions))
+        n = len(positions)
+        if n == 0:
+            return
+        if n > self.max_particles:
+            self.evicted += n - self.max_particles
+            positions = positions[-self.max_particles:]
+            lifetimes = lifetimes[-self.max_particles:]
+            n = self.max_particles
+        if self.count + n > self.max_particles:
+            self.evict(self.count + n - self.max_particles)
+        self.reserve(self.count + n)
+        end = self.count + n
+        self.positions[self.count:end] = positions
+        self.lifetimes[self.count:end] = lifetimes
+        self.next_move_times[self.count:end] = self.rng.integers(0, 11, size=n)
+        self.count = end
+
+    def evict(self, count):
+        """Drops the count oldest particles."""
+        count = min(count, self.count)
+        remaining = self.count - count
+        for array in (self.positions, self.lifetimes, self.next_move_times):
+            array[:remaining] = array[count:self.count]
+        self.count = remaining
+        self.evicted += count
+
+    def emit(self, center, count, spread, lifetime_range=(100, 300)):
+        offsets = self.rng.uniform(-spread, spread, size=(count, 2))
+        positions = offsets + (center[0], center[1])
+        lifetimes = self.rng.integers(lifetime_range[0], lifetime_range[1] + 1, size=count)
+        self.add(positions, lifetimes)
+
+    def emit_many(self, centers, counts, spread, lifetime_range=(100, 300)):
+        """Emits counts[i] particles around centers[i] for every i in one batch."""
+        centers = np.repeat(np.asarray(centers, dtype=np.float32).reshape(-1, 2), counts, axis=0)
+        count = len(centers)
+        if count == 0:
+            return
+        positions = centers + self.rng.uniform(-spread, spread, size=(count, 2))
+        lifetimes = self.rng.integers(lifetime_range[0], lifetime_range[1] + 1, size=count)
+        self.add(positions, lifetimes)
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+        epoch = self.game_state.epoch
+        lifetimes = self.lifetimes[:n]
+        lifetimes -= 1
+
+        next_move_times = self.next_move_times[:n]
+        due = np.flatnonzero(next_move_times <= epoch)
+        if len(due):
+            moves = self.rng.integers(0, len(self.MOVES), size=len(due))
+            self.positions[due] += self.MOVES[moves]
+            jitter = self.rng.integers(-self.MOVE_JITTER, self.MOVE_JITTER + 1, size=len(due))
+            next_move_times[due] = epoch + self.MOVE_INTERVAL + jitter
+
+        alive = lifetimes > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            self.count = len(keep)
+            self.positions[:self.count] = self.positions[keep]
+            self.lifetimes[:self.count] = self.lifetimes[keep]
+            self.next_move_times[:self.count] = self.next_move_times[keep]
+
+    def blit_coordinates(self, cell_size, bounds=None):
+        """Returns world pixel coordinates of live particles, optionally only those inside bounds (x0, y0, x1, y1)."""
+        positions = self.positions[:self.count]
+        if bounds is not None:
+            x0, y0, x1, y1 = bounds
+            visible = ((positions[:, 0] > x0) & (positions[:, 0] < x1) &
+                       (positions[:, 1] > y0) & (positions[:, 1] < y1))
+            positions = positions[visible]
+        coords = positions * (cell_size[0], cell_size[1])
+        return coords.astype(np.int32)
@@ -2,6 +2,7 @@ from .GameUnit import GameUnit
 from .Player import Player
 from .Enemy import Enemy
 from .Fireball import Fireball
-from .SimpleParticle import SimpleParticle
+from .ParticleSystem import ParticleSystem
+from .ObjectPool import ObjectPool
 
-__all__ = ['GameUnit', 'Player', 'Enemy', 'Fireball', 'SimpleParticle']
\ No newline at end of file
+__all__ = ['GameUnit', 'Player', 'Enemy', 'Fireball', 'ParticleSystem', 'ObjectPool']
@@ -0,0 +1,51 @@
+class EventBus:
+    """Typed publish/subscribe queue drained once per tick.
+
+    Handlers subscribe to an event class and are called from flush() with the
+    list of that tick's events of the class. Events sharing a key replace each
+    other while queued, so only the latest survives, and an event equal to the
+    last one delivered for its key is dropped as redundant.
+    """
+    def __init__(self):
+        self.subscribers = {}
+        self.pending = {}
+        self.delivered = {}
+
+    def subscribe(self, event_type, handler):
+        self.subscribers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        handlers = self.subscribers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self.subscribers.pop(event_type, None)
+
+    def publish(self, event):
+        # Unsubscribed types still replace queued events of the same key, or
+        # a stop, move, stop sequence would look like a repeated stop
+        if self.subscribers:
+            self.pending[event.key] = event
+
+    def flush(self):
+        if not self.pending:
+            return
+        batches = {}
+        for key, event in self.pending.items():
+            if self.delivered.get(key) == event:
+                continue
+            self.delivered[key] = event
+            batches.setdefault(type(event), []).append(event)
+        self.pending.clear()
+        for event_type, events in batches.items():
+            for handler in self.subscribers.get(event_type, ()):
+                handler(events)
+
+    def forget(self, key):
+        self.delivered.pop(key, None)
+        self.pending.pop(key, None)
+
+    def clear(self):
+        """Drops queued events and delivery history, e.g. after a state restore."""
+        self.pending.clear()
+        self.delivered.clear()
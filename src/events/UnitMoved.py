@@ -0,0 +1,17 @@
+class UnitMoved:
+    __slots__ = ('unit', 'direction')
+
+    def __init__(self, unit, direction):
+        self.unit = unit
+        self.direction = (direction[0], direction[1])
+
+    @property
+    def key(self):
+        # Moves and stops of one unit coalesce into its latest motion state
+        return ('motion', id(self.unit))
+
+    def __eq__(self, other):
+        return type(other) is UnitMoved and other.unit is self.unit and other.direction == self.direction
+
+    def __repr__(self):
+        return 'UnitMoved(%r, %r)' % (self.unit, self.direction)
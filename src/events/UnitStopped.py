@@ -0,0 +1,15 @@
+class UnitStopped:
+    __slots__ = ('unit',)
+
+    def __init__(self, unit):
+        self.unit = unit
+
+    @property
+    def key(self):
+        return ('motion', id(self.unit))
+
+    def __eq__(self, other):
+        return type(other) is UnitStopped and other.unit is self.unit
+
+    def __repr__(self):
+        return 'UnitStopped(%r)' % (self.unit,)
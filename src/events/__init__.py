@@ -0,0 +1,5 @@
+from .EventBus import EventBus
+from .UnitMoved import UnitMoved
+from .UnitStopped import UnitStopped
+
+__all__ = ['EventBus', 'UnitMoved', 'UnitStopped']
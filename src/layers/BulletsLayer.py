@@ -7,6 +7,18 @@ class BulletsLayer(Layer):
         self.bullets = bullets
 
     def render(self, surface):
+        if not self.bullets:
+            return
+        camera = self.user_interface.camera
+        x0, y0, x1, y1 = camera.visible_bounds()
+        cell_width, cell_height = camera.cell_size
+        offset_x, offset_y = camera.offset
+        sprites = self.sprites
+        tile_index = self.tile_index
+        blit_sequence = []
         for bullet in self.bullets:
-            if bullet.health != 0:
-                self.draw_tile(surface, bullet.position, bullet.tile)
\ No newline at end of file
+            x, y = bullet.position
+            if bullet.health != 0 and x0 < x < x1 and y0 < y < y1:
+                blit_sequence.append((sprites[tile_index(bullet.tile)],
+                                      (int(x * cell_width) - offset_x, int(y * cell_height) - offset_y)))
+        self.blit_sprites(surface, blit_sequence)
@@ -1,6 +1,4 @@
 class GameStateObserver:
-    def on_unit_move(self, unit, direction):
+    def subscribe(self, events):
+        """Registers handlers for the event types this observer wants from the EventBus."""
         pass
-
-    def on_unit_stop(self, unit):
-        pass
\ No newline at end of file
@@ -1,18 +1,41 @@
-import pygame
-from pygame import Rect
 from .GameStateObserver import GameStateObserver
 
 class Layer(GameStateObserver):
     def __init__(self, user_interface, tileset):
         self.user_interface = user_interface
-        self.tileset = pygame.image.load(tileset)
-    
-    def draw_tile(self, surface, position, tile):
-        sprite_coords = position.elementwise() * self.user_interface.cell_size
-        tile_coords = tile.elementwise() * self.user_interface.cell_size
-        tile_rect = Rect(int(tile_coords.x), int(tile_coords.y), 
-                        self.user_interface.cell_size.x, self.user_interface.cell_size.y)
-        surface.blit(self.tileset, sprite_coords, tile_rect)
+        self.atlas = user_interface.sprite_atlas
+        self.tileset_path = tileset
+        # Fetched on first use, so layers that draw nothing yet don't wait for their tileset
+        self._sprites = None
+        # List of screen rects drawn this frame, or None when not tracking
+        self.dirty_rects = None
+
+    @property
+    def tileset(self):
+        return self.atlas.sheet(self.tileset_path)
+
+    @property
+    def sprites(self):
+        """Pre-sliced tiles of the plain tileset, indexed by tile number."""
+        if self._sprites is None:
+            self._sprites = self.atlas.sprites(self.tileset_path)
+        return self._sprites
+
+    def tile_index(self, tile):
+        return self.atlas.tile_index(self.tileset_path, tile)
+
+    def mark_dirty(self, rect):
+        if self.dirty_rects is not None:
+            self.dirty_rects.append(rect)
+
+    def blit_sprites(self, surface, blit_sequence):
+        """Draws a frame's (sprite, dest) pairs with a single Surface.blits call."""
+        if not blit_sequence:
+            return
+        if self.dirty_rects is None:
+            surface.blits(blit_sequence, doreturn=False)
+        else:
+            self.dirty_rects.extend(surface.blits(blit_sequence))
     
     def render(self, surface):
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
@@ -6,6 +6,10 @@ class ParticlesLayer(Layer):
         self.game_state = game_state
 
     def render(self, surface):
-        for particle in self.game_state.particles:
-            if particle.lifetime > 0:
-                self.draw_tile(surface, particle.position, particle.tile)
\ No newline at end of file
+        particles = self.game_state.particles
+        if len(particles) == 0:
+            return
+        camera = self.user_interface.camera
+        sprite = self.sprites[self.tile_index(particles.tile)]
+        coords = particles.blit_coordinates(camera.cell_size, camera.visible_bounds()) - camera.offset
+        self.blit_sprites(surface, [(sprite, dest) for dest in coords.tolist()])
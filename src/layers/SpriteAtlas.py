@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from ..assets.AssetManager import AssetManager
+
+class SpriteAtlas:
+    """Tilesets from an AssetManager, pre-sliced into tiles.
+
+    sprites(path, effect) returns a list of subsurfaces indexed by tile
+    number (row-major, see tile_index), so layers can feed them straight to
+    Surface.blits. Effect variants come from the SpriteEffectCache and are
+    sliced once, then kept in a bounded LRU of their own.
+    """
+    def __init__(self, cell_size, effects, max_variants=32, assets=None):
+        self.cell_size = (int(cell_size[0]), int(cell_size[1]))
+        self.effects = effects
+        self.assets = assets if assets is not None else AssetManager()
+        self.max_variants = max_variants
+        self.sheets = {}
+        self.columns = {}
+        self.slices = OrderedDict()
+
+    def sheet(self, path):
+        sheet = self.sheets.get(path)
+        if sheet is None:
+            sheet = self.sheets[path] = self.assets.image(path)
+            self.columns[path] = max(1, sheet.get_width() // self.cell_size[0])
+        return sheet
+
+    def sprites(self, path, effect=None):
+        key = (path, effect)
+        sprites = self.slices.get(key)
+        if sprites is not None:
+            self.slices.move_to_end(key)
+            return sprites
+        sprites = self.slice(self.effects.get(self.sheet(path), effect))
+        self.slices[key] = sprites
+        if len(self.slices) > self.max_variants:
+            self.slices.popitem(last=False)
+        return sprites
+
+    def slice(self, sheet):
+        cell_width, cell_height = self.cell_size
+        columns = max(1, sheet.get_width() // cell_width)
+        rows = max(1, sheet.get_height() // cell_height)
+        return [sheet.subsurface((x * cell_width, y * cell_height, cell_width, cell_height))
+                for y in range(rows) for x in range(columns)]
+
+    def tile_index(self, path, tile):
+        if path not in self.columns:
+            self.sheet(path)
+        return int(tile[1]) * self.columns[path] + int(tile[0])
+
+    def clear(self):
+        self.slices.clear()
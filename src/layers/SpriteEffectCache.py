@@ -0,0 +1,52 @@
+from collections import OrderedDict
+import pygame
+
+class SpriteEffectCache:
+    """Bounded LRU cache of whole-tileset effect variants.
+
+    Variants are built on first use, so drawing a tile with an effect costs
+    the same blit as drawing it plain.
+    """
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self.variants = OrderedDict()
+        self.builders = {
+            'flash': self.build_flash,
+            'damage': self.build_damage,
+            'fade': self.build_fade,
+        }
+
+    def __len__(self):
+        return len(self.variants)
+
+    def get(self, tileset, effect):
+        if effect is None:
+            return tileset
+        key = (tileset, effect)
+        variant = self.variants.get(key)
+        if variant is not None:
+            self.variants.move_to_end(key)
+            return variant
+        variant = self.builders[effect](tileset)
+        self.variants[key] = variant
+        if len(self.variants) > self.max_entries:
+            self.variants.popitem(last=False)
+        return variant
+
+    def clear(self):
+        self.variants.clear()
+
+    def build_flash(self, tileset):
+        variant = tileset.copy()
+        variant.fill((255, 255, 255), special_flags=pygame.BLEND_ADD)
+        return variant
+
+    def build_damage(self, tileset):
+        variant = tileset.copy()
+        variant.fill((255, 96, 96), special_flags=pygame.BLEND_RGB_MULT)
+        return variant
+
+    def build_fade(self, tileset):
+        variant = tileset.copy()
+        variant.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
+        return variant
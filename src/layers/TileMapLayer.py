@@ -1,21 +1,87 @@
-from pygame import Vector2
-import random
+from collections import OrderedDict
+import pygame
 from .Layer import Layer
 
 class TileMapLayer(Layer):
-    def __init__(self, user_interface, tileset, game_state):
+    def __init__(self, user_interface, tileset, game_state, max_chunk_surfaces=None):
         super().__init__(user_interface, tileset)
         self.game_state = game_state
-        self.tile_map = [[Vector2(0, 0) for _ in range(int(game_state.world_size.x))]
-                        for _ in range(int(game_state.world_size.y))]
-        self.generate_simple_map()
-    
-    def generate_simple_map(self):
-        for y in range(len(self.tile_map)):
-            for x in range(len(self.tile_map[0])):
-                self.tile_map[y][x] = Vector2(1, 0) if random.random() < 0.1 else Vector2(0, 0)
+        self.tile_map = game_state.tile_map
+        # Pre-rendered chunks, dropped wholesale when the map changes
+        self.chunk_surfaces = OrderedDict()
+        if max_chunk_surfaces is None:
+            # Enough for every chunk the viewport can overlap plus a one-chunk margin
+            viewport_width, viewport_height = user_interface.camera.viewport_size
+            chunk_size = self.tile_map.chunk_size
+            max_chunk_surfaces = (-(-viewport_width // chunk_size) + 2) * (-(-viewport_height // chunk_size) + 2)
+        self.max_chunk_surfaces = max_chunk_surfaces
+        self.chunk_surfaces_version = -1
+        # The visible part of the map composed from chunk surfaces
+        self.background = None
+        self.background_version = -1
+        self.background_offset = None
     
+    def get_chunk_surface(self, chunk_x, chunk_y):
+        if self.chunk_surfaces_version != self.tile_map.version:
+            self.chunk_surfaces.clear()
+            self.chunk_surfaces_version = self.tile_map.version
+        key = (chunk_x, chunk_y)
+        chunk_surface = self.chunk_surfaces.get(key)
+        if chunk_surface is not None:
+            self.chunk_surfaces.move_to_end(key)
+            return chunk_surface
+
+        cell_width, cell_height = int(self.user_interface.cell_size.x), int(self.user_interface.cell_size.y)
+        tiles = self.tile_map.chunk(chunk_x, chunk_y).tolist()
+        chunk_surface = pygame.Surface((len(tiles[0]) * cell_width, len(tiles) * cell_height))
+        # Tile indices past the end of the tileset wrap around
+        sprites = self.sprites
+        tile_count = len(sprites)
+        chunk_surface.blits([(sprites[tile % tile_count], (x * cell_width, y * cell_height))
+                             for y, row in enumerate(tiles)
+                             for x, tile in enumerate(row)], doreturn=False)
+        self.chunk_surfaces[key] = chunk_surface
+        if len(self.chunk_surfaces) > self.max_chunk_surfaces:
+            self.chunk_surfaces.popitem(last=False)
+        return chunk_surface
+
+    def is_background_stale(self):
+        return (self.background is None or self.background_version != self.tile_map.version or
+                self.background_offset != self.user_interface.camera.offset)
+
+    def get_background(self):
+        if self.is_background_stale():
+            camera = self.user_interface.camera
+            x0, y0, x1, y1 = camera.visible_tiles()
+            self.tile_map.stream(x0, y0, x1, y1)
+
+            background = self.background
+            if background is None or background.get_size() != camera.screen_size:
+                background = pygame.Surface(camera.screen_size)
+            chunk_size = self.tile_map.chunk_size
+            chunk_width = chunk_size * camera.cell_size[0]
+            chunk_height = chunk_size * camera.cell_size[1]
+            for chunk_y in range(y0 // chunk_size, (y1 - 1) // chunk_size + 1):
+                for chunk_x in range(x0 // chunk_size, (x1 - 1) // chunk_size + 1):
+                    destination = (chunk_x * chunk_width - camera.offset[0],
+                                   chunk_y * chunk_height - camera.offset[1])
+                    background.blit(self.get_chunk_surface(chunk_x, chunk_y), destination)
+
+            # Chunks overhang the world edge; keep the area past it black
+            world_width = camera.world_size[0] * camera.cell_size[0] - camera.offset[0]
+            world_height = camera.world_size[1] * camera.cell_size[1] - camera.offset[1]
+            background.fill((0, 0, 0), pygame.Rect(world_width, 0, background.get_width(), background.get_height()))
+            background.fill((0, 0, 0), pygame.Rect(0, world_height, background.get_width(), background.get_height()))
+
+            self.background = background
+            self.background_version = self.tile_map.version
+            self.background_offset = camera.offset
+        return self.background
+
+    def restore(self, surface, rects):
+        background = self.get_background()
+        for rect in rects:
+            surface.blit(background, rect, rect)
+
     def render(self, surface):
-        for y in range(len(self.tile_map)):
-            for x in range(len(self.tile_map[0])):
-                self.draw_tile(surface, Vector2(x, y), self.tile_map[y][x])
\ No newline at end of file
+        self.mark_dirty(surface.blit(self.get_background(), (0, 0)))
@@ -1,5 +1,3 @@
-import pygame
-from pygame import Vector2
 from .Layer import Layer
 from ..entities.Enemy import Enemy
 
@@ -9,12 +7,8 @@ class UnitsLayer(Layer):
         self.game_state = game_state
         self.units = units
         self.frame_switch_threshold = 15
-    
-    def on_unit_move(self, unit, direction):
-        unit.is_moving = True
-    
-    def on_unit_stop(self, unit):
-        unit.is_moving = False
+        # Ticks a unit flashes white after a hit, at full quality
+        self.flash_ticks = 8
     
     def get_unit_tile(self, unit):
         tile = unit.tile.copy()
@@ -32,16 +26,20 @@ class UnitsLayer(Layer):
         return tile
     
     def render(self, surface):
+        camera = self.user_interface.camera
+        x0, y0, x1, y1 = camera.visible_bounds()
+        cell_width, cell_height = camera.cell_size
+        offset_x, offset_y = camera.offset
+        epoch = self.game_state.epoch
+        flash_ticks = self.game_state.quality.scale(self.flash_ticks)
+        tile_index = self.tile_index
+        blit_sequence = []
         for unit in self.units:
-            current_tile = self.get_unit_tile(unit)
-            if self.game_state.epoch - unit.last_hit_epoch < 8:
-                # Flash white when hit
-                sprite_coords = unit.position.elementwise() * self.user_interface.cell_size
-                tile_coords = current_tile.elementwise() * self.user_interface.cell_size
-                tile_rect = pygame.Rect(int(tile_coords.x), int(tile_coords.y), 
-                                      self.user_interface.cell_size.x, self.user_interface.cell_size.y)
-                white_sprite = self.tileset.copy()
-                white_sprite.fill((255, 255, 255), special_flags=pygame.BLEND_ADD)
-                surface.blit(white_sprite, sprite_coords, tile_rect)
-            else:
-                self.draw_tile(surface, unit.position, current_tile)
\ No newline at end of file
+            x, y = unit.position
+            if not (x0 < x < x1 and y0 < y < y1):
+                continue
+            # Flash white when hit
+            sprites = self.sprites if epoch - unit.last_hit_epoch >= flash_ticks else self.atlas.sprites(self.tileset_path, 'flash')
+            blit_sequence.append((sprites[tile_index(self.get_unit_tile(unit))],
+                                  (int(x * cell_width) - offset_x, int(y * cell_height) - offset_y)))
+        self.blit_sprites(surface, blit_sequence)
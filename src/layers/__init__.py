@@ -4,6 +4,8 @@ from .TileMapLayer import TileMapLayer
 from .UnitsLayer import UnitsLayer
 from .BulletsLayer import BulletsLayer
 from .ParticlesLayer import ParticlesLayer
+from .SpriteEffectCache import SpriteEffectCache
+from .SpriteAtlas import SpriteAtlas
 
 __all__ = [
     'GameStateObserver',
@@ -11,5 +13,7 @@ __all__ = [
     'TileMapLayer',
     'UnitsLayer',
     'BulletsLayer',
-    'ParticlesLayer'
+    'ParticlesLayer',
+    'SpriteEffectCache',
+    'SpriteAtlas'
 ]
\ No newline at end of file
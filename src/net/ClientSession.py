@@ -0,0 +1,26 @@
+from pygame import Vector2
+
+class ClientSession:
+    """Server-side state of one connected client."""
+    def __init__(self, reader, writer, player, player_id):
+        self.reader = reader
+        self.writer = writer
+        self.player = player
+        self.player_id = player_id
+        self.direction = Vector2(0, 0)
+        # Latched until the next tick consumes it, so a tap between ticks still fires
+        self.shoot = False
+        # The view as of the last STATE sent; the next one is encoded against it
+        self.sent = {}
+        self.bytes_sent = 0
+        self.states_sent = 0
+        self.states_skipped = 0
+
+    def set_input(self, direction, shoot):
+        self.direction = Vector2(direction)
+        self.shoot = self.shoot or shoot
+
+    def take_input(self):
+        shoot = self.shoot
+        self.shoot = False
+        return self.direction, shoot
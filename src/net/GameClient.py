@@ -0,0 +1,155 @@
+import asyncio
+import threading
+from pygame import Vector2
+from ..entities.Enemy import Enemy
+from ..entities.Fireball import Fireball
+from ..entities.Player import Player
+from .Protocol import Protocol
+
+class GameClient:
+    """Thin client of a GameServer: sends inputs and mirrors the entities in view.
+
+    Used from asyncio directly (connect, then run), as a scripted bot by
+    passing run() an input source, or from the pygame UI through
+    start_thread(), which runs the connection on a background thread.
+    Each received state is published as an immutable view, which apply()
+    turns into entities of a local GameState for rendering.
+    """
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.player_id = None
+        self.seed = None
+        self.world_size = None
+        self.tick_rate = None
+        self.interest_radius = None
+        self.entities = {}
+        # Published copy of entities after each state, safe to read from another thread
+        self.view = {}
+        self.epoch = 0
+        self.states_received = 0
+        self.bytes_received = 0
+        self.direction = Vector2(0, 0)
+        self.shoot = False
+        # Guards the direction and shoot latch, written by the UI thread
+        self.input_lock = threading.Lock()
+        self.objects = {}
+        self.connected = threading.Event()
+        self.thread = None
+        self.error = None
+
+    async def connect(self, host, port):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.write(Protocol.hello())
+        message = await self.read_message()
+        (message_type, version, self.player_id, self.seed, width, height,
+         self.tick_rate, self.interest_radius) = Protocol.WELCOME.unpack(message)
+        if message_type != Protocol.TYPE_WELCOME or version != Protocol.VERSION:
+            raise ValueError(f"unexpected handshake from server (type {message_type}, version {version})")
+        self.world_size = (width, height)
+        self.connected.set()
+
+    async def read_message(self):
+        (length,) = Protocol.LENGTH.unpack(await self.reader.readexactly(Protocol.LENGTH.size))
+        self.bytes_received += Protocol.LENGTH.size + length
+        return await self.reader.readexactly(length)
+
+    async def receive_state(self):
+        message = await self.read_message()
+        if message[0] != Protocol.TYPE_STATE:
+            raise ValueError(f"unexpected message type {message[0]}")
+        self.epoch = Protocol.decode_state(message, self.entities)
+        self.view = {entity_id: tuple(fields) for entity_id, fields in self.entities.items()}
+        self.states_received += 1
+        return self.epoch
+
+    def send_input(self, direction, shoot):
+        self.writer.write(Protocol.input(direction, shoot))
+
+    def set_input(self, direction, shoot):
+        with self.input_lock:
+            self.direction = Vector2(direction)
+            self.shoot = self.shoot or shoot
+
+    def take_input(self):
+        with self.input_lock:
+            shoot = self.shoot
+            self.shoot = False
+            return self.direction, shoot
+
+    async def run(self, input_source=None, ticks=None):
+        """Answers every state with an input, from input_source(epoch) or set_input()."""
+        received = 0
+        while ticks is None or received < ticks:
+            epoch = await self.receive_state()
+            received += 1
+            direction, shoot = input_source(epoch) if input_source is not None else self.take_input()
+            self.send_input(direction, shoot)
+            await self.writer.drain()
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def start_thread(self, host, port, timeout=5):
+        """Connects and runs on a daemon thread; returns once the handshake is done."""
+        async def main():
+            try:
+                await self.connect(host, port)
+                await self.run()
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError) as error:
+                self.error = error
+            finally:
+                self.connected.set()
+                await self.close()
+
+        self.thread = threading.Thread(target=asyncio.run, args=(main(),), daemon=True)
+        self.thread.start()
+        if not self.connected.wait(timeout) or self.error is not None:
+            raise ConnectionError(f"could not connect to {host}:{port}: {self.error}")
+
+    def apply(self, game_state):
+        """Replaces game_state's units and bullets with the mirrored entities."""
+        view = self.view
+        scale = Protocol.POSITION_SCALE
+        objects = {}
+        units = []
+        bullets = []
+        for entity_id, (kind, x, y, health, aux, flags) in view.items():
+            entity = self.objects.get(entity_id)
+            if entity is None:
+                entity = self.create_entity(game_state, kind)
+            objects[entity_id] = entity
+            entity.position = Vector2(x / scale, y / scale)
+            entity.health = health
+            if kind == Protocol.KIND_BULLET:
+                entity.current_frame = aux
+                entity.tile = Fireball.animation_frames[aux % len(Fireball.animation_frames)]
+                bullets.append(entity)
+                continue
+            entity.orientation = Vector2(Protocol.ORIENTATIONS[aux])
+            entity.is_moving = bool(flags & Protocol.FLAG_MOVING)
+            entity.last_hit_epoch = self.epoch if flags & Protocol.FLAG_HIT else -1000
+            units.append(entity)
+        self.objects = objects
+        game_state.epoch = self.epoch
+        game_state.units[:] = units
+        game_state.bullets[:] = bullets
+        player = objects.get(self.player_id)
+        if player is not None:
+            game_state.player_unit = player
+        return player
+
+    def create_entity(self, game_state, kind):
+        if kind == Protocol.KIND_ENEMY:
+            return Enemy(game_state, Vector2(0, 0))
+        if kind == Protocol.KIND_PLAYER:
+            return Player(game_state, Vector2(0, 0), Vector2(2, 0))
+        bullet = Fireball.__new__(Fireball)
+        bullet.game_state = game_state
+        bullet.last_hit_epoch = 0
+        return bullet
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from ..replay.InputLog import InputLog
+from ..entities.Enemy import Enemy
+from ..simulation.Simulation import Simulation
+from ..state.GameState import GameState
+from .ClientSession import ClientSession
+from .Protocol import Protocol
+
+class GameServer:
+    """Authoritative multiplayer host.
+
+    The server owns the only Simulation and steps it at tick_rate with the
+    latest input of every connected client. The first client controls
+    player_unit, which the enemies chase; later clients get players of
+    their own. After each tick every client is sent the entities within
+    interest_radius tiles (Chebyshev) of its player, delta-encoded against
+    the previous view sent to it. A client whose socket buffer holds more
+    than max_send_buffer bytes is skipped for that tick rather than stalling
+    the others.
+    """
+    def __init__(self, game_state=None, tick_rate=60, interest_radius=12, max_send_buffer=1 << 18):
+        self.simulation = Simulation(game_state if game_state is not None else GameState())
+        self.game_state = self.simulation.game_state
+        self.tick_rate = tick_rate
+        self.interest_radius = interest_radius
+        self.max_send_buffer = max_send_buffer
+        self.sessions = []
+        self.handlers = set()
+        self.entity_ids = {}
+        self.next_entity_id = 1
+        self.server = None
+        self.ticks = 0
+        self.tick_time = 0.0
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def start(self, host='127.0.0.1', port=0):
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.port
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+        # Closing the sockets ends each handler's read loop; cancelling them
+        # instead makes asyncio's stream server log spurious errors
+        for session in list(self.sessions):
+            session.writer.close()
+        if self.handlers:
+            await asyncio.wait(list(self.handlers), timeout=1)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+    def entity_id(self, entity):
+        entity_id = self.entity_ids.get(entity)
+        if entity_id is None:
+            entity_id = self.entity_ids[entity] = self.next_entity_id
+            self.next_entity_id += 1
+        return entity_id
+
+    async def read_message(self, reader):
+        (length,) = Protocol.LENGTH.unpack(await reader.readexactly(Protocol.LENGTH.size))
+        return await reader.readexactly(length)
+
+    async def handle_client(self, reader, writer):
+        handler = asyncio.current_task()
+        self.handlers.add(handler)
+        try:
+            await self.serve_client(reader, writer)
+        finally:
+            self.handlers.discard(handler)
+
+    async def serve_client(self, reader, writer):
+        try:
+            hello = await self.read_message(reader)
+            message_type, version = Protocol.HELLO.unpack(hello)
+            if message_type != Protocol.TYPE_HELLO or version != Protocol.VERSION:
+                writer.close()
+                return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            writer.close()
+            return
+
+        game_state = self.game_state
+        primary_taken = any(session.player is game_state.player_unit for session in self.sessions)
+        player = game_state.player_unit if not primary_taken and game_state.player_unit.health > 0 else game_state.add_player()
+        session = ClientSession(reader, writer, player, self.entity_id(player))
+        self.sessions.append(session)
+        writer.write(Protocol.welcome(session.player_id, game_state.seed, game_state.world_size,
+                                      self.tick_rate, self.interest_radius))
+        try:
+            while True:
+                message = await self.read_message(reader)
+                if message[0] == Protocol.TYPE_INPUT:
+                    session.set_input(*InputLog.decode_input(message[1]))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.sessions.remove(session)
+            if player is not game_state.player_unit:
+                game_state.remove_player(player)
+            writer.close()
+
+    def tick(self):
+        start = time.perf_counter()
+        game_state = self.game_state
+        direction, shoot = None, False
+        other_inputs = {}
+        for session in self.sessions:
+            if session.player is game_state.player_unit:
+                direction, shoot = session.take_input()
+            elif session.player.health > 0:
+                other_inputs[session.player] = session.take_input()
+        self.simulation.step(direction, shoot, other_inputs)
+        self.broadcast()
+        self.ticks += 1
+        self.tick_time += time.perf_counter() - start
+
+    def world_view(self):
+        """Returns (id, x, y, fields) for every live entity and forgets ids of the gone ones."""
+        game_state = self.game_state
+        epoch = game_state.epoch
+        scale = Protocol.POSITION_SCALE
+        old_ids = self.entity_ids
+        self.entity_ids = {}
+        entities = []
+        for unit in game_state.units:
+            entity_id = old_ids.get(unit) or self.entity_id(unit)
+            self.entity_ids[unit] = entity_id
+            kind = Protocol.KIND_ENEMY if isinstance(unit, Enemy) else Protocol.KIND_PLAYER
+            flags = ((Protocol.FLAG_MOVING if unit.is_moving else 0) |
+                     (Protocol.FLAG_HIT if epoch - unit.last_hit_epoch < 8 else 0))
+            x, y = unit.position
+            entities.append((entity_id, x, y, (kind, int(x * scale), int(y * scale), unit.health,
+                                               Protocol.orientation_code(unit.orientation), flags)))
+        for bullet in game_state.bullets:
+            if bullet.health == 0:
+                continue
+            entity_id = old_ids.get(bullet) or self.entity_id(bullet)
+            self.entity_ids[bullet] = entity_id
+            x, y = bullet.position
+            entities.append((entity_id, x, y, (Protocol.KIND_BULLET, int(x * scale), int(y * scale),
+                                               bullet.health, bullet.current_frame, 0)))
+        return entities
+
+    def broadcast(self):
+        if not self.sessions:
+            self.entity_ids = {}
+            return
+        entities = self.world_view()
+        radius = self.interest_radius
+        epoch = self.game_state.epoch
+        # Bucket entities into radius-sized cells so each client only scans its 3x3 neighbourhood
+        buckets = {}
+        for entity in entities:
+            buckets.setdefault((int(entity[1] // radius), int(entity[2] // radius)), []).append(entity)
+        encodings = {}
+        for session in self.sessions:
+            transport = session.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > self.max_send_buffer:
+                session.states_skipped += 1
+                continue
+            center_x, center_y = session.player.position
+            cell_x, cell_y = int(center_x // radius), int(center_y // radius)
+            view = {}
+            for bucket_y in (cell_y - 1, cell_y, cell_y + 1):
+                for bucket_x in (cell_x - 1, cell_x, cell_x + 1):
+                    for entity_id, x, y, fields in buckets.get((bucket_x, bucket_y), ()):
+                        if -radius <= x - center_x <= radius and -radius <= y - center_y <= radius:
+                            view[entity_id] = fields
+            message = Protocol.encode_state(epoch, session.sent, view, encodings)
+            session.writer.write(message)
+            session.sent = view
+            session.bytes_sent += len(message)
+            session.states_sent += 1
+
+    async def run(self, ticks=None):
+        """Ticks at tick_rate until ticks have run, or forever; falls behind rather than bursting."""
+        interval = 1 / self.tick_rate
+        deadline = time.perf_counter()
+        ran = 0
+        while ticks is None or ran < ticks:
+            self.tick()
+            ran += 1
+            deadline += interval
+            delay = deadline - time.perf_counter()
+            if delay < -interval:
+                deadline = time.perf_counter()
+                delay = 0
+            await asyncio.sleep(max(delay, 0))
@@ -0,0 +1,141 @@
+import struct
+from ..replay.InputLog import InputLog
+
+class Protocol:
+    """Wire format shared by GameServer and GameClient.
+
+    Every message is a u32 little-endian payload length followed by the
+    payload, whose first byte is the message type:
+
+        HELLO    client -> server: protocol version u16
+        WELCOME  server -> client: protocol version u16, player entity id
+                 u32, seed u64, world width u32, world height u32, tick
+                 rate u16, interest radius u16
+        INPUT    client -> server: one InputLog input byte
+        STATE    server -> client: epoch, then the ids of entities that left
+                 the client's view, then changed entities, all as varints
+
+    A STATE message only describes what changed since the previous STATE
+    sent to the same client; TCP delivers them in order, so no acks are
+    needed. Each changed entity is its id, a bit mask of the fields that
+    follow and those fields as zigzag varints. A new entity sets every bit.
+    The fields are ENTITY_FIELDS, with positions in 1/POSITION_SCALE tiles.
+    """
+    VERSION = 1
+    LENGTH = struct.Struct("<I")
+    WELCOME = struct.Struct("<BHIQIIHH")
+    HELLO = struct.Struct("<BH")
+    TYPE_HELLO = 1
+    TYPE_WELCOME = 2
+    TYPE_INPUT = 3
+    TYPE_STATE = 4
+    ENTITY_FIELDS = ('kind', 'x', 'y', 'health', 'aux', 'flags')
+    ALL_FIELDS = (1 << len(ENTITY_FIELDS)) - 1
+    POSITION_SCALE = 256
+    KIND_PLAYER = 0
+    KIND_ENEMY = 1
+    KIND_BULLET = 2
+    FLAG_MOVING = 1
+    FLAG_HIT = 2
+    # aux of a unit: which way it faces, as in UnitsLayer; aux of a bullet: animation frame
+    ORIENTATIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (0, 0))
+
+    @classmethod
+    def frame(cls, payload):
+        return cls.LENGTH.pack(len(payload)) + payload
+
+    @classmethod
+    def hello(cls):
+        return cls.frame(cls.HELLO.pack(cls.TYPE_HELLO, cls.VERSION))
+
+    @classmethod
+    def welcome(cls, player_id, seed, world_size, tick_rate, interest_radius):
+        return cls.frame(cls.WELCOME.pack(cls.TYPE_WELCOME, cls.VERSION, player_id, seed,
+                                          int(world_size[0]), int(world_size[1]),
+                                          int(tick_rate), int(interest_radius)))
+
+    @classmethod
+    def input(cls, direction, shoot):
+        return cls.frame(bytes((cls.TYPE_INPUT, InputLog.encode_input(direction, shoot))))
+
+    @classmethod
+    def orientation_code(cls, orientation):
+        if orientation.x > 0: return 0
+        if orientation.x < 0: return 1
+        if orientation.y > 0: return 2
+        if orientation.y < 0: return 3
+        return 4
+
+    @staticmethod
+    def zigzag(value):
+        return (value << 1) ^ (value >> 63)
+
+    @staticmethod
+    def unzigzag(value):
+        return (value >> 1) ^ -(value & 1)
+
+    @classmethod
+    def encode_state(cls, epoch, previous, current, cache=None):
+        """Encodes the change from previous to current, both dicts of entity id -> field tuple.
+
+        cache, if given, maps entity id -> (old, new, encoded) and lets clients
+        that share the same old and new tuple objects share the encoding.
+        """
+        varint = InputLog.encode_varint
+        zigzag = cls.zigzag
+        removed = [entity_id for entity_id in previous if entity_id not in current]
+        changed = []
+        for entity_id, fields in current.items():
+            old = previous.get(entity_id)
+            if old == fields:
+                continue
+            if cache is not None:
+                cached = cache.get(entity_id)
+                if cached is not None and cached[0] is old and cached[1] is fields:
+                    changed.append(cached[2])
+                    continue
+            if old is None:
+                mask = cls.ALL_FIELDS
+                values = fields
+            else:
+                mask = 0
+                values = []
+                for index, (old_value, value) in enumerate(zip(old, fields)):
+                    if old_value != value:
+                        mask |= 1 << index
+                        values.append(value)
+            encoded = varint(entity_id) + bytes((mask,)) + b''.join([varint(zigzag(value)) for value in values])
+            if cache is not None:
+                cache[entity_id] = (old, fields, encoded)
+            changed.append(encoded)
+        parts = [bytes((cls.TYPE_STATE,)), varint(epoch), varint(len(removed))]
+        parts.extend(varint(entity_id) for entity_id in removed)
+        parts.append(varint(len(changed)))
+        parts.extend(changed)
+        return cls.frame(b''.join(parts))
+
+    @classmethod
+    def decode_state(cls, payload, entities):
+        """Applies a STATE payload to entities (id -> field list) in place and returns the epoch."""
+        decode = InputLog.decode_varint
+        unzigzag = cls.unzigzag
+        epoch, offset = decode(payload, 1)
+        count, offset = decode(payload, offset)
+        for _ in range(count):
+            entity_id, offset = decode(payload, offset)
+            entities.pop(entity_id, None)
+        count, offset = decode(payload, offset)
+        for _ in range(count):
+            entity_id, offset = decode(payload, offset)
+            mask = payload[offset]
+            offset += 1
+            fields = entities.get(entity_id)
+            if fields is None:
+                if mask != cls.ALL_FIELDS:
+                    raise ValueError(f"update for unknown entity {entity_id}")
+                fields = entities[entity_id] = [0] * len(cls.ENTITY_FIELDS)
+            for index in range(len(cls.ENTITY_FIELDS)):
+                if mask & (1 << index):
+                    value, offset = decode(payload, offset)
+                    fields[index] = unzigzag(value)
+        return epoch
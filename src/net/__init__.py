@@ -0,0 +1,6 @@
+from .Protocol import Protocol
+from .ClientSession import ClientSession
+from .GameServer import GameServer
+from .GameClient import GameClient
+
+__all__ = ['Protocol', 'ClientSession', 'GameServer', 'GameClient']
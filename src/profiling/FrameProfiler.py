@@ -0,0 +1,132 @@
+import json
+import threading
+from collections import deque
+from time import perf_counter
+
+class FrameProfiler:
+    """Opt-in per-command and per-layer timing kept in a fixed-size ring buffer.
+
+    Simulation.step and UserInterface.render only call into the profiler when
+    one is attached, so leaving the hooks in costs a None check per frame.
+    Each frame records the wall time and call count of every command class
+    and layer, the individual spans for trace export, and entity counts.
+
+    Spans go to the frame the recording thread began last. A renderer on its
+    own thread begins render frames, which are kept and averaged separately
+    from the simulation's tick frames.
+    """
+    def __init__(self, capacity=600):
+        self.frames = deque(maxlen=capacity)
+        self.render_frames = deque(maxlen=capacity)
+        self.origin = perf_counter()
+        self.local = threading.local()
+
+    def begin_frame(self, epoch):
+        return self.start_frame(self.frames, epoch)
+
+    def begin_render_frame(self, epoch):
+        return self.start_frame(self.render_frames, epoch)
+
+    def start_frame(self, frames, epoch):
+        frame = {
+            'epoch': epoch,
+            'start': perf_counter(),
+            'timings': {},
+            'spans': [],
+            'counts': {},
+        }
+        frames.append(frame)
+        self.local.frame = frame
+        return frame
+
+    @property
+    def current(self):
+        return getattr(self.local, 'frame', None)
+
+    def record(self, category, name, start, end):
+        frame = self.current
+        if frame is None:
+            frame = self.begin_frame(None)
+        key = (category, name)
+        timing = frame['timings'].get(key)
+        if timing is None:
+            frame['timings'][key] = [end - start, 1]
+        else:
+            timing[0] += end - start
+            timing[1] += 1
+        frame['spans'].append((category, name, start, end))
+
+    def record_counts(self, **counts):
+        frame = self.current
+        if frame is not None:
+            frame['counts'].update(counts)
+
+    def clear(self):
+        self.frames.clear()
+        self.render_frames.clear()
+        self.local = threading.local()
+
+    def totals(self, frames=None):
+        """Returns {(category, name): (seconds, calls)} summed over buffered frames."""
+        if frames is None:
+            frames = list(self.frames) + list(self.render_frames)
+        totals = {}
+        for frame in frames:
+            for key, (seconds, calls) in frame['timings'].items():
+                total = totals.setdefault(key, [0.0, 0])
+                total[0] += seconds
+                total[1] += calls
+        return {key: tuple(value) for key, value in totals.items()}
+
+    def summary(self):
+        frame_count = len(self.frames)
+        render_count = len(self.render_frames)
+        if frame_count == 0 and render_count == 0:
+            return "No frames recorded"
+        # Each row is averaged over the frames it was recorded in
+        rows = [(category, name, seconds, calls, count)
+                for frames, count in ((self.frames, frame_count), (self.render_frames, render_count)) if count
+                for (category, name), (seconds, calls) in self.totals(frames).items()]
+        grand_total = sum(seconds for category, _, seconds, _, _ in rows if category != 'tick') or 1.0
+        title = f"{frame_count} frames"
+        if render_count:
+            title = f"{frame_count} ticks, {render_count} render frames"
+        lines = [title, f"{'category':<10} {'name':<30} {'ms/frame':>9} {'calls/frame':>12} {'share':>7}"]
+        for category, name, seconds, calls, count in sorted(rows, key=lambda row: -row[2] / row[4]):
+            share = '' if category == 'tick' else f"{seconds / grand_total:.1%}"
+            lines.append(f"{category:<10} {name:<30} {seconds * 1000 / count:>9.3f} "
+                         f"{calls / count:>12.1f} {share:>7}")
+        last_counts = self.frames[-1]['counts'] if self.frames else {}
+        if last_counts:
+            lines.append("counts: " + ", ".join(f"{name}={value}" for name, value in last_counts.items()))
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Returns the buffered frames in Chrome trace event format."""
+        events = []
+        thread_ids = {'tick': 1, 'command': 1, 'layer': 2}
+        for frame in list(self.frames) + list(self.render_frames):
+            for category, name, start, end in frame['spans']:
+                events.append({
+                    'name': name,
+                    'cat': category,
+                    'ph': 'X',
+                    'ts': (start - self.origin) * 1e6,
+                    'dur': (end - start) * 1e6,
+                    'pid': 1,
+                    'tid': thread_ids.get(category, 0),
+                    'args': {'epoch': frame['epoch']},
+                })
+            if frame['counts']:
+                events.append({
+                    'name': 'entities',
+                    'ph': 'C',
+                    'ts': (frame['start'] - self.origin) * 1e6,
+                    'pid': 1,
+                    'args': frame['counts'],
+                })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.chrome_trace(), file)
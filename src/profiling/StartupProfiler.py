@@ -0,0 +1,37 @@
+from contextlib import contextmanager
+from time import perf_counter
+
+class StartupProfiler:
+    """Wall time of each cold-start phase, from process start to the first frame.
+
+    origin is the perf_counter() value the report is measured from, usually
+    taken as the first statement of main.py so imports are included.
+    """
+    def __init__(self, origin=None):
+        self.origin = perf_counter() if origin is None else origin
+        self.phases = []
+        self.counts = {}
+
+    def record(self, name, start, end):
+        self.phases.append((name, start, end))
+
+    @contextmanager
+    def phase(self, name):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, perf_counter())
+
+    def total(self):
+        return max((end for _, _, end in self.phases), default=self.origin) - self.origin
+
+    def summary(self):
+        total = self.total() or 1.0
+        lines = [f"startup {self.total() * 1000:.1f} ms",
+                 f"{'phase':<24} {'ms':>8} {'share':>7}"]
+        for name, start, end in self.phases:
+            lines.append(f"{name:<24} {(end - start) * 1000:>8.1f} {(end - start) / total:>7.1%}")
+        if self.counts:
+            lines.append(", ".join(f"{name}={value}" for name, value in self.counts.items()))
+        return "\n".join(lines)
@@ -0,0 +1,4 @@
+from .FrameProfiler import FrameProfiler
+from .StartupProfiler import StartupProfiler
+
+__all__ = ['FrameProfiler', 'StartupProfiler']
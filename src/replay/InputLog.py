@@ -0,0 +1,65 @@
+import struct
+
+class InputLog:
+    """Binary format shared by InputRecorder and ReplayPlayer.
+
+    A log starts with a header:
+
+        magic b"RRPGREC\\0", format version u16, checksum interval u16,
+        seed u64, world width u32, world height u32,
+        map path length u16 followed by that many UTF-8 bytes (0 = generated)
+
+    followed by records, each introduced by a tag byte:
+
+        INPUT     input byte, run length as an unsigned LEB128 varint
+        CHECKSUM  epoch u32, GameState.checksum() u32, taken after that tick
+        END       total ticks u32
+
+    An input byte packs one tick's input: bits 0-1 hold direction.x + 1,
+    bits 2-3 direction.y + 1 and bit 4 the shoot flag. Consecutive identical
+    ticks share one INPUT record, so idle or held-key stretches cost a few
+    bytes each.
+    """
+    MAGIC = b"RRPGREC\0"
+    VERSION = 1
+    HEADER = struct.Struct("<8sHHQII")
+    CHECKSUM = struct.Struct("<II")
+    END_TICKS = struct.Struct("<I")
+    TAG_INPUT = 1
+    TAG_CHECKSUM = 2
+    TAG_END = 3
+    SHOOT_BIT = 1 << 4
+
+    @classmethod
+    def encode_input(cls, direction, shoot):
+        dx, dy = direction[0], direction[1]
+        if dx not in (-1, 0, 1) or dy not in (-1, 0, 1):
+            raise ValueError(f"only unit-grid directions can be recorded, got {tuple(direction)}")
+        return (int(dx) + 1) | ((int(dy) + 1) << 2) | (cls.SHOOT_BIT if shoot else 0)
+
+    @classmethod
+    def decode_input(cls, value):
+        return ((value & 3) - 1, ((value >> 2) & 3) - 1), bool(value & cls.SHOOT_BIT)
+
+    @staticmethod
+    def encode_varint(value):
+        data = bytearray()
+        while True:
+            byte = value & 0x7F
+            value >>= 7
+            if value:
+                data.append(byte | 0x80)
+            else:
+                data.append(byte)
+                return bytes(data)
+
+    @staticmethod
+    def decode_varint(data, offset):
+        value = shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, offset
+            shift += 7
@@ -0,0 +1,53 @@
+from .InputLog import InputLog
+
+class InputRecorder:
+    """Captures a Simulation's per-tick inputs and periodic state checksums.
+
+    Attach with Simulation.recorder = InputRecorder(...); the simulation then
+    calls record_input before and record_tick after every step. The log is
+    written by save(), or kept in memory via to_bytes().
+    """
+    def __init__(self, game_state, checksum_interval=60, map_path=None):
+        self.game_state = game_state
+        self.checksum_interval = checksum_interval
+        self.map_path = map_path or ""
+        self.records = bytearray()
+        self.current_input = None
+        self.run_length = 0
+        self.start_epoch = game_state.epoch
+        self.ticks = 0
+
+    def record_input(self, direction, shoot):
+        value = InputLog.encode_input(direction, shoot)
+        if value != self.current_input:
+            self.flush_run()
+            self.current_input = value
+        self.run_length += 1
+
+    def record_tick(self):
+        self.ticks += 1
+        if self.checksum_interval and self.ticks % self.checksum_interval == 0:
+            self.flush_run()
+            self.records.append(InputLog.TAG_CHECKSUM)
+            self.records += InputLog.CHECKSUM.pack(self.game_state.epoch, self.game_state.checksum())
+
+    def flush_run(self):
+        if self.run_length:
+            self.records.append(InputLog.TAG_INPUT)
+            self.records.append(self.current_input)
+            self.records += InputLog.encode_varint(self.run_length)
+            self.run_length = 0
+
+    def to_bytes(self):
+        self.flush_run()
+        map_path = self.map_path.encode("utf-8")
+        header = InputLog.HEADER.pack(InputLog.MAGIC, InputLog.VERSION, self.checksum_interval,
+                                      self.game_state.seed,
+                                      int(self.game_state.world_size.x), int(self.game_state.world_size.y))
+        header += len(map_path).to_bytes(2, "little") + map_path
+        end = bytes([InputLog.TAG_END]) + InputLog.END_TICKS.pack(self.ticks)
+        return header + bytes(self.records) + end
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
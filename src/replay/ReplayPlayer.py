@@ -0,0 +1,73 @@
+from time import perf_counter
+from pygame import Vector2
+from .InputLog import InputLog
+from ..simulation.Simulation import Simulation
+from ..state.GameState import GameState
+from ..state.TileMap import TileMap
+
+class ReplayPlayer:
+    """Re-runs a recorded session headless at full speed.
+
+    run() rebuilds the world from the log's seed and map, feeds the recorded
+    inputs tick by tick and compares GameState.checksum() at every recorded
+    checkpoint. Divergences are collected in mismatches as
+    (epoch, expected, actual) rather than stopping the replay.
+    """
+    def __init__(self, data):
+        if data[:len(InputLog.MAGIC)] != InputLog.MAGIC:
+            raise ValueError("not an input log")
+        magic, version, checksum_interval, seed, width, height = InputLog.HEADER.unpack_from(data, 0)
+        if version != InputLog.VERSION:
+            raise ValueError(f"unsupported input log version {version}")
+        offset = InputLog.HEADER.size
+        path_length = int.from_bytes(data[offset:offset + 2], "little")
+        offset += 2
+        self.map_path = data[offset:offset + path_length].decode("utf-8") or None
+        self.data = data
+        self.records_offset = offset + path_length
+        self.checksum_interval = checksum_interval
+        self.seed = seed
+        self.world_size = (width, height)
+        self.mismatches = []
+        self.checkpoints = 0
+        self.ticks = 0
+        self.elapsed = 0.0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls(file.read())
+
+    def create_simulation(self):
+        tile_map = TileMap.from_file(self.map_path) if self.map_path else None
+        return Simulation(GameState(self.world_size, tile_map, seed=self.seed))
+
+    def run(self, simulation=None):
+        simulation = simulation or self.create_simulation()
+        game_state = simulation.game_state
+        data = self.data
+        offset = self.records_offset
+        inputs = {value: InputLog.decode_input(value) for value in range(32)}
+        start = perf_counter()
+        while offset < len(data):
+            tag = data[offset]
+            offset += 1
+            if tag == InputLog.TAG_INPUT:
+                (dx, dy), shoot = inputs[data[offset]]
+                count, offset = InputLog.decode_varint(data, offset + 1)
+                for _ in range(count):
+                    simulation.step(Vector2(dx, dy), shoot)
+                self.ticks += count
+            elif tag == InputLog.TAG_CHECKSUM:
+                epoch, expected = InputLog.CHECKSUM.unpack_from(data, offset)
+                offset += InputLog.CHECKSUM.size
+                self.checkpoints += 1
+                actual = game_state.checksum()
+                if game_state.epoch != epoch or actual != expected:
+                    self.mismatches.append((epoch, expected, actual))
+            elif tag == InputLog.TAG_END:
+                break
+            else:
+                raise ValueError(f"corrupt input log: unknown record tag {tag}")
+        self.elapsed = perf_counter() - start
+        return simulation
@@ -0,0 +1,5 @@
+from .InputLog import InputLog
+from .InputRecorder import InputRecorder
+from .ReplayPlayer import ReplayPlayer
+
+__all__ = ['InputLog', 'InputRecorder', 'ReplayPlayer']
@@ -0,0 +1,161 @@
+import multiprocessing
+import numpy as np
+from pygame import Vector2
+from .Simulation import Simulation
+from ..state.GameState import GameState
+from ..entities.Enemy import Enemy
+
+class BatchEnvironment:
+    """N independent simulations stepped together with stacked NumPy I/O.
+
+    step() takes an (N, 3) array of actions, one (dx, dy, shoot) row per
+    instance, and returns a dict of stacked observations:
+
+        units      (N, max_units, 5) float32: x, y, health, is_enemy, alive;
+                   row 0 is always the player, extra units are dropped
+        epoch      (N,) int64
+        done       (N,) bool, set once the player's health reaches 0
+        occupancy  (N, 3, H, W) float32, only with occupancy_shape=(H, W):
+                   fraction of impassable tiles, enemy count and bullet count
+                   per cell of a low-res grid over the world
+
+    Instances whose player has died are no longer stepped until reset().
+    With num_workers > 0 the instances are split into that many shards, each
+    stepped by its own worker process, so all cores are used.
+    """
+    UNIT_FEATURES = 5
+    OCCUPANCY_CHANNELS = 3
+
+    def __init__(self, num_envs, world_size=(16, 16), seed=0, max_units=16,
+                 occupancy_shape=None, num_workers=0):
+        self.num_envs = num_envs
+        self.world_size = world_size
+        self.seed = seed
+        self.max_units = max_units
+        self.occupancy_shape = occupancy_shape
+        self.num_workers = min(num_workers, num_envs)
+        self.simulations = []
+        self.workers = []
+        self.tile_occupancy = {}
+        if self.num_workers:
+            self.start_workers()
+        else:
+            self.reset()
+
+    def start_workers(self):
+        context = multiprocessing.get_context()
+        bounds = np.linspace(0, self.num_envs, self.num_workers + 1).astype(int)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            parent, child = context.Pipe()
+            options = dict(num_envs=int(end - start), world_size=self.world_size,
+                           seed=self.seed + int(start), max_units=self.max_units,
+                           occupancy_shape=self.occupancy_shape)
+            process = context.Process(target=run_shard, args=(child, options), daemon=True)
+            process.start()
+            child.close()
+            self.workers.append((parent, process, int(start), int(end)))
+
+    def reset(self):
+        if self.workers:
+            for connection, _, _, _ in self.workers:
+                connection.send(('reset', None))
+            return self.gather()
+        self.tile_occupancy.clear()
+        self.simulations = [Simulation(GameState(self.world_size, seed=self.seed + index))
+                            for index in range(self.num_envs)]
+        return self.observe()
+
+    def step(self, actions):
+        actions = np.asarray(actions, dtype=np.float64).reshape(self.num_envs, 3)
+        if self.workers:
+            for connection, _, start, end in self.workers:
+                connection.send(('step', actions[start:end]))
+            return self.gather()
+
+        directions = np.sign(actions[:, :2]).tolist()
+        shoots = (actions[:, 2] > 0).tolist()
+        for simulation, (dx, dy), shoot in zip(self.simulations, directions, shoots):
+            if simulation.game_state.player_unit.health > 0:
+                simulation.step(Vector2(dx, dy), shoot)
+        return self.observe()
+
+    def gather(self):
+        shards = [connection.recv() for connection, _, _, _ in self.workers]
+        return {key: np.concatenate([shard[key] for shard in shards]) for key in shards[0]}
+
+    def observe(self):
+        units = np.zeros((self.num_envs, self.max_units, self.UNIT_FEATURES), dtype=np.float32)
+        epochs = np.zeros(self.num_envs, dtype=np.int64)
+        done = np.zeros(self.num_envs, dtype=bool)
+        for index, simulation in enumerate(self.simulations):
+            game_state = simulation.game_state
+            player = game_state.player_unit
+            others = [unit for unit in game_state.units if unit is not player]
+            rows = [(unit.position.x, unit.position.y, unit.health, isinstance(unit, Enemy), 1.0)
+                    for unit in [player] + others[:self.max_units - 1]]
+            units[index, :len(rows)] = rows
+            units[index, 0, 4] = float(player in game_state.units)
+            epochs[index] = game_state.epoch
+            done[index] = player.health <= 0
+        observations = {'units': units, 'epoch': epochs, 'done': done}
+        if self.occupancy_shape is not None:
+            observations['occupancy'] = self.occupancy()
+        return observations
+
+    def occupancy(self):
+        height, width = self.occupancy_shape
+        grid = np.zeros((self.num_envs, self.OCCUPANCY_CHANNELS, height, width), dtype=np.float32)
+        for index, simulation in enumerate(self.simulations):
+            game_state = simulation.game_state
+            scale = (width / game_state.world_size.x, height / game_state.world_size.y)
+            grid[index, 0] = self.blocked_fraction(index, game_state.tile_map)
+            for channel, positions in ((1, [unit.position for unit in game_state.units if isinstance(unit, Enemy)]),
+                                       (2, [bullet.position for bullet in game_state.bullets])):
+                if not positions:
+                    continue
+                cells = np.array([(position.y * scale[1], position.x * scale[0]) for position in positions])
+                cells = np.clip(cells.astype(int), 0, (height - 1, width - 1))
+                np.add.at(grid[index, channel], (cells[:, 0], cells[:, 1]), 1)
+        return grid
+
+    def blocked_fraction(self, index, tile_map):
+        """Fraction of impassable tiles per occupancy cell, cached per map version."""
+        cached = self.tile_occupancy.get(index)
+        if cached is not None and cached[0] is tile_map and cached[1] == tile_map.version:
+            return cached[2]
+        height, width = self.occupancy_shape
+        blocked = (tile_map.cost_region(0, 0, tile_map.width, tile_map.height) <= 0).astype(np.float32)
+        rows = np.minimum(np.arange(tile_map.height) * height // tile_map.height, height - 1)
+        columns = np.minimum(np.arange(tile_map.width) * width // tile_map.width, width - 1)
+        sums = np.zeros((height, width), dtype=np.float32)
+        counts = np.zeros((height, width), dtype=np.float32)
+        np.add.at(sums, (rows[:, None], columns[None, :]), blocked)
+        np.add.at(counts, (rows[:, None], columns[None, :]), 1)
+        fraction = sums / np.maximum(counts, 1)
+        self.tile_occupancy[index] = (tile_map, tile_map.version, fraction)
+        return fraction
+
+    def close(self):
+        for connection, process, _, _ in self.workers:
+            connection.send(('close', None))
+            process.join(timeout=5)
+            connection.close()
+        self.workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def run_shard(connection, options):
+    environment = BatchEnvironment(**options)
+    while True:
+        command, data = connection.recv()
+        if command == 'step':
+            connection.send(environment.step(data))
+        elif command == 'reset':
+            connection.send(environment.reset())
+        elif command == 'close':
+            break
+    connection.close()
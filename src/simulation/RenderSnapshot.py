@@ -0,0 +1,96 @@
+from pygame import Vector2
+from ..entities.Enemy import Enemy
+from ..entities.Fireball import Fireball
+from ..entities.Player import Player
+
+class RenderSnapshot:
+    """Immutable copy of what the renderer needs from one simulation tick.
+
+    Units and bullets are tuples keyed by the id() of the simulated object,
+    particles a read-only array. time is when the tick was scheduled, so
+    consecutive snapshots are exactly one tick interval apart.
+    """
+    __slots__ = ('epoch', 'time', 'player', 'units', 'bullets', 'positions', 'particles')
+    # Moves longer than this (tiles) are shown as jumps rather than slides
+    MAX_INTERPOLATED_DISTANCE = 2.0
+
+    def __init__(self, epoch, time, player, units, bullets, particles):
+        self.epoch = epoch
+        self.time = time
+        self.player = player
+        self.units = units
+        self.bullets = bullets
+        self.particles = particles
+        self.positions = {entry[0]: (entry[2], entry[3]) for entry in units}
+        self.positions.update((entry[0], (entry[1], entry[2])) for entry in bullets)
+
+    @classmethod
+    def capture(cls, game_state, time):
+        units = tuple((id(unit), isinstance(unit, Enemy), unit.position.x, unit.position.y,
+                       unit.orientation.x, unit.orientation.y, unit.is_moving, unit.last_hit_epoch)
+                      for unit in game_state.units)
+        bullets = tuple((id(bullet), bullet.position.x, bullet.position.y, bullet.current_frame)
+                        for bullet in game_state.bullets if bullet.health != 0)
+        particles = game_state.particles
+        positions = particles.positions[:particles.count].copy()
+        positions.flags.writeable = False
+        player = id(game_state.player_unit) if game_state.player_unit.health > 0 else None
+        return cls(game_state.epoch, time, player, units, bullets, positions)
+
+    def position(self, key, x, y, previous, alpha):
+        if previous is None:
+            return Vector2(x, y)
+        start = previous.positions.get(key)
+        if start is None:
+            return Vector2(x, y)
+        dx, dy = x - start[0], y - start[1]
+        if abs(dx) > self.MAX_INTERPOLATED_DISTANCE or abs(dy) > self.MAX_INTERPOLATED_DISTANCE:
+            return Vector2(x, y)
+        return Vector2(start[0] + dx * alpha, start[1] + dy * alpha)
+
+    def apply(self, render_state, objects, previous=None, alpha=1.0):
+        """Fills render_state with entities blended alpha of the way from previous to this tick.
+
+        objects maps keys to the render-side entities reused across frames; it
+        is updated in place. Returns the player entity, or None if it's gone.
+        """
+        seen = set()
+        units = []
+        for key, is_enemy, x, y, orientation_x, orientation_y, is_moving, last_hit_epoch in self.units:
+            unit = objects.get(key)
+            if unit is None or isinstance(unit, Enemy) != is_enemy:
+                unit = objects[key] = (Enemy(render_state, Vector2(x, y)) if is_enemy else
+                                       Player(render_state, Vector2(x, y), Vector2(2, 0)))
+            unit.position = self.position(key, x, y, previous, alpha)
+            unit.orientation = Vector2(orientation_x, orientation_y)
+            unit.is_moving = is_moving
+            unit.last_hit_epoch = last_hit_epoch
+            units.append(unit)
+            seen.add(key)
+        bullets = []
+        for key, x, y, current_frame in self.bullets:
+            bullet = objects.get(key)
+            if not isinstance(bullet, Fireball):
+                bullet = objects[key] = Fireball.__new__(Fireball)
+                bullet.game_state = render_state
+                bullet.health = 100
+                bullet.last_hit_epoch = 0
+            bullet.position = self.position(key, x, y, previous, alpha)
+            bullet.current_frame = current_frame
+            bullet.tile = Fireball.animation_frames[current_frame]
+            bullets.append(bullet)
+            seen.add(key)
+        for key in [key for key in objects if key not in seen]:
+            del objects[key]
+
+        render_state.epoch = self.epoch
+        render_state.units[:] = units
+        render_state.bullets[:] = bullets
+        particles = render_state.particles
+        particles.reserve(len(self.particles))
+        particles.positions[:len(self.particles)] = self.particles
+        particles.count = len(self.particles)
+        player = objects.get(self.player) if self.player is not None else None
+        if player is not None:
+            render_state.player_unit = player
+        return player
@@ -0,0 +1,27 @@
+from pygame import Vector2
+
+class ScriptedInput:
+    """Replays a fixed list of (direction, shoot) inputs, one per tick.
+
+    When the script runs out it starts over if loop is True, otherwise it
+    keeps repeating the last input if hold_last is True, and otherwise the
+    player idles.
+    """
+    def __init__(self, script, loop=False, hold_last=False):
+        self.script = [(Vector2(direction), bool(shoot)) for direction, shoot in script]
+        self.loop = loop
+        self.hold_last = hold_last
+        self.index = 0
+
+    def __call__(self, epoch):
+        if self.index >= len(self.script):
+            if self.loop and self.script:
+                self.index = 0
+            elif self.hold_last and self.script:
+                direction, shoot = self.script[-1]
+                return direction.copy(), shoot
+            else:
+                return Vector2(0, 0), False
+        direction, shoot = self.script[self.index]
+        self.index += 1
+        return direction.copy(), shoot
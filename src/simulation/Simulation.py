@@ -0,0 +1,87 @@
+from time import perf_counter
+from pygame import Vector2
+from ..state.GameState import GameState
+from ..commands.MoveUnitCommand import MoveUnitCommand
+from ..commands.ShootCommand import ShootCommand
+from ..commands.MoveEnemiesCommand import MoveEnemiesCommand
+from ..commands.EnemyDamageCommand import EnemyDamageCommand
+from ..commands.MoveBulletsCommand import MoveBulletsCommand
+from ..commands.UpdateParticlesCommand import UpdateParticlesCommand
+from ..commands.DeleteDestroyedUnitsCommand import DeleteDestroyedUnitsCommand
+
+class Simulation:
+    """Advances a GameState one tick at a time without any display or frame cap.
+
+    Inputs are given per tick as a movement direction and a shoot flag, either
+    directly to step() or through an input source passed to run().
+    """
+    def __init__(self, game_state=None):
+        self.game_state = game_state if game_state is not None else GameState()
+        self.player_unit = self.game_state.player_unit
+        self.commands = []
+        self.profiler = None
+        self.recorder = None
+
+    def build_commands(self, direction, shoot, other_inputs=None):
+        inputs = [(self.player_unit, direction, shoot)]
+        if other_inputs:
+            inputs.extend((player, player_direction, player_shoot)
+                          for player, (player_direction, player_shoot) in other_inputs.items())
+        for player, player_direction, player_shoot in inputs:
+            if player_shoot:
+                self.commands.append(ShootCommand(self.game_state, player, player.orientation))
+        for player, player_direction, _ in inputs:
+            self.commands.append(MoveUnitCommand(self.game_state, player, player_direction))
+
+        self.commands.extend([
+            MoveEnemiesCommand(self.game_state),
+            EnemyDamageCommand(self.game_state),
+            MoveBulletsCommand(self.game_state),
+            UpdateParticlesCommand(self.game_state.particles),
+            DeleteDestroyedUnitsCommand(self.game_state.bullets, self.game_state.bullet_pool.release),
+            DeleteDestroyedUnitsCommand(self.game_state.units, self.game_state.unindex_unit)
+        ])
+
+    def step(self, direction=None, shoot=False, other_inputs=None):
+        """Advances one tick; other_inputs maps further players to their (direction, shoot)."""
+        if direction is None:
+            direction = Vector2(0, 0)
+        if self.recorder is not None:
+            self.recorder.record_input(direction, shoot)
+        self.build_commands(direction, shoot, other_inputs)
+        if self.profiler is None:
+            for command in self.commands:
+                command.run()
+            self.game_state.events.flush()
+        else:
+            self.run_profiled(self.profiler)
+        self.commands.clear()
+        self.game_state.epoch += 1
+        if self.recorder is not None:
+            self.recorder.record_tick()
+
+    def run_profiled(self, profiler):
+        frame = profiler.begin_frame(self.game_state.epoch)
+        allocations_before = self.game_state.allocation_stats()
+        for command in self.commands:
+            start = perf_counter()
+            command.run()
+            profiler.record('command', type(command).__name__, start, perf_counter())
+        start = perf_counter()
+        self.game_state.events.flush()
+        profiler.record('events', 'EventBus.flush', start, perf_counter())
+        profiler.record('tick', 'Simulation.step', frame['start'], perf_counter())
+        game_state = self.game_state
+        profiler.record_counts(units=len(game_state.units), bullets=len(game_state.bullets),
+                               particles=len(game_state.particles), quality=game_state.quality.level)
+        allocations = game_state.allocation_stats()
+        profiler.record_counts(**{name: allocations[name] - allocations_before[name] for name in allocations})
+
+    def run(self, ticks, input_source=None):
+        """Runs ticks steps; input_source(epoch) returns (direction, shoot) for each."""
+        for _ in range(ticks):
+            if input_source is None:
+                self.step()
+            else:
+                direction, shoot = input_source(self.game_state.epoch)
+                self.step(direction, shoot)
@@ -0,0 +1,72 @@
+import threading
+import time
+from pygame import Vector2
+from .RenderSnapshot import RenderSnapshot
+
+class SimulationThread(threading.Thread):
+    """Steps a Simulation at a fixed tick_rate on its own thread.
+
+    After every tick it publishes a RenderSnapshot; the render loop reads
+    the last two with interpolate() and never touches the live GameState,
+    so slow frames cannot change game speed. If the simulation itself falls
+    more than max_catch_up ticks behind, the backlog is dropped instead of
+    run in a burst.
+    """
+    def __init__(self, simulation, tick_rate=60, max_catch_up=5):
+        super().__init__(name='simulation', daemon=True)
+        self.simulation = simulation
+        self.tick_rate = tick_rate
+        self.interval = 1 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.direction = Vector2(0, 0)
+        self.shoot = False
+        # Guards the direction and shoot latch, written by the UI thread
+        self.input_lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.ticks = 0
+        self.dropped_ticks = 0
+        # (previous, latest), replaced as a whole so readers see a consistent pair
+        self.snapshots = (None, RenderSnapshot.capture(simulation.game_state, time.perf_counter()))
+
+    def set_input(self, direction, shoot):
+        with self.input_lock:
+            self.direction = Vector2(direction)
+            # Latched until a tick consumes it, so a tap between ticks still fires
+            self.shoot = self.shoot or shoot
+
+    def take_input(self):
+        with self.input_lock:
+            shoot = self.shoot
+            self.shoot = False
+            return self.direction, shoot
+
+    def run(self):
+        next_tick = time.perf_counter()
+        while not self.stopping.is_set():
+            now = time.perf_counter()
+            if now < next_tick:
+                self.stopping.wait(next_tick - now)
+                continue
+            behind = int((now - next_tick) / self.interval)
+            if behind > self.max_catch_up:
+                self.dropped_ticks += behind - self.max_catch_up
+                next_tick += (behind - self.max_catch_up) * self.interval
+            self.simulation.step(*self.take_input())
+            self.ticks += 1
+            self.snapshots = (self.snapshots[1], RenderSnapshot.capture(self.simulation.game_state, next_tick))
+            next_tick += self.interval
+
+    def stop(self, timeout=1):
+        self.stopping.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def interpolate(self, render_state, objects, now=None):
+        """Applies the state one tick interval before now, blended between the last two snapshots."""
+        previous, latest = self.snapshots
+        if previous is None:
+            return latest.apply(render_state, objects)
+        if now is None:
+            now = time.perf_counter()
+        alpha = (now - self.interval - previous.time) / (latest.time - previous.time)
+        return latest.apply(render_state, objects, previous, min(max(alpha, 0.0), 1.0))
@@ -0,0 +1,7 @@
+from .Simulation import Simulation
+from .ScriptedInput import ScriptedInput
+from .BatchEnvironment import BatchEnvironment
+from .RenderSnapshot import RenderSnapshot
+from .SimulationThread import SimulationThread
+
+__all__ = ['Simulation', 'ScriptedInput', 'BatchEnvironment', 'RenderSnapshot', 'SimulationThread']
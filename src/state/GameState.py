@@ -1,53 +1,140 @@
 from pygame import Vector2
 import random
+import secrets
+import struct
+import zlib
+import numpy as np
 from ..entities.Player import Player
 from ..entities.Enemy import Enemy
+from ..entities.Fireball import Fireball
+from ..entities.ObjectPool import ObjectPool
+from ..entities.ParticleSystem import ParticleSystem
+from .SpatialHash import SpatialHash
+from .TileMap import TileMap
+from .QualityGovernor import QualityGovernor
+from ..ai.FlowField import FlowField
+from ..ai.AIScheduler import AIScheduler
+from ..events.EventBus import EventBus
+from ..events.UnitMoved import UnitMoved
+from ..events.UnitStopped import UnitStopped
 
 class GameState:
-    def __init__(self):
+    def __init__(self, world_size=(16, 16), tile_map=None, seed=None):
         self.epoch = 0
-        self.world_size = Vector2(16, 16)
+        # All simulation randomness comes from these two generators so that a
+        # seed plus the per-tick inputs reproduces a session exactly
+        self.seed = secrets.randbits(32) if seed is None else seed
+        self.random = random.Random(self.seed)
+        self.np_random = np.random.default_rng(self.seed)
+        if tile_map is None:
+            tile_map = TileMap(int(world_size[0]), int(world_size[1]), seed=self.seed)
+            tile_map.generate_simple_map()
+        self.tile_map = tile_map
+        self.world_size = Vector2(tile_map.width, tile_map.height)
+        self.flow_field = FlowField(self.tile_map)
+        self.ai_scheduler = AIScheduler()
+        # Optional ai.PathService; without one, replans run inline within the scheduler's budget
+        self.path_service = None
+        self.spatial_index = SpatialHash()
+        self.units = []
         self.player_unit = Player(self, Vector2(5, 4), Vector2(2, 0))
-        self.units = [
-            self.player_unit,
-            Enemy(self, Vector2(14, 14)),
-            Enemy(self, Vector2(2, 14)),
-            Enemy(self, Vector2(7, 12)),
-            Enemy(self, Vector2(10, 1)),
-        ]
+        self.add_unit(self.player_unit)
+        # Every Player-controlled unit; enemies only chase player_unit
+        self.players = [self.player_unit]
+        for position in [Vector2(14, 14), Vector2(2, 14), Vector2(7, 12), Vector2(10, 1)]:
+            self.add_unit(Enemy(self, position))
         self.bullets = []
-        self.particles = []
-        self.observers = []
+        self.bullet_pool = ObjectPool(Fireball)
+        self.particles = ParticleSystem(self)
+        # Fed frame times by the UI; scales cosmetic effects only
+        self.quality = QualityGovernor()
+        # Queued during the tick and delivered in batches by Simulation.step
+        self.events = EventBus()
     
     def add_observer(self, observer):
-        self.observers.append(observer)
+        observer.subscribe(self.events)
 
     def notify_unit_move(self, unit, direction):
-        for observer in self.observers:
-            observer.on_unit_move(unit, direction)
+        self.events.publish(UnitMoved(unit, direction))
     
     def notify_unit_stop(self, unit):
-        for observer in self.observers:
-            observer.on_unit_stop(unit)
+        self.events.publish(UnitStopped(unit))
+
+    def add_unit(self, unit):
+        self.units.append(unit)
+        self.spatial_index.insert(unit)
+
+    def add_player(self, position=None):
+        """Adds another player, by default at a free tile near the first player's start."""
+        if position is None:
+            position = self.free_position_near(Vector2(5, 4))
+        player = Player(self, position, Vector2(2, 0))
+        self.add_unit(player)
+        self.players.append(player)
+        return player
+
+    def remove_player(self, player):
+        player.health = 0
+        if player in self.players and player is not self.player_unit:
+            self.players.remove(player)
+
+    def free_position_near(self, center):
+        for radius in range(int(max(self.world_size.x, self.world_size.y))):
+            for dy in range(-radius, radius + 1):
+                for dx in range(-radius, radius + 1):
+                    position = Vector2(center.x + dx, center.y + dy)
+                    if (max(abs(dx), abs(dy)) == radius and self.is_inside_world(position) and
+                            self.tile_map.is_passable(int(position.x), int(position.y)) and
+                            not self.check_unit_collision(position)):
+                        return position
+        return Vector2(center)
+
+    def unindex_unit(self, unit):
+        self.spatial_index.remove(unit)
+        self.events.forget(UnitStopped(unit).key)
+
+    def move_unit(self, unit, position):
+        position.x = max(0, min(position.x, self.world_size.x - 1))
+        position.y = max(0, min(position.y, self.world_size.y - 1))
+        unit.position = position
+        self.spatial_index.move(unit)
     
-    def check_unit_collision(self, position):
-        for unit in self.units:
-            if unit.health == 0:
-                continue
-            if position.distance_to(unit.position) < 1:
-                return unit
-        return None
+    def check_unit_collision(self, position, radius=1, exclude=None):
+        return self.spatial_index.nearest(
+            position, radius, lambda unit: unit.health != 0 and unit is not exclude)
     
     def spawn_enemy(self):
         while True:
             random_pos = Vector2(
-                random.randint(0, int(self.world_size.x - 1)),
-                random.randint(0, int(self.world_size.y - 1))
+                self.random.randint(0, int(self.world_size.x - 1)),
+                self.random.randint(0, int(self.world_size.y - 1))
             )
             if not self.check_unit_collision(random_pos):
-                self.units.append(Enemy(self, random_pos))
+                self.add_unit(Enemy(self, random_pos))
                 break
 
+    def allocation_stats(self):
+        """Cumulative allocation counters for short-lived entities."""
+        return {
+            'bullets_created': self.bullet_pool.created,
+            'bullets_reused': self.bullet_pool.reused,
+            'particle_reallocations': self.particles.reallocations,
+            'particles_evicted': self.particles.evicted,
+        }
+
     def is_inside_world(self, position):
         return (0 <= position.x < self.world_size.x and 
-                0 <= position.y < self.world_size.y)
\ No newline at end of file
+                0 <= position.y < self.world_size.y)
+
+
+    def checksum(self):
+        """CRC32 over the gameplay-relevant state, for spotting divergence."""
+        checksum = zlib.crc32(struct.pack("<qiii", self.epoch, len(self.units), len(self.bullets), len(self.particles)))
+        for unit in self.units:
+            checksum = zlib.crc32(struct.pack("<ddii", unit.position.x, unit.position.y,
+                                              unit.health, unit.last_hit_epoch), checksum)
+        for bullet in self.bullets:
+            checksum = zlib.crc32(struct.pack("<ddi", bullet.position.x, bullet.position.y, bullet.health), checksum)
+        particles = self.particles
+        checksum = zlib.crc32(particles.positions[:particles.count].tobytes(), checksum)
+        return zlib.crc32(particles.lifetimes[:particles.count].tobytes(), checksum)
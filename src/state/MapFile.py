@@ -0,0 +1,92 @@
+import mmap
+import struct
+import numpy as np
+
+class MapFile:
+    """Memory-mapped binary tile map.
+
+    Layout, all integers little-endian:
+
+        offset  size  field
+        0       8     magic b"RRPGMAP\\0"
+        8       2     format version (currently 1)
+        10      2     flags: bit 0 collision plane present,
+                             bit 1 cost plane present,
+                             bit 2 tile plane is uint16 (otherwise uint8)
+        12      4     width in tiles
+        16      4     height in tiles
+        20      44    reserved, zero
+
+    The header is followed by the planes, each a row-major width x height
+    grid starting at the next 64-byte aligned offset, in this order:
+
+        tiles      uint8 or uint16 tile index into the tileset
+        collision  uint8, non-zero marks the cell impassable
+        costs      uint8 movement cost, 0 means use the tile's default cost
+
+    The file is mapped copy-on-write, so every plane is a zero-copy NumPy
+    view and in-game edits never touch the file on disk.
+    """
+    MAGIC = b"RRPGMAP\0"
+    VERSION = 1
+    HEADER = struct.Struct("<8sHHII44x")
+    ALIGNMENT = 64
+    FLAG_COLLISION = 1
+    FLAG_COSTS = 2
+    FLAG_WIDE_TILES = 4
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, flags, width, height = self.HEADER.unpack_from(self.buffer, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a map file")
+        if version != self.VERSION:
+            raise ValueError(f"{path} has unsupported map format version {version}")
+        self.width = width
+        self.height = height
+        self.flags = flags
+
+        tile_dtype = np.dtype('<u2') if flags & self.FLAG_WIDE_TILES else np.uint8
+        offset = self.align(self.HEADER.size)
+        self.tiles, offset = self.plane(offset, tile_dtype)
+        self.collision = self.costs = None
+        if flags & self.FLAG_COLLISION:
+            self.collision, offset = self.plane(offset, np.uint8)
+        if flags & self.FLAG_COSTS:
+            self.costs, offset = self.plane(offset, np.uint8)
+
+    @classmethod
+    def align(cls, offset):
+        return (offset + cls.ALIGNMENT - 1) // cls.ALIGNMENT * cls.ALIGNMENT
+
+    def plane(self, offset, dtype):
+        count = self.width * self.height
+        if offset + count * np.dtype(dtype).itemsize > len(self.buffer):
+            raise ValueError("map file is truncated")
+        view = np.frombuffer(self.buffer, dtype=dtype, count=count, offset=offset)
+        end = offset + view.nbytes
+        return view.reshape(self.height, self.width), self.align(end)
+
+    @classmethod
+    def write(cls, path, tiles, collision=None, costs=None):
+        tiles = np.asarray(tiles)
+        height, width = tiles.shape
+        wide = tiles.max(initial=0) > 255
+        flags = ((cls.FLAG_COLLISION if collision is not None else 0) |
+                 (cls.FLAG_COSTS if costs is not None else 0) |
+                 (cls.FLAG_WIDE_TILES if wide else 0))
+        planes = [tiles.astype('<u2' if wide else np.uint8)]
+        for plane in (collision, costs):
+            if plane is not None:
+                plane = np.asarray(plane, dtype=np.uint8)
+                if plane.shape != tiles.shape:
+                    raise ValueError("all map planes must have the same shape")
+                planes.append(plane)
+
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, flags, width, height))
+            for plane in planes:
+                file.write(b"\0" * (cls.align(file.tell()) - file.tell()))
+                file.write(np.ascontiguousarray(plane).tobytes())
@@ -0,0 +1,50 @@
+from collections import deque
+
+class QualityGovernor:
+    """Scales cosmetic effects so frames stay within a time budget.
+
+    The render loop reports how long each frame's work took. Once window
+    frames are in, the mean is checked: over budget, level drops by step;
+    under headroom times the budget, it recovers by half a step. level
+    stays between min_level and 1, and commands and layers multiply
+    particle counts, particle lifetimes and the hit flash by it. Nothing
+    that affects gameplay is scaled. Nothing reports frames in headless
+    runs, so level stays at 1 and they remain deterministic.
+    """
+    def __init__(self, budget=1 / 60, window=15, step=0.25, min_level=0.25, headroom=0.6):
+        self.budget = budget
+        self.step = step
+        self.min_level = min_level
+        self.headroom = headroom
+        self.frame_times = deque(maxlen=window)
+        self.level = 1.0
+        self.enabled = True
+        self.frame_time = 0.0
+        self.adjustments = 0
+
+    def record_frame(self, seconds):
+        if not self.enabled:
+            return
+        frame_times = self.frame_times
+        frame_times.append(seconds)
+        if len(frame_times) < frame_times.maxlen:
+            return
+        self.frame_time = sum(frame_times) / len(frame_times)
+        frame_times.clear()
+        if self.frame_time > self.budget:
+            level = max(self.min_level, self.level - self.step)
+        elif self.frame_time < self.budget * self.headroom:
+            level = min(1.0, self.level + self.step / 2)
+        else:
+            return
+        if level != self.level:
+            self.level = level
+            self.adjustments += 1
+
+    def scale(self, value):
+        """Returns value scaled by the current level, rounded to an int."""
+        return value if self.level >= 1.0 else int(value * self.level + 0.5)
+
+    def stats(self):
+        return {'quality': self.level, 'frame_ms': round(self.frame_time * 1000, 2),
+                'quality_adjustments': self.adjustments}
@@ -0,0 +1,303 @@
+import struct
+import zlib
+import numpy as np
+from pygame import Vector2
+from ..entities.Enemy import Enemy
+from ..entities.Fireball import Fireball
+from ..entities.Player import Player
+
+class Snapshot:
+    """Packed binary snapshot of the mutable part of a GameState.
+
+    Layout, all values little-endian:
+
+        header     magic b"RRPGSNAP", format version u16, flags u16,
+                   seed u64, epoch i64, tile map version u32,
+                   unit, path cell, bullet and particle counts u32,
+                   player index i32 (-1 when removed), AI scheduler next
+                   offset u32, replan queue length u32 and pending path
+                   request count u32
+        random     random.Random state: 625 u32 words, gauss flag u32 and
+                   gauss value f64
+        np_random  PCG64 state and increment as 16-byte integers,
+                   has_uint32 u32, uinteger u32
+        units      f64 rows of UNIT_FIELDS; kind is 0 for player_unit, 1 for
+                   an enemy and 2 for any other player
+        paths      i32 (x, y) cells of every enemy path, concatenated
+        bullets    f64 rows of BULLET_FIELDS; the owner is a unit index
+        particles  f32 positions, i32 lifetimes, i32 next move times
+        queue      i32 unit indices of the AI replan queue
+        requests   i32 rows of (unit index, start x, start y, goal x, goal
+                   y, due epoch) for the PathService's pending requests
+
+    The tile map is not included; restoring onto a map whose version differs
+    raises ValueError. Pending path requests are resubmitted to the target
+    GameState's PathService, or dropped if it has none. Derived state (spatial index, flow field, queued
+    events) is rebuilt or dropped. The player object is restored in place so
+    references held by the Simulation and UI stay valid; enemies and bullets
+    reuse existing objects where possible.
+
+    delta() XORs a snapshot against an earlier one and compresses the result,
+    which is small when little changed between the two.
+    """
+    MAGIC = b"RRPGSNAP"
+    VERSION = 2
+    HEADER = struct.Struct("<8sHHQqIIIIIiIII")
+    RANDOM = struct.Struct("<625IId")
+    NP_RANDOM = struct.Struct("<16s16sII")
+    DELTA_HEADER = struct.Struct("<I")
+    UNIT_FIELDS = ('kind', 'x', 'y', 'health', 'tile_x', 'tile_y', 'last_hit_epoch', 'velocity',
+                   'last_bullet_epoch', 'orientation_x', 'orientation_y', 'is_moving',
+                   'last_path_update', 'path_expansions', 'ai_offset', 'last_ai_update', 'path_length')
+    BULLET_FIELDS = ('owner', 'x', 'y', 'direction_x', 'direction_y', 'start_x', 'start_y', 'velocity',
+                     'range', 'damage', 'current_frame', 'health', 'last_hit_epoch')
+    KIND_PLAYER = 0
+    KIND_ENEMY = 1
+    KIND_OTHER_PLAYER = 2
+
+    @classmethod
+    def capture(cls, game_state):
+        units = game_state.units
+        player = game_state.player_unit
+        unit_indices = {unit: index for index, unit in enumerate(units)}
+        scheduler = game_state.ai_scheduler
+
+        unit_rows = []
+        paths = []
+        for unit in units:
+            if isinstance(unit, Enemy):
+                unit_rows.append((cls.KIND_ENEMY, unit.position.x, unit.position.y, unit.health,
+                                  unit.tile.x, unit.tile.y, unit.last_hit_epoch, unit.velocity,
+                                  unit.last_bullet_epoch, unit.orientation.x, unit.orientation.y, unit.is_moving,
+                                  unit.last_path_update, unit.path_expansions,
+                                  -1 if unit.ai_offset is None else unit.ai_offset, unit.last_ai_update,
+                                  len(unit.path)))
+                paths.extend(unit.path)
+            else:
+                kind = cls.KIND_PLAYER if unit is player else cls.KIND_OTHER_PLAYER
+                unit_rows.append((kind, unit.position.x, unit.position.y, unit.health,
+                                  unit.tile.x, unit.tile.y, unit.last_hit_epoch, unit.velocity,
+                                  unit.last_bullet_epoch, unit.orientation.x, unit.orientation.y, unit.is_moving,
+                                  0, 0, -1, 0, 0))
+        bullet_rows = [(unit_indices.get(bullet.unit, -1), bullet.position.x, bullet.position.y,
+                        bullet.direction.x, bullet.direction.y, bullet.start_position.x, bullet.start_position.y,
+                        bullet.velocity, bullet.range, bullet.damage, bullet.current_frame,
+                        bullet.health, bullet.last_hit_epoch) for bullet in game_state.bullets]
+        particles = game_state.particles
+        count = particles.count
+        queue = [unit_indices[enemy] for enemy in scheduler.replan_queue if enemy in unit_indices]
+        requests = []
+        if game_state.path_service is not None:
+            requests = [(unit_indices[enemy], start[0], start[1], goal[0], goal[1], due)
+                        for enemy, start, goal, due in game_state.path_service.pending_requests()
+                        if enemy in unit_indices]
+
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, game_state.seed, game_state.epoch,
+                                 game_state.tile_map.version, len(units), len(paths),
+                                 len(bullet_rows), count, unit_indices.get(player, -1),
+                                 scheduler.next_offset, len(queue), len(requests))
+        return b''.join((
+            header,
+            cls.pack_random(game_state.random),
+            cls.pack_np_random(game_state.np_random),
+            np.array(unit_rows, dtype='<f8').reshape(-1, len(cls.UNIT_FIELDS)).tobytes(),
+            np.array(paths, dtype='<i4').reshape(-1, 2).tobytes(),
+            np.array(bullet_rows, dtype='<f8').reshape(-1, len(cls.BULLET_FIELDS)).tobytes(),
+            particles.positions[:count].astype('<f4', copy=False).tobytes(),
+            particles.lifetimes[:count].astype('<i4', copy=False).tobytes(),
+            particles.next_move_times[:count].astype('<i4', copy=False).tobytes(),
+            np.array(queue, dtype='<i4').tobytes(),
+            np.array(requests, dtype='<i4').reshape(-1, 6).tobytes(),
+        ))
+
+    @classmethod
+    def restore(cls, game_state, data):
+        if len(data) < cls.HEADER.size:
+            raise ValueError("snapshot is truncated")
+        (magic, version, _, seed, epoch, map_version, unit_count, path_cells, bullet_count,
+         particle_count, player_index, next_offset, queue_length, request_count) = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC:
+            raise ValueError("not a game state snapshot")
+        if version != cls.VERSION:
+            raise ValueError(f"unsupported snapshot format version {version}")
+        if map_version != game_state.tile_map.version:
+            raise ValueError(f"snapshot was taken on tile map version {map_version}, "
+                             f"the map is at version {game_state.tile_map.version}")
+        expected = (cls.HEADER.size + cls.RANDOM.size + cls.NP_RANDOM.size +
+                    8 * (unit_count * len(cls.UNIT_FIELDS) + bullet_count * len(cls.BULLET_FIELDS)) +
+                    8 * path_cells + 16 * particle_count + 4 * queue_length + 24 * request_count)
+        if len(data) != expected:
+            raise ValueError("snapshot is truncated")
+
+        offset = cls.HEADER.size
+        cls.unpack_random(game_state.random, data, offset)
+        offset += cls.RANDOM.size
+        cls.unpack_np_random(game_state.np_random, data, offset)
+        offset += cls.NP_RANDOM.size
+        unit_rows, offset = cls.section(data, offset, '<f8', (unit_count, len(cls.UNIT_FIELDS)))
+        paths, offset = cls.section(data, offset, '<i4', (path_cells, 2))
+        bullet_rows, offset = cls.section(data, offset, '<f8', (bullet_count, len(cls.BULLET_FIELDS)))
+        positions, offset = cls.section(data, offset, '<f4', (particle_count, 2))
+        lifetimes, offset = cls.section(data, offset, '<i4', (particle_count,))
+        next_move_times, offset = cls.section(data, offset, '<i4', (particle_count,))
+        queue, offset = cls.section(data, offset, '<i4', (queue_length,))
+        requests, offset = cls.section(data, offset, '<i4', (request_count, 6))
+
+        game_state.seed = seed
+        game_state.epoch = epoch
+        units = cls.restore_units(game_state, unit_rows, paths, player_index)
+        cls.restore_bullets(game_state, bullet_rows.tolist(), units)
+
+        particles = game_state.particles
+        particles.reserve(particle_count)
+        particles.count = particle_count
+        particles.positions[:particle_count] = positions
+        particles.lifetimes[:particle_count] = lifetimes
+        particles.next_move_times[:particle_count] = next_move_times
+
+        scheduler = game_state.ai_scheduler
+        scheduler.next_offset = next_offset
+        scheduler.replan_queue.clear()
+        scheduler.replan_queue.extend(units[index] for index in queue.tolist())
+        scheduler.queued = set(scheduler.replan_queue)
+        path_service = game_state.path_service
+        if path_service is not None:
+            path_service.drop_pending()
+            for index, start_x, start_y, goal_x, goal_y, due in requests.tolist():
+                path_service.submit(units[index], (start_x, start_y), (goal_x, goal_y), due)
+        game_state.events.clear()
+
+    @classmethod
+    def restore_units(cls, game_state, rows, paths, player_index):
+        player = game_state.player_unit
+        spare = [unit for unit in game_state.units if isinstance(unit, Enemy)]
+        spare.reverse()
+        spare_players = [unit for unit in game_state.players if unit is not player]
+        spare_players.reverse()
+        players = [player]
+        units = []
+        # Viewed as (x, y) records so tolist() builds the cell tuples in one call
+        paths = paths.view('<i4,<i4').ravel().tolist()
+        path_start = 0
+        # Integer fields are read from a truncated copy instead of converting one by one
+        for row, integers in zip(rows.tolist(), rows.astype(np.int64).tolist()):
+            (kind, x, y, _, tile_x, tile_y, _, velocity, _,
+             orientation_x, orientation_y, _, _, _, _, _, _) = row
+            (_, _, _, health, _, _, last_hit_epoch, _, last_bullet_epoch,
+             _, _, is_moving, last_path_update, path_expansions,
+             ai_offset, last_ai_update, path_length) = integers
+            if kind == cls.KIND_PLAYER:
+                unit = player
+            elif kind == cls.KIND_OTHER_PLAYER:
+                unit = spare_players.pop() if spare_players else Player.__new__(Player)
+                unit.game_state = game_state
+                players.append(unit)
+            else:
+                unit = spare.pop() if spare else Enemy.__new__(Enemy)
+                unit.game_state = game_state
+                path_end = path_start + path_length
+                unit.path = paths[path_start:path_end]
+                path_start = path_end
+                unit.last_path_update = last_path_update
+                unit.path_expansions = path_expansions
+                unit.ai_offset = None if ai_offset < 0 else ai_offset
+                unit.last_ai_update = last_ai_update
+            unit.position = Vector2(x, y)
+            unit.health = health
+            unit.tile = Vector2(tile_x, tile_y)
+            unit.last_hit_epoch = last_hit_epoch
+            unit.velocity = velocity
+            unit.last_bullet_epoch = last_bullet_epoch
+            unit.orientation = Vector2(orientation_x, orientation_y)
+            unit.is_moving = is_moving != 0
+            units.append(unit)
+
+        if player_index < 0:
+            # The player was already removed from the unit list when captured
+            player.health = 0
+        game_state.units[:] = units
+        game_state.players[:] = players
+        game_state.spatial_index.rebuild(units, rows[:, 1:3])
+        return units
+
+    @classmethod
+    def restore_bullets(cls, game_state, rows, units):
+        pool = game_state.bullet_pool
+        for bullet in game_state.bullets:
+            pool.release(bullet)
+        bullets = []
+        for row in rows:
+            (owner, x, y, direction_x, direction_y, start_x, start_y, velocity, bullet_range,
+             damage, current_frame, health, last_hit_epoch) = row
+            bullet = pool.take() or Fireball.__new__(Fireball)
+            bullet.game_state = game_state
+            bullet.unit = units[int(owner)] if owner >= 0 else None
+            bullet.position = Vector2(x, y)
+            bullet.direction = Vector2(direction_x, direction_y)
+            bullet.start_position = Vector2(start_x, start_y)
+            bullet.velocity = velocity
+            bullet.range = bullet_range
+            bullet.damage = int(damage)
+            bullet.current_frame = int(current_frame)
+            bullet.tile = Fireball.animation_frames[bullet.current_frame]
+            bullet.health = int(health)
+            bullet.last_hit_epoch = int(last_hit_epoch)
+            bullets.append(bullet)
+        game_state.bullets[:] = bullets
+
+    @staticmethod
+    def section(data, offset, dtype, shape):
+        dtype = np.dtype(dtype)
+        count = shape[0] * shape[1] if len(shape) == 2 else shape[0]
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=offset).reshape(shape)
+        return array, offset + count * dtype.itemsize
+
+    @classmethod
+    def pack_random(cls, generator):
+        _, words, gauss = generator.getstate()
+        return cls.RANDOM.pack(*words, gauss is not None, 0.0 if gauss is None else gauss)
+
+    @classmethod
+    def unpack_random(cls, generator, data, offset):
+        values = cls.RANDOM.unpack_from(data, offset)
+        generator.setstate((3, values[:625], values[626] if values[625] else None))
+
+    @classmethod
+    def pack_np_random(cls, generator):
+        state = generator.bit_generator.state
+        if state['bit_generator'] != 'PCG64':
+            raise ValueError(f"cannot snapshot a {state['bit_generator']} generator")
+        return cls.NP_RANDOM.pack(state['state']['state'].to_bytes(16, 'little'),
+                                  state['state']['inc'].to_bytes(16, 'little'),
+                                  state['has_uint32'], state['uinteger'])
+
+    @classmethod
+    def unpack_np_random(cls, generator, data, offset):
+        state, inc, has_uint32, uinteger = cls.NP_RANDOM.unpack_from(data, offset)
+        generator.bit_generator.state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': int.from_bytes(state, 'little'), 'inc': int.from_bytes(inc, 'little')},
+            'has_uint32': has_uint32,
+            'uinteger': uinteger,
+        }
+
+    @classmethod
+    def delta(cls, base, data):
+        """Encodes data relative to base as a compressed XOR difference."""
+        size = len(data)
+        padded = np.zeros(size, dtype=np.uint8)
+        shared = min(size, len(base))
+        padded[:shared] = np.frombuffer(base, dtype=np.uint8, count=shared)
+        difference = np.bitwise_xor(np.frombuffer(data, dtype=np.uint8), padded)
+        return cls.DELTA_HEADER.pack(size) + zlib.compress(difference.tobytes(), 1)
+
+    @classmethod
+    def apply_delta(cls, base, delta):
+        (size,) = cls.DELTA_HEADER.unpack_from(delta, 0)
+        difference = np.frombuffer(zlib.decompress(delta[cls.DELTA_HEADER.size:]), dtype=np.uint8)
+        if len(difference) != size:
+            raise ValueError("delta is corrupt")
+        padded = np.zeros(size, dtype=np.uint8)
+        shared = min(size, len(base))
+        padded[:shared] = np.frombuffer(base, dtype=np.uint8, count=shared)
+        return np.bitwise_xor(difference, padded).tobytes()
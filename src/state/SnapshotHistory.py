@@ -0,0 +1,72 @@
+from collections import deque
+import zlib
+from .Snapshot import Snapshot
+
+class SnapshotHistory:
+    """Ring buffer of recent GameState snapshots for rollback.
+
+    Every keyframe_interval-th push stores a compressed full snapshot; the
+    others store a Snapshot.delta against the previous push. Entries are
+    evicted a keyframe group at a time once more than capacity are held, so
+    every remaining delta can still be resolved.
+    """
+    def __init__(self, capacity=600, keyframe_interval=60):
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        # Each group is [keyframe entry, delta entries...]; an entry is (epoch, bytes)
+        self.groups = deque()
+        self.count = 0
+        self.previous = None
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        return sum(len(data) for group in self.groups for _, data in group)
+
+    def epochs(self):
+        return [epoch for group in self.groups for epoch, _ in group]
+
+    def push(self, game_state):
+        data = Snapshot.capture(game_state)
+        if not self.groups or len(self.groups[-1]) >= self.keyframe_interval:
+            self.groups.append([(game_state.epoch, zlib.compress(data, 1))])
+        else:
+            self.groups[-1].append((game_state.epoch, Snapshot.delta(self.previous, data)))
+        self.previous = data
+        self.count += 1
+        while self.count > self.capacity and len(self.groups) > 1:
+            self.count -= len(self.groups.popleft())
+
+    def get(self, epoch):
+        """Returns the full snapshot bytes taken at epoch."""
+        for group in self.groups:
+            if group[0][0] <= epoch <= group[-1][0]:
+                data = zlib.decompress(group[0][1])
+                if group[0][0] == epoch:
+                    return data
+                for entry_epoch, delta in group[1:]:
+                    if entry_epoch > epoch:
+                        break
+                    data = Snapshot.apply_delta(data, delta)
+                    if entry_epoch == epoch:
+                        return data
+        raise KeyError(f"no snapshot for epoch {epoch}")
+
+    def rollback(self, game_state, epoch):
+        """Restores game_state to epoch and forgets every later snapshot."""
+        data = self.get(epoch)
+        Snapshot.restore(game_state, data)
+        while self.groups and self.groups[-1][0][0] > epoch:
+            self.count -= len(self.groups.pop())
+        group = self.groups[-1]
+        while group[-1][0] > epoch:
+            group.pop()
+            self.count -= 1
+        self.previous = data
+
+    def clear(self):
+        self.groups.clear()
+        self.count = 0
+        self.previous = None
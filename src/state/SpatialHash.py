@@ -0,0 +1,98 @@
+from math import floor
+import numpy as np
+
+class SpatialHash:
+    """Uniform grid index over unit positions.
+
+    Each unit is bucketed by the cell containing its position. move() must be
+    called whenever a unit's position changes so its bucket stays current;
+    GameState.move_unit does this for all simulation code.
+    """
+    def __init__(self, cell_size=1.0):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.unit_cells = {}
+
+    def __len__(self):
+        return len(self.unit_cells)
+
+    def __contains__(self, unit):
+        return unit in self.unit_cells
+
+    def cell_of(self, position):
+        return (floor(position[0] / self.cell_size), floor(position[1] / self.cell_size))
+
+    def insert(self, unit):
+        cell = self.cell_of(unit.position)
+        self.unit_cells[unit] = cell
+        self.cells.setdefault(cell, []).append(unit)
+
+    def remove(self, unit):
+        cell = self.unit_cells.pop(unit, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        bucket.remove(unit)
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, unit):
+        old_cell = self.unit_cells.get(unit)
+        new_cell = self.cell_of(unit.position)
+        if old_cell == new_cell:
+            return
+        if old_cell is not None:
+            self.remove(unit)
+        self.unit_cells[unit] = new_cell
+        self.cells.setdefault(new_cell, []).append(unit)
+
+    def clear(self):
+        self.cells.clear()
+        self.unit_cells.clear()
+
+    def rebuild(self, units, positions):
+        """Replaces the index with units at positions, an (n, 2) array, binned in one pass."""
+        cells = np.floor(np.asarray(positions, dtype=np.float64) / self.cell_size).astype(np.int64).tolist()
+        self.unit_cells = dict(zip(units, map(tuple, cells)))
+        self.cells = buckets = {}
+        for unit, cell in self.unit_cells.items():
+            bucket = buckets.get(cell)
+            if bucket is None:
+                buckets[cell] = [unit]
+            else:
+                bucket.append(unit)
+
+    def candidates(self, min_x, min_y, max_x, max_y):
+        """Yields every unit bucketed in a cell overlapping the given box."""
+        cell_x0, cell_y0 = self.cell_of((min_x, min_y))
+        cell_x1, cell_y1 = self.cell_of((max_x, max_y))
+        cells = self.cells
+        for cell_y in range(cell_y0, cell_y1 + 1):
+            for cell_x in range(cell_x0, cell_x1 + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    yield from bucket
+
+    def query_radius(self, position, radius, predicate=None):
+        x, y = position[0], position[1]
+        radius_squared = radius * radius
+        result = []
+        for unit in self.candidates(x - radius, y - radius, x + radius, y + radius):
+            dx = unit.position.x - x
+            dy = unit.position.y - y
+            if dx * dx + dy * dy < radius_squared and (predicate is None or predicate(unit)):
+                result.append(unit)
+        return result
+
+    def nearest(self, position, radius, predicate=None):
+        x, y = position[0], position[1]
+        best = None
+        best_distance = radius * radius
+        for unit in self.candidates(x - radius, y - radius, x + radius, y + radius):
+            dx = unit.position.x - x
+            dy = unit.position.y - y
+            distance = dx * dx + dy * dy
+            if distance < best_distance and (predicate is None or predicate(unit)):
+                best = unit
+                best_distance = distance
+        return best
@@ -0,0 +1,194 @@
+import secrets
+import threading
+from collections import OrderedDict
+import numpy as np
+from .MapFile import MapFile
+
+class TileMap:
+    """Grid of tile indices into the tileset, plus per-tile movement costs.
+
+    The map is stored as fixed-size square chunks that are generated on
+    first access and kept in an LRU of at most max_loaded_chunks, so memory
+    stays bounded whatever the world size. Chunks are generated from a
+    per-chunk seed, so an evicted chunk comes back identical; chunks changed
+    with set_tile are never evicted.
+
+    A map loaded with from_file is instead backed by a memory-mapped MapFile:
+    tiles is then a view of the whole file, chunks are views into it, and
+    nothing is generated or evicted.
+
+    TILE_COSTS is indexed by tile index (indices past its end cost as the
+    last entry); a cost of 0 marks the tile as impassable. Optional
+    collision and cost planes from a map file override it per cell. version
+    is bumped on every change so cached data derived from the map (flow
+    fields, rendered backgrounds) knows to rebuild.
+
+    The renderer and a simulation thread may share one map, so the chunk
+    LRU is guarded by a lock.
+    """
+    TILE_COSTS = np.array([1, 1], dtype=np.float32)
+
+    def __init__(self, width, height, chunk_size=32, max_loaded_chunks=256, seed=None):
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.max_loaded_chunks = max_loaded_chunks
+        self.seed = secrets.randbits(32) if seed is None else seed
+        self.generator = None
+        self.chunks = OrderedDict()
+        self.modified = set()
+        self.lock = threading.RLock()
+        self.version = 0
+        self.chunks_generated = 0
+        # Whole-map arrays, only set for maps loaded from a file
+        self.tiles = None
+        self.collision = None
+        self.cost_plane = None
+        self.map_file = None
+
+    @classmethod
+    def from_file(cls, path, chunk_size=32):
+        map_file = MapFile(path)
+        tile_map = cls(map_file.width, map_file.height, chunk_size=chunk_size)
+        tile_map.map_file = map_file
+        tile_map.tiles = map_file.tiles
+        tile_map.collision = map_file.collision
+        tile_map.cost_plane = map_file.costs
+        return tile_map
+
+    def __getstate__(self):
+        """Pickles the map as a recipe, for worker processes.
+
+        Generated chunks are left out and regenerated from the seed on the
+        other side; a file-backed map that hasn't been edited is reopened by
+        path rather than copied.
+        """
+        state = self.__dict__.copy()
+        del state['lock']
+        state['chunks'] = OrderedDict((key, chunk) for key, chunk in self.chunks.items() if key in self.modified)
+        if self.map_file is not None:
+            state['map_file'] = None
+            if self.version == 0:
+                state['tiles'] = state['collision'] = state['cost_plane'] = None
+                state['map_path'] = self.map_file.path
+        return state
+
+    def __setstate__(self, state):
+        map_path = state.pop('map_path', None)
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+        if map_path is not None:
+            self.map_file = MapFile(map_path)
+            self.tiles = self.map_file.tiles
+            self.collision = self.map_file.collision
+            self.cost_plane = self.map_file.costs
+
+    def save(self, path):
+        MapFile.write(path, self.region(0, 0, self.width, self.height),
+                      self.collision, self.cost_plane)
+
+    def generate_simple_map(self):
+        self.generator = self.generate_simple_chunk
+        with self.lock:
+            for key in [key for key in self.chunks if key not in self.modified]:
+                del self.chunks[key]
+        self.version += 1
+
+    def generate_simple_chunk(self, chunk_x, chunk_y):
+        rng = np.random.default_rng((self.seed, chunk_x, chunk_y))
+        return (rng.random((self.chunk_size, self.chunk_size)) < 0.1).astype(np.uint8)
+
+    def chunk(self, chunk_x, chunk_y):
+        if self.tiles is not None:
+            size = self.chunk_size
+            return self.tiles[chunk_y * size:(chunk_y + 1) * size, chunk_x * size:(chunk_x + 1) * size]
+        key = (chunk_x, chunk_y)
+        with self.lock:
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                self.chunks.move_to_end(key)
+                return chunk
+            if self.generator is None:
+                chunk = np.zeros((self.chunk_size, self.chunk_size), dtype=np.uint8)
+            else:
+                chunk = self.generator(chunk_x, chunk_y)
+            self.chunks_generated += 1
+            self.chunks[key] = chunk
+            self.evict()
+            return chunk
+
+    def evict(self):
+        with self.lock:
+            excess = len(self.chunks) - self.max_loaded_chunks
+            if excess <= 0:
+                return
+            for key in [key for key in self.chunks if key not in self.modified][:excess]:
+                del self.chunks[key]
+
+    def stream(self, x0, y0, x1, y1, margin=1):
+        """Loads every chunk overlapping tiles [x0, x1) x [y0, y1), plus margin chunks around them."""
+        size = self.chunk_size
+        max_chunk_x = (self.width - 1) // size
+        max_chunk_y = (self.height - 1) // size
+        for chunk_y in range(max(0, y0 // size - margin), min(max_chunk_y, (y1 - 1) // size + margin) + 1):
+            for chunk_x in range(max(0, x0 // size - margin), min(max_chunk_x, (x1 - 1) // size + margin) + 1):
+                self.chunk(chunk_x, chunk_y)
+
+    def tile(self, x, y):
+        size = self.chunk_size
+        return self.chunk(x // size, y // size)[y % size, x % size]
+
+    def set_tile(self, x, y, tile):
+        if self.tiles is not None:
+            self.tiles[y, x] = tile
+            self.version += 1
+            return
+        size = self.chunk_size
+        with self.lock:
+            # Marked modified before the lock is released, so it can't be evicted with the edit
+            self.chunk(x // size, y // size)[y % size, x % size] = tile
+            self.modified.add((x // size, y // size))
+        self.version += 1
+
+    def tile_costs(self, tiles):
+        return np.take(self.TILE_COSTS, tiles, mode='clip')
+
+    def cost(self, x, y):
+        if self.collision is not None and self.collision[y, x]:
+            return 0
+        if self.cost_plane is not None and self.cost_plane[y, x]:
+            return self.cost_plane[y, x]
+        return self.TILE_COSTS[min(self.tile(x, y), len(self.TILE_COSTS) - 1)]
+
+    def is_passable(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.cost(x, y) > 0
+
+    def region(self, x0, y0, x1, y1):
+        """Returns tiles [x0, x1) x [y0, y1), clipped to the world.
+
+        For file-backed maps this is a view, otherwise a new array.
+        """
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.width, x1), min(self.height, y1)
+        if self.tiles is not None:
+            return self.tiles[y0:y1, x0:x1]
+        result = np.zeros((max(0, y1 - y0), max(0, x1 - x0)), dtype=np.uint8)
+        size = self.chunk_size
+        for chunk_y in range(y0 // size, (y1 - 1) // size + 1 if y1 > y0 else 0):
+            for chunk_x in range(x0 // size, (x1 - 1) // size + 1 if x1 > x0 else 0):
+                chunk = self.chunk(chunk_x, chunk_y)
+                cx0, cy0 = chunk_x * size, chunk_y * size
+                ix0, iy0 = max(x0, cx0), max(y0, cy0)
+                ix1, iy1 = min(x1, cx0 + size), min(y1, cy0 + size)
+                result[iy0 - y0:iy1 - y0, ix0 - x0:ix1 - x0] = chunk[iy0 - cy0:iy1 - cy0, ix0 - cx0:ix1 - cx0]
+        return result
+
+    def cost_region(self, x0, y0, x1, y1):
+        costs = self.tile_costs(self.region(x0, y0, x1, y1))
+        x0, y0 = max(0, x0), max(0, y0)
+        if self.cost_plane is not None:
+            plane = self.cost_plane[y0:y1, x0:x1]
+            costs = np.where(plane > 0, plane, costs)
+        if self.collision is not None:
+            costs = np.where(self.collision[y0:y1, x0:x1] > 0, 0, costs)
+        return costs
@@ -0,0 +1,49 @@
+from math import floor
+
+class Camera:
+    """Viewport onto the world, in tiles, centred on a followed position.
+
+    The view is clamped to the world edges, so when the world fits in the
+    viewport the camera never moves. Layers use offset to turn world pixel
+    coordinates into screen coordinates and visible_bounds to cull.
+    """
+    def __init__(self, world_size, viewport_size, cell_size):
+        self.world_size = (int(world_size[0]), int(world_size[1]))
+        self.viewport_size = (min(int(viewport_size[0]), self.world_size[0]),
+                              min(int(viewport_size[1]), self.world_size[1]))
+        self.cell_size = (int(cell_size[0]), int(cell_size[1]))
+        self.position = (0.0, 0.0)
+        self.offset = (0, 0)
+
+    @property
+    def screen_size(self):
+        return (self.viewport_size[0] * self.cell_size[0], self.viewport_size[1] * self.cell_size[1])
+
+    def follow(self, position):
+        max_x = self.world_size[0] - self.viewport_size[0]
+        max_y = self.world_size[1] - self.viewport_size[1]
+        # Centre on the middle of the followed tile
+        x = max(0.0, min(position[0] + 0.5 - self.viewport_size[0] / 2, max_x))
+        y = max(0.0, min(position[1] + 0.5 - self.viewport_size[1] / 2, max_y))
+        self.position = (x, y)
+        self.offset = (int(x * self.cell_size[0]), int(y * self.cell_size[1]))
+
+    def visible_bounds(self):
+        """Returns (x0, y0, x1, y1) in world units, padded by one tile so sprites straddling an edge are kept."""
+        x, y = self.position
+        return (x - 1, y - 1, x + self.viewport_size[0], y + self.viewport_size[1])
+
+    def visible_tiles(self):
+        """Returns the tile range [x0, x1) x [y0, y1) that covers the screen."""
+        x, y = self.position
+        return (floor(x), floor(y),
+                min(self.world_size[0], floor(x) + self.viewport_size[0] + 1),
+                min(self.world_size[1], floor(y) + self.viewport_size[1] + 1))
+
+    def is_visible(self, position):
+        x0, y0, x1, y1 = self.visible_bounds()
+        return x0 < position[0] < x1 and y0 < position[1] < y1
+
+    def world_to_screen(self, position):
+        return (int(position[0] * self.cell_size[0]) - self.offset[0],
+                int(position[1] * self.cell_size[1]) - self.offset[1])
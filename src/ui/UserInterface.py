@@ -1,29 +1,69 @@
+from time import perf_counter
 import pygame
 from pygame import Vector2
+from ..simulation.Simulation import Simulation
+from ..simulation.SimulationThread import SimulationThread
 from ..state.GameState import GameState
+from .Camera import Camera
 from ..layers.TileMapLayer import TileMapLayer
 from ..layers.UnitsLayer import UnitsLayer
 from ..layers.BulletsLayer import BulletsLayer
 from ..layers.ParticlesLayer import ParticlesLayer
-from ..commands.MoveUnitCommand import MoveUnitCommand
-from ..commands.ShootCommand import ShootCommand
-from ..commands.MoveEnemiesCommand import MoveEnemiesCommand
-from ..commands.EnemyDamageCommand import EnemyDamageCommand
-from ..commands.MoveBulletCommand import MoveBulletCommand
-from ..commands.UpdateParticlesCommand import UpdateParticlesCommand
-from ..commands.DeleteDestroyedUnitsCommand import DeleteDestroyedUnitsCommand
+from ..layers.SpriteEffectCache import SpriteEffectCache
+from ..layers.SpriteAtlas import SpriteAtlas
+from ..assets.AssetManager import AssetManager
+from ..profiling.StartupProfiler import StartupProfiler
 
 class UserInterface:
-    def __init__(self):
-        pygame.init()
-        
-        self.game_state = GameState()
+    # Needed for the first frame; the rest decode on a background thread meanwhile
+    CRITICAL_ASSETS = ("assets/tiles.png", "assets/player_sprites.png")
+    DEFERRED_ASSETS = ("assets/fireball.png", "assets/particle.png")
+
+    def __init__(self, dirty_rects=True, profiler=None, world_size=(16, 16), viewport_size=(16, 16), tile_map=None, seed=None,
+                 client=None, threaded=False, tick_rate=60, frame_rate=60, assets=None, startup=None):
+        self.startup = startup if startup is not None else StartupProfiler()
+        with self.startup.phase('pygame init'):
+            pygame.init()
+        self.assets = assets if assets is not None else AssetManager()
+        self.assets.preload(self.DEFERRED_ASSETS)
+
+        # In thin client mode the local simulation is never stepped; its
+        # GameState only regenerates the server's map and holds the entities
+        # the client mirrors
+        self.client = client
+        if client is not None:
+            world_size, seed = client.world_size, client.seed
+        with self.startup.phase('world'):
+            self.simulation = Simulation(GameState(world_size, tile_map, seed))
+        self.simulation.profiler = profiler
+        self.profiler = profiler
+        self.game_state = self.simulation.game_state
+        self.frame_rate = frame_rate
+        self.quality = self.simulation.game_state.quality
+        self.quality.budget = 1 / frame_rate
+        # In threaded mode the simulation ticks at tick_rate on its own thread
+        # and the layers draw a separate GameState filled from its snapshots
+        self.simulation_thread = None
+        self.render_objects = {}
+        if threaded and client is None:
+            self.simulation_thread = SimulationThread(self.simulation, tick_rate)
+            self.game_state = GameState(tile_map=self.simulation.game_state.tile_map, seed=self.simulation.game_state.seed)
+            self.game_state.quality = self.quality
+            self.simulation_thread.interpolate(self.game_state, self.render_objects)
         self.cell_size = Vector2(32, 32)
-        window_size = self.game_state.world_size.elementwise() * self.cell_size
-        self.window = pygame.display.set_mode((int(window_size.x), int(window_size.y)))
-        
+        self.sprite_effects = SpriteEffectCache()
+        self.camera = Camera(self.game_state.world_size, viewport_size, self.cell_size)
+        self.camera.follow(self.game_state.player_unit.position)
+        with self.startup.phase('display'):
+            self.window = pygame.display.set_mode(self.camera.screen_size)
+        # Created after the display so tilesets are converted to its format
+        self.sprite_atlas = SpriteAtlas(self.cell_size, self.sprite_effects, assets=self.assets)
+        with self.startup.phase('asset decode'):
+            for path in self.CRITICAL_ASSETS:
+                self.sprite_atlas.sheet(path)
+
         self.layers = [
-            TileMapLayer(self, "assets/tiles.png", self.game_state),    
+            TileMapLayer(self, "assets/tiles.png", self.game_state),
             UnitsLayer(self, "assets/player_sprites.png", self.game_state, self.game_state.units),
             BulletsLayer(self, "assets/fireball.png", self.game_state, self.game_state.bullets),
             ParticlesLayer(self, "assets/particle.png", self.game_state),
@@ -31,9 +71,16 @@ class UserInterface:
         
         for layer in self.layers:
             self.game_state.add_observer(layer)
+        self.background_layer = self.layers[0]
 
-        self.commands = []
-        self.player_unit = self.game_state.units[0]
+        # Dirty-rect mode only pushes the regions sprites touched this frame
+        # and the previous one to the display
+        self.dirty_rects = dirty_rects
+        self.previous_dirty_rects = None
+
+        self.player_unit = self.game_state.player_unit
+        self.direction = Vector2(0, 0)
+        self.shoot = False
         pygame.display.set_caption("2D Retro RPG!")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -49,7 +96,7 @@ class UserInterface:
                     self.running = False
                     break
                 if event.key == pygame.K_SPACE:
-                    self.commands.append(ShootCommand(self.game_state, self.player_unit, self.player_unit.orientation))
+                    self.shoot = True
 
         direction = Vector2(0, 0)
         keys = pygame.key.get_pressed()
@@ -57,38 +104,95 @@ class UserInterface:
         if keys[pygame.K_DOWN]: direction.y += 1
         if keys[pygame.K_LEFT]: direction.x -= 1
         if keys[pygame.K_RIGHT]: direction.x += 1
-                
-        self.commands.extend([
-            MoveUnitCommand(self.game_state, self.player_unit, direction),
-            MoveEnemiesCommand(self.game_state),
-            EnemyDamageCommand(self.game_state)
-        ])
-        
-        for bullet in self.game_state.bullets:
-            self.commands.append(MoveBulletCommand(self.game_state, bullet))
-
-        self.commands.extend([
-            UpdateParticlesCommand(self.game_state.particles),
-            DeleteDestroyedUnitsCommand(self.game_state.bullets),
-            DeleteDestroyedUnitsCommand(self.game_state.particles),
-            DeleteDestroyedUnitsCommand(self.game_state.units)
-        ])
+        self.direction = direction
                 
     def update(self):
-        for command in self.commands:
-            command.run()
-        self.commands.clear()
-        self.game_state.epoch += 1
+        if self.client is not None:
+            self.client.set_input(self.direction, self.shoot)
+            self.shoot = False
+            player = self.client.apply(self.game_state)
+            if player is not None:
+                self.player_unit = player
+            return
+        if self.simulation_thread is not None:
+            self.simulation_thread.set_input(self.direction, self.shoot)
+            self.shoot = False
+            player = self.simulation_thread.interpolate(self.game_state, self.render_objects)
+            if player is not None:
+                self.player_unit = player
+            return
+        self.simulation.step(self.direction, self.shoot)
+        self.shoot = False
 
     def render(self):
+        if self.profiler is not None and self.simulation_thread is not None:
+            self.profiler.begin_render_frame(self.game_state.epoch)
+        self.camera.follow(self.player_unit.position)
+        if self.dirty_rects:
+            self.render_dirty()
+            return
         self.window.fill((0, 0, 0))
         for layer in self.layers:
-            layer.render(self.window)
+            self.render_layer(layer)
         pygame.display.update()
 
+    def render_layer(self, layer):
+        if self.profiler is None:
+            layer.render(self.window)
+            return
+        start = perf_counter()
+        layer.render(self.window)
+        self.profiler.record('layer', type(layer).__name__, start, perf_counter())
+
+    def render_dirty(self):
+        full_redraw = self.previous_dirty_rects is None or self.background_layer.is_background_stale()
+        if full_redraw:
+            self.window.fill((0, 0, 0))
+            self.render_layer(self.background_layer)
+        else:
+            self.background_layer.restore(self.window, self.previous_dirty_rects)
+
+        dirty_rects = []
+        for layer in self.layers:
+            if layer is self.background_layer:
+                continue
+            layer.dirty_rects = dirty_rects
+            self.render_layer(layer)
+            layer.dirty_rects = None
+
+        if full_redraw:
+            pygame.display.update()
+        else:
+            pygame.display.update(self.previous_dirty_rects + dirty_rects)
+        self.previous_dirty_rects = dirty_rects
+
     def run(self):
-        while self.running:
-            self.process_input()
-            self.update()
-            self.render()
-            self.clock.tick(60)
\ No newline at end of file
+        if self.simulation_thread is not None:
+            self.simulation_thread.start()
+        first_frame = perf_counter()
+        try:
+            while self.running:
+                frame_start = perf_counter()
+                self.process_input()
+                self.update()
+                self.render()
+                if first_frame is not None:
+                    self.finish_startup(first_frame)
+                    first_frame = None
+                else:
+                    self.quality.record_frame(perf_counter() - frame_start)
+                self.clock.tick(self.frame_rate)
+                if self.client is not None and not self.client.thread.is_alive():
+                    self.running = False
+        finally:
+            if self.simulation_thread is not None:
+                self.simulation_thread.stop()
+            self.assets.close()
+
+    def finish_startup(self, first_frame):
+        """Records the first frame, which bakes the visible map chunks, and the load counters."""
+        self.startup.record('first frame', first_frame, perf_counter())
+        self.startup.counts.update(chunks_generated=self.game_state.tile_map.chunks_generated,
+                                   decode_ms=round(self.assets.decode_seconds * 1000, 1),
+                                   asset_cache_hits=self.assets.cache_hits,
+                                   asset_cache_misses=self.assets.cache_misses)
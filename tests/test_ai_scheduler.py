@@ -0,0 +1,74 @@
+from pygame import Vector2
+from src.ai.AIScheduler import AIScheduler
+from src.entities.Enemy import Enemy
+from src.state.GameState import GameState
+from src.state.TileMap import TileMap
+
+
+def make_state(size=128):
+    game_state = GameState(tile_map=TileMap(size, size), seed=1)
+    for unit in game_state.units[1:]:
+        game_state.unindex_unit(unit)
+    del game_state.units[1:]
+    game_state.move_unit(game_state.player_unit, Vector2(2, 2))
+    return game_state
+
+
+def tick(game_state, scheduler):
+    game_state.flow_field.update(game_state.player_unit.position)
+    scheduler.update(game_state, game_state.flow_field, game_state.player_unit.position)
+    game_state.epoch += 1
+
+
+def test_far_enemies_move_less_often_but_keep_pace():
+    game_state = make_state()
+    near = Enemy(game_state, Vector2(10, 2))
+    far = Enemy(game_state, Vector2(100, 2))
+    for enemy in (near, far):
+        game_state.add_unit(enemy)
+        enemy.path = [(x, 2) for x in range(int(enemy.position.x) - 20, int(enemy.position.x))]
+        enemy.last_path_update = 10 ** 6
+    scheduler = AIScheduler(tiers=((24, 1), (float('inf'), 8)))
+
+    moved_ticks = 0
+    for _ in range(48):
+        before = Vector2(far.position)
+        tick(game_state, scheduler)
+        moved_ticks += before != far.position
+
+    assert moved_ticks == 6
+    assert abs((100 - far.position.x) - 48 * far.velocity) < 1e-6
+    assert abs((10 - near.position.x) - 48 * near.velocity) < 1e-6
+
+
+def test_enemies_spawned_together_are_staggered():
+    game_state = make_state()
+    for y in range(16):
+        game_state.add_unit(Enemy(game_state, Vector2(120, y * 4)))
+    scheduler = AIScheduler(tiers=((24, 1), (float('inf'), 8)))
+
+    updates = []
+    for _ in range(16):
+        before = scheduler.updates
+        tick(game_state, scheduler)
+        updates.append(scheduler.updates - before)
+
+    assert updates == [2] * 16
+
+
+def test_replans_are_spread_under_the_expansion_budget():
+    game_state = make_state()
+    for y in range(20):
+        game_state.add_unit(Enemy(game_state, Vector2(60, y * 5)))
+    game_state.epoch = 400
+    scheduler = AIScheduler(expansion_budget=1)
+
+    replans = []
+    for _ in range(8):
+        before = scheduler.replans
+        tick(game_state, scheduler)
+        replans.append(scheduler.replans - before)
+
+    assert replans == [1] * 8
+    assert len(scheduler.replan_queue) == 20 - 8
+    assert sum(bool(enemy.path) for enemy in game_state.units[1:]) == 8
@@ -0,0 +1,85 @@
+import os
+import pygame
+from src.assets.AssetManager import AssetManager
+from src.layers.SpriteAtlas import SpriteAtlas
+from src.layers.SpriteEffectCache import SpriteEffectCache
+from src.profiling.StartupProfiler import StartupProfiler
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_image(path, color=(200, 40, 10, 128)):
+    image = pygame.Surface((3, 2), pygame.SRCALPHA)
+    image.fill(color)
+    image.set_at((2, 1), (1, 2, 3, 255))
+    pygame.image.save(image, str(path))
+    return str(path)
+
+
+def test_images_are_decoded_once_and_shared(tmp_path):
+    path = make_image(tmp_path / 'a.png')
+    assets = AssetManager()
+    first = SpriteAtlas((1, 1), SpriteEffectCache(), assets=assets)
+    second = SpriteAtlas((1, 1), SpriteEffectCache(), assets=assets)
+
+    assert first.sheet(path) is second.sheet(path)
+    assert assets.image(path).get_at((2, 1)) == (1, 2, 3, 255)
+
+
+def test_raw_cache_is_keyed_by_file_content(tmp_path):
+    path = make_image(tmp_path / 'a.png')
+    cache_dir = str(tmp_path / 'cache')
+    cold = AssetManager(cache_dir)
+    expected = pygame.image.tobytes(cold.image(path), 'RGBA')
+    assert (cold.cache_hits, cold.cache_misses) == (0, 1)
+
+    warm = AssetManager(cache_dir)
+    assert pygame.image.tobytes(warm.image(path), 'RGBA') == expected
+    assert (warm.cache_hits, warm.cache_misses) == (1, 0)
+
+    make_image(path, (0, 0, 255, 255))
+    changed = AssetManager(cache_dir)
+    assert changed.image(path).get_at((0, 0)) == (0, 0, 255, 255)
+    assert changed.cache_misses == 1
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_damaged_cache_entries_fall_back_to_decoding(tmp_path):
+    path = make_image(tmp_path / 'a.png')
+    cache_dir = str(tmp_path / 'cache')
+    AssetManager(cache_dir).image(path)
+    (entry,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, entry), 'r+b') as file:
+        file.truncate(20)
+
+    assets = AssetManager(cache_dir)
+    assert assets.image(path).get_at((2, 1)) == (1, 2, 3, 255)
+    assert assets.cache_misses == 1
+
+
+def test_preloaded_images_decode_in_the_background(tmp_path):
+    paths = [make_image(tmp_path / f'{index}.png') for index in range(3)]
+    assets = AssetManager()
+    assets.preload(paths)
+    try:
+        assert all(assets.image(path).get_size() == (3, 2) for path in paths)
+        assert not assets.pending
+    finally:
+        assets.close()
+
+
+def test_startup_report_covers_first_frame(monkeypatch):
+    from src.ui.UserInterface import UserInterface
+    monkeypatch.chdir(REPO_ROOT)
+    startup = StartupProfiler()
+    ui = UserInterface(startup=startup)
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    ui.run()
+    pygame.quit()
+
+    phases = [name for name, _, _ in startup.phases]
+    assert phases == ['pygame init', 'world', 'display', 'asset decode', 'first frame']
+    assert startup.counts['chunks_generated'] > 0
+    # Nothing has been shot yet, so the fireball sheet was never needed
+    assert "assets/fireball.png" not in ui.sprite_atlas.sheets
+    assert 'first frame' in startup.summary()
@@ -0,0 +1,41 @@
+import numpy as np
+from src.simulation.BatchEnvironment import BatchEnvironment
+
+
+def random_actions(rng, num_envs):
+    return np.column_stack([rng.integers(-1, 2, (num_envs, 2)), rng.random(num_envs) < 0.2])
+
+
+def run(environment, ticks, seed=0):
+    rng = np.random.default_rng(seed)
+    observations = environment.reset()
+    for _ in range(ticks):
+        observations = environment.step(random_actions(rng, environment.num_envs))
+    return observations
+
+
+def test_observation_shapes():
+    with BatchEnvironment(3, max_units=8, occupancy_shape=(4, 4)) as environment:
+        observations = run(environment, 5)
+    assert observations['units'].shape == (3, 8, 5)
+    assert observations['occupancy'].shape == (3, 3, 4, 4)
+    assert observations['epoch'].tolist() == [5, 5, 5]
+    assert not observations['done'].any()
+    assert (observations['units'][:, 0, 3] == 0).all()
+    assert (observations['units'][:, 0, 4] == 1).all()
+    enemies = observations['units'][:, 1:, 3].sum(axis=1)
+    assert np.allclose(observations['occupancy'][:, 1].sum(axis=(1, 2)), enemies)
+
+
+def test_same_seed_is_deterministic():
+    with BatchEnvironment(2, seed=7) as first, BatchEnvironment(2, seed=7) as second:
+        assert np.array_equal(run(first, 40)['units'], run(second, 40)['units'])
+
+
+def test_workers_match_in_process():
+    with BatchEnvironment(4, seed=3, occupancy_shape=(4, 4)) as local:
+        expected = run(local, 30)
+    with BatchEnvironment(4, seed=3, occupancy_shape=(4, 4), num_workers=2) as sharded:
+        observations = run(sharded, 30)
+    for key in expected:
+        assert np.array_equal(observations[key], expected[key])
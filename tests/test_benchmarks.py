@@ -0,0 +1,50 @@
+import copy
+import os
+from benchmarks.BenchmarkRunner import BenchmarkRunner
+from benchmarks.Scenario import Scenario
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_scenarios_hold_their_entity_counts():
+    scenario = Scenario('test', (32, 32), enemies=20, bullets=15, particles=300)
+    simulation = scenario.build()
+    game_state = simulation.game_state
+    input_source = scenario.input_source()
+    for _ in range(40):
+        simulation.step(*input_source(game_state.epoch))
+        scenario.refill(game_state)
+        enemies = [unit for unit in game_state.units if unit not in game_state.players]
+        assert len(enemies) == 20
+        assert len(game_state.bullets) >= 15
+        assert len(game_state.particles) >= 300
+
+
+def test_runner_reports_timings_and_memory_per_subsystem(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    scenario = Scenario('test', (32, 32), enemies=10, bullets=5, particles=100, ticks=8, warmup=2)
+    result = BenchmarkRunner(memory_ticks=3).run(scenario)
+
+    assert result['scenario']['enemies'] == 10
+    assert result['ticks_per_second'] > 0
+    assert result['frame_ms']['p99'] >= result['frame_ms']['p50'] >= result['tick_ms']['p50']
+    assert result['peak_kib'] > 0
+    assert {'command/MoveEnemiesCommand', 'command/UpdateParticlesCommand',
+            'layer/UnitsLayer', 'layer/ParticlesLayer'} <= set(result['subsystems'])
+    assert result['subsystems']['command/UpdateParticlesCommand']['peak_kib'] > 0
+
+
+def test_regressions_beyond_the_threshold_are_reported():
+    baseline = {'a': {'ticks_per_second': 100.0, 'frame_ms': {'p50': 10.0, 'p99': 20.0}, 'peak_kib': 500.0}}
+    results = copy.deepcopy(baseline)
+    results['b'] = baseline['a']
+    results['a']['frame_ms']['p50'] = 12.0
+    results['a']['frame_ms']['p99'] = 28.0
+    assert BenchmarkRunner.compare(results, baseline, threshold=0.25) == []
+
+    results['a']['frame_ms']['p50'] = 13.0
+    results['a']['ticks_per_second'] = 75.0
+    regressions = BenchmarkRunner.compare(results, baseline, threshold=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith('a: ticks_per_second')
+    assert regressions[1].startswith('a: frame_ms.p50')
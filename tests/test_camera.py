@@ -0,0 +1,27 @@
+from src.ui.Camera import Camera
+
+
+def test_camera_is_fixed_when_world_fits():
+    camera = Camera((16, 16), (16, 16), (32, 32))
+    camera.follow((12, 3))
+    assert camera.offset == (0, 0)
+    assert camera.screen_size == (512, 512)
+
+
+def test_camera_centres_and_clamps_to_world():
+    camera = Camera((100, 100), (10, 10), (32, 32))
+    camera.follow((50, 50))
+    assert camera.position == (45.5, 45.5)
+    assert camera.world_to_screen((50, 50)) == (144, 144)
+
+    camera.follow((99, 1))
+    assert camera.position == (90, 0)
+
+
+def test_visibility_culling():
+    camera = Camera((100, 100), (10, 10), (32, 32))
+    camera.follow((50, 50))
+    assert camera.is_visible((50, 50))
+    assert camera.is_visible((45, 45))
+    assert not camera.is_visible((30, 50))
+    assert camera.visible_tiles() == (45, 45, 56, 56)
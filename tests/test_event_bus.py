@@ -0,0 +1,64 @@
+from pygame import Vector2
+from src.events.EventBus import EventBus
+from src.events.UnitMoved import UnitMoved
+from src.events.UnitStopped import UnitStopped
+from src.layers.GameStateObserver import GameStateObserver
+from src.simulation.Simulation import Simulation
+
+
+class Recorder:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, events):
+        self.batches.append(list(events))
+
+
+def test_events_are_coalesced_per_unit_and_batched():
+    bus = EventBus()
+    moved, stopped = Recorder(), Recorder()
+    bus.subscribe(UnitMoved, moved)
+    bus.subscribe(UnitStopped, stopped)
+    first, second = object(), object()
+
+    bus.publish(UnitMoved(first, (1, 0)))
+    bus.publish(UnitMoved(first, (0, 1)))
+    bus.publish(UnitMoved(second, (1, 0)))
+    bus.publish(UnitStopped(second))
+    assert moved.batches == []
+    bus.flush()
+
+    assert moved.batches == [[UnitMoved(first, (0, 1))]]
+    assert stopped.batches == [[UnitStopped(second)]]
+
+
+def test_repeated_state_is_not_delivered_again():
+    bus = EventBus()
+    stopped = Recorder()
+    bus.subscribe(UnitStopped, stopped)
+    unit = object()
+
+    for _ in range(3):
+        bus.publish(UnitStopped(unit))
+        bus.flush()
+    bus.forget(UnitStopped(unit).key)
+    bus.publish(UnitStopped(unit))
+    bus.flush()
+
+    assert stopped.batches == [[UnitStopped(unit)], [UnitStopped(unit)]]
+
+
+def test_simulation_flushes_once_per_tick():
+    simulation = Simulation()
+    stopped = Recorder()
+
+    class Observer(GameStateObserver):
+        def subscribe(self, events):
+            events.subscribe(UnitStopped, stopped)
+
+    simulation.game_state.add_observer(Observer())
+    simulation.run(5)
+    simulation.step(Vector2(1, 0))
+    simulation.step()
+
+    assert len(stopped.batches) == 2
@@ -0,0 +1,84 @@
+from pygame import Vector2
+from src.ai.FlowField import FlowField
+from src.state.TileMap import TileMap
+from src.simulation.Simulation import Simulation
+
+
+def make_map(width=8, height=8):
+    tile_map = TileMap(width, height)
+    tile_map.TILE_COSTS = TileMap.TILE_COSTS.copy()
+    return tile_map
+
+
+def test_field_leads_to_target():
+    field = FlowField(make_map())
+    field.update(Vector2(6, 6))
+
+    cell = (0, 0)
+    for _ in range(20):
+        step = field.next_step(Vector2(cell))
+        if step == cell:
+            break
+        cell = step
+    assert cell == (6, 6)
+    assert field.distance(Vector2(0, 0)) == 12
+
+
+def test_field_routes_around_impassable_tiles():
+    tile_map = make_map()
+    tile_map.TILE_COSTS[1] = 0
+    for y in range(0, 7):
+        tile_map.set_tile(3, y, 1)
+    field = FlowField(tile_map)
+    field.update(Vector2(6, 0))
+
+    assert field.next_step(Vector2(3, 0)) is None
+    assert field.distance(Vector2(0, 0)) == 6 + 2 * 7
+
+
+def test_field_rebuilds_only_on_cell_or_map_change():
+    tile_map = make_map()
+    field = FlowField(tile_map)
+    field.update(Vector2(2.2, 2.2))
+    field.update(Vector2(2.8, 2.1))
+    assert field.rebuild_count == 1
+
+    field.update(Vector2(3.1, 2.1))
+    assert field.rebuild_count == 2
+
+    tile_map.set_tile(0, 0, 1)
+    field.update(Vector2(3.1, 2.1))
+    assert field.rebuild_count == 3
+
+
+def test_cells_outside_radius_are_off_field():
+    field = FlowField(make_map(64, 64), radius=4)
+    field.update(Vector2(10, 10))
+
+    assert field.next_step(Vector2(30, 30)) is None
+    assert field.next_step(Vector2(12, 10)) == (11, 10)
+
+
+def test_enemies_converge_on_idle_player():
+    simulation = Simulation()
+    player = simulation.game_state.player_unit
+    player.health = 10 ** 9
+    simulation.run(1200)
+
+    enemies = [unit for unit in simulation.game_state.units if unit is not player]
+    assert enemies
+    assert min(player.position.distance_to(enemy.position) for enemy in enemies) < 2
+
+
+def test_enemy_falls_back_to_astar_off_field():
+    simulation = Simulation()
+    game_state = simulation.game_state
+    game_state.flow_field.radius = 1
+    game_state.epoch = 30
+    enemy = game_state.units[1]
+    game_state.flow_field.update(game_state.player_unit.position)
+
+    enemy.follow_flow_field(game_state.flow_field, game_state.player_unit.position)
+
+    assert enemy.path
+    assert enemy.path[0] == (5, 4)
@@ -0,0 +1,62 @@
+import json
+import threading
+from src.profiling.FrameProfiler import FrameProfiler
+from src.simulation.Simulation import Simulation
+
+
+def test_ring_buffer_keeps_latest_frames():
+    profiler = FrameProfiler(capacity=3)
+    for epoch in range(5):
+        profiler.begin_frame(epoch)
+        profiler.record('command', 'A', 0.0, 0.5)
+        profiler.record('command', 'A', 0.0, 0.25)
+
+    assert [frame['epoch'] for frame in profiler.frames] == [2, 3, 4]
+    assert profiler.totals()[('command', 'A')] == (2.25, 6)
+
+
+def test_simulation_records_commands_and_counts(tmp_path):
+    simulation = Simulation()
+    simulation.profiler = FrameProfiler()
+    simulation.run(10)
+
+    frame = simulation.profiler.frames[-1]
+    assert ('command', 'MoveEnemiesCommand') in frame['timings']
+    assert frame['counts']['units'] == len(simulation.game_state.units)
+    assert 'MoveEnemiesCommand' in simulation.profiler.summary()
+
+    path = tmp_path / "trace.json"
+    simulation.profiler.export_chrome_trace(path)
+    events = json.loads(path.read_text())['traceEvents']
+    assert any(event['ph'] == 'X' and event['name'] == 'MoveUnitCommand' for event in events)
+    assert any(event['ph'] == 'C' for event in events)
+
+
+def test_render_thread_spans_go_to_render_frames():
+    profiler = FrameProfiler()
+
+    def simulate():
+        for epoch in range(6):
+            profiler.begin_frame(epoch)
+            profiler.record('command', 'A', 0.0, 0.001)
+
+    for epoch in range(3):
+        profiler.begin_render_frame(epoch)
+        profiler.record('layer', 'L', 0.0, 0.002)
+        thread = threading.Thread(target=simulate)
+        thread.start()
+        thread.join()
+        profiler.record('layer', 'M', 0.0, 0.004)
+
+    assert all(set(frame['timings']) == {('command', 'A')} for frame in profiler.frames)
+    assert all(set(frame['timings']) == {('layer', 'L'), ('layer', 'M')} for frame in profiler.render_frames)
+    summary = profiler.summary().splitlines()
+    assert summary[0] == "18 ticks, 3 render frames"
+    assert summary[2].split()[:4] == ['layer', 'M', '4.000', '1.0']
+    assert summary[4].split()[:4] == ['command', 'A', '1.000', '1.0']
+
+
+def test_profiler_is_off_by_default():
+    simulation = Simulation()
+    simulation.run(3)
+    assert simulation.profiler is None
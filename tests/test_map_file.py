@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from pygame import Vector2
+from src.ai.FlowField import FlowField
+from src.state.MapFile import MapFile
+from src.state.TileMap import TileMap
+
+
+def test_round_trip_with_planes(tmp_path):
+    tiles = np.arange(12, dtype=np.uint8).reshape(3, 4) % 2
+    collision = np.zeros((3, 4), dtype=np.uint8)
+    collision[1, 2] = 1
+    costs = np.full((3, 4), 3, dtype=np.uint8)
+    path = tmp_path / "world.map"
+    MapFile.write(path, tiles, collision, costs)
+
+    map_file = MapFile(path)
+
+    assert (map_file.width, map_file.height) == (4, 3)
+    assert np.array_equal(map_file.tiles, tiles)
+    assert np.array_equal(map_file.collision, collision)
+    assert np.array_equal(map_file.costs, costs)
+    assert map_file.tiles.base is not None
+
+
+def test_wide_tile_indices(tmp_path):
+    tiles = np.array([[0, 300], [65535, 1]])
+    path = tmp_path / "wide.map"
+    MapFile.write(path, tiles)
+
+    map_file = MapFile(path)
+    assert map_file.tiles.dtype == np.dtype('<u2')
+    assert map_file.tiles.tolist() == tiles.tolist()
+    assert map_file.collision is None and map_file.costs is None
+
+
+def test_rejects_bad_files(tmp_path):
+    path = tmp_path / "bad.map"
+    path.write_bytes(b"not a map" + b"\0" * 64)
+    with pytest.raises(ValueError):
+        MapFile(path)
+
+    MapFile.write(path, np.zeros((8, 8)))
+    path.write_bytes(path.read_bytes()[:80])
+    with pytest.raises(ValueError):
+        MapFile(path)
+
+
+def test_tile_map_views_file_and_edits_stay_in_memory(tmp_path):
+    source = TileMap(64, 40, seed=3)
+    source.generate_simple_map()
+    path = tmp_path / "world.map"
+    source.save(path)
+
+    tile_map = TileMap.from_file(path, chunk_size=16)
+    assert np.array_equal(tile_map.region(0, 0, 64, 40), source.region(0, 0, 64, 40))
+    assert np.shares_memory(tile_map.chunk(1, 1), tile_map.tiles)
+    assert np.shares_memory(tile_map.region(5, 5, 20, 20), tile_map.tiles)
+
+    tile_map.set_tile(0, 0, 1)
+    assert tile_map.tile(0, 0) == 1
+    assert MapFile(path).tiles[0, 0] == source.tile(0, 0)
+
+
+def test_collision_and_cost_planes_drive_pathfinding(tmp_path):
+    tiles = np.zeros((5, 5), dtype=np.uint8)
+    collision = np.zeros((5, 5), dtype=np.uint8)
+    collision[0:4, 2] = 1
+    costs = np.zeros((5, 5), dtype=np.uint8)
+    costs[4, 2] = 5
+    path = tmp_path / "walls.map"
+    MapFile.write(path, tiles, collision, costs)
+
+    tile_map = TileMap.from_file(path)
+    assert not tile_map.is_passable(2, 0)
+    assert tile_map.cost(2, 4) == 5
+
+    field = FlowField(tile_map)
+    field.update(Vector2(4, 0))
+    assert field.next_step(Vector2(2, 0)) is None
+    assert field.distance(Vector2(0, 0)) == 16
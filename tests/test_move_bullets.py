@@ -0,0 +1,96 @@
+from pygame import Vector2
+from src.commands.MoveBulletsCommand import MoveBulletsCommand
+from src.entities.Enemy import Enemy
+from src.entities.Fireball import Fireball
+from src.simulation.Simulation import Simulation
+
+
+def make_state():
+    game_state = Simulation().game_state
+    for unit in game_state.units[1:]:
+        unit.health = 0
+        game_state.unindex_unit(unit)
+    del game_state.units[1:]
+    return game_state
+
+
+def fire(game_state, position, direction, velocity=0.2):
+    shooter = game_state.player_unit
+    game_state.move_unit(shooter, Vector2(position))
+    bullet = Fireball(game_state, shooter, Vector2(direction))
+    bullet.velocity = velocity
+    game_state.bullets.append(bullet)
+    return bullet
+
+
+def test_fast_bullet_does_not_tunnel_through_unit():
+    game_state = make_state()
+    target = Enemy(game_state, Vector2(8, 2))
+    game_state.add_unit(target)
+    bullet = fire(game_state, (2, 2), (1, 0), velocity=12)
+
+    MoveBulletsCommand(game_state).run()
+
+    assert bullet.health == 0
+    assert target.health == 100 - bullet.damage
+    assert target.position == Vector2(9, 2)
+
+
+def test_bullet_ignores_its_shooter():
+    game_state = make_state()
+    bullet = fire(game_state, (4, 4), (1, 0))
+
+    MoveBulletsCommand(game_state).run()
+
+    assert bullet.health != 0
+    assert bullet.position.x > 4
+    assert game_state.player_unit.health == 100
+
+
+def test_bullets_are_culled_by_bounds_and_range():
+    game_state = make_state()
+    leaving = fire(game_state, (0.1, 5), (-1, 0))
+    spent = fire(game_state, (3, 12), (1, 0))
+    spent.start_position = Vector2(3 - spent.range, 12)
+    flying = fire(game_state, (5, 8), (0, 1))
+
+    MoveBulletsCommand(game_state).run()
+
+    assert leaving.health == 0
+    assert spent.health == 0
+    assert flying.health != 0
+    assert len(game_state.particles) >= 2 * MoveBulletsCommand.impact_particles
+
+
+def test_segment_circle_entry():
+    import numpy as np
+    times = MoveBulletsCommand.segment_circle_entry(
+        np.array([[0.0, 0.0], [0.0, 0.0], [5.0, 5.0]]),
+        np.array([[10.0, 0.0], [10.0, 0.0], [1.0, 0.0]]),
+        np.array([[5.0, 0.0], [5.0, 3.0], [5.2, 5.0]]),
+        1.0)
+
+    assert abs(times[0] - 0.4) < 1e-9
+    assert np.isnan(times[1])
+    assert times[2] == 0.0
+
+
+def test_scalar_and_vectorized_hits_agree():
+    import numpy as np
+    game_state = make_state()
+    rng = np.random.default_rng(5)
+    for _ in range(20):
+        game_state.add_unit(Enemy(game_state, Vector2(*rng.integers(0, 16, 2).tolist())))
+    bullets = [fire(game_state, rng.uniform(0, 16, 2).tolist(), rng.uniform(-1, 1, 2).tolist(),
+                    velocity=float(rng.uniform(0.1, 6))) for _ in range(200)]
+    positions = np.array([(bullet.position.x, bullet.position.y) for bullet in bullets])
+    steps = np.array([(bullet.direction.x, bullet.direction.y) for bullet in bullets])
+    steps *= np.array([bullet.velocity for bullet in bullets])[:, None]
+    expired = np.zeros(len(bullets), dtype=bool)
+    command = MoveBulletsCommand(game_state)
+
+    vectorized = command.find_hits(bullets, positions, steps, expired)
+    scalar = command.find_hits_scalar(bullets, positions, steps, expired)
+
+    assert vectorized
+    assert scalar == vectorized
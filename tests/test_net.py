@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from pygame import Vector2
+from src.entities.Enemy import Enemy
+from src.net.GameClient import GameClient
+from src.net.GameServer import GameServer
+from src.net.Protocol import Protocol
+from src.simulation.ScriptedInput import ScriptedInput
+from src.state.GameState import GameState
+
+
+def test_state_delta_round_trip():
+    entities = {}
+    first = {1: (0, 256, 512, 100, 0, 0), 2: (1, 0, 0, 100, 4, 1)}
+    second = {1: (0, 300, 512, 95, 0, 2), 3: (2, -10, 40, 100, 1, 0)}
+
+    full = Protocol.encode_state(1, {}, first)
+    delta = Protocol.encode_state(2, first, second)
+    unchanged = Protocol.encode_state(3, second, dict(second))
+
+    assert Protocol.decode_state(full[4:], entities) == 1
+    assert Protocol.decode_state(delta[4:], entities) == 2
+    assert {key: tuple(value) for key, value in entities.items()} == second
+    assert len(unchanged) < 10
+
+
+async def play(server, bots, ticks):
+    port = await server.start()
+    for bot in bots:
+        await bot.connect('127.0.0.1', port)
+    script = ScriptedInput([((1, 0), True)] * 10 + [((0, 1), False)] * 10, loop=True)
+    tasks = [asyncio.create_task(bot.run(script)) for bot in bots]
+    await asyncio.sleep(0.05)
+    await server.run(ticks)
+    await asyncio.sleep(0.1)
+    views = [session.sent for session in server.sessions]
+    player_count = len(server.game_state.players)
+    for task in tasks:
+        task.cancel()
+    for bot in bots:
+        await bot.close()
+    await server.close()
+    return views, player_count
+
+
+def test_bots_mirror_their_interest_area():
+    game_state = GameState((64, 64), seed=2)
+    far_enemy = Enemy(game_state, Vector2(60, 60))
+    game_state.add_unit(far_enemy)
+    server = GameServer(game_state, tick_rate=500, interest_radius=10)
+    bots = [GameClient() for _ in range(3)]
+
+    views, player_count = asyncio.run(play(server, bots, 30))
+
+    assert player_count == 3
+    assert len({bot.player_id for bot in bots}) == 3
+    for bot, view in zip(bots, views):
+        assert bot.view == view
+        assert bot.player_id in bot.view
+        assert bot.states_received == 30
+        # Every scripted input walks, so each bot sees itself moving
+        assert bot.view[bot.player_id][5] & Protocol.FLAG_MOVING
+    far_id = server.entity_ids[far_enemy]
+    assert all(far_id not in view for view in views)
+    bytes_per_state = sum(bot.bytes_received for bot in bots) / 90
+    assert bytes_per_state < 200
+
+
+def test_players_are_removed_on_disconnect():
+    game_state = GameState(seed=2)
+    server = GameServer(game_state, tick_rate=500)
+
+    async def scenario():
+        port = await server.start()
+        first, second = GameClient(), GameClient()
+        await first.connect('127.0.0.1', port)
+        await second.connect('127.0.0.1', port)
+        await asyncio.sleep(0.05)
+        await second.close()
+        await asyncio.sleep(0.05)
+        server.tick()
+        await first.close()
+        await server.close()
+
+    asyncio.run(scenario())
+    assert game_state.players == [game_state.player_unit]
+    assert len([unit for unit in game_state.units if not isinstance(unit, Enemy)]) == 1
+
+
+def test_invalid_hello_closes_the_connection():
+    server = GameServer(GameState(seed=2), tick_rate=500)
+
+    async def scenario():
+        port = await server.start()
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        hello = bytearray(Protocol.hello())
+        hello[-1] ^= 0xff
+        writer.write(bytes(hello))
+        received = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        await server.close()
+        return received
+
+    assert asyncio.run(scenario()) == b''
+    assert server.sessions == []
+
+
+def test_thin_client_renders_server_state(monkeypatch):
+    import os
+    import pygame
+    from src.ui.UserInterface import UserInterface
+    monkeypatch.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    server = GameServer(GameState(seed=4), tick_rate=120)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    async def host():
+        await server.start()
+        started.set()
+        await server.run(240)
+        await server.close()
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(host(),), daemon=True)
+    thread.start()
+    started.wait(5)
+    client = GameClient()
+    client.start_thread('127.0.0.1', server.port)
+    try:
+        ui = UserInterface(client=client)
+        ui.direction = Vector2(1, 0)
+        for _ in range(40):
+            ui.update()
+            ui.render()
+            ui.clock.tick(120)
+        assert ui.game_state.seed == server.game_state.seed
+        assert ui.player_unit is client.objects[client.player_id]
+        assert ui.player_unit.position.x > 5
+        assert len(ui.game_state.units) == len(client.view) - len(ui.game_state.bullets)
+    finally:
+        pygame.quit()
+        thread.join(5)
+        loop.close()
@@ -0,0 +1,55 @@
+from pygame import Vector2
+from src.entities.Enemy import Enemy
+from src.entities.Fireball import Fireball
+from src.entities.ObjectPool import ObjectPool
+from src.profiling.FrameProfiler import FrameProfiler
+from src.simulation.ScriptedInput import ScriptedInput
+from src.simulation.Simulation import Simulation
+from src.state.GameState import GameState
+
+
+def test_entities_have_no_instance_dict():
+    game_state = GameState(seed=1)
+    enemy = Enemy(game_state, Vector2(1, 1))
+    fireball = Fireball(game_state, game_state.player_unit, Vector2(1, 0))
+    for entity in (game_state.player_unit, enemy, fireball):
+        assert not hasattr(entity, '__dict__')
+    assert fireball.animation_frames is Fireball.animation_frames
+
+
+def test_pool_reuses_and_resets_released_objects():
+    game_state = GameState(seed=1)
+    pool = ObjectPool(Fireball)
+    first = pool.acquire(game_state, game_state.player_unit, Vector2(1, 0))
+    first.health = 0
+    first.current_frame = 2
+    pool.release(first)
+
+    second = pool.acquire(game_state, game_state.units[1], Vector2(0, 1))
+
+    assert second is first
+    assert second.health == 100
+    assert second.current_frame == 0
+    assert second.unit is game_state.units[1]
+    assert second.position == game_state.units[1].position
+    assert pool.stats() == {'created': 1, 'reused': 1, 'released': 1, 'free': 0}
+
+
+def test_pool_caps_free_list():
+    pool = ObjectPool(object, max_free=1)
+    pool.release(object())
+    pool.release(object())
+    assert len(pool) == 1
+
+
+def test_steady_shooting_reuses_bullets():
+    simulation = Simulation(GameState(seed=3))
+    simulation.game_state.player_unit.health = 10 ** 9
+    simulation.profiler = FrameProfiler(capacity=2000)
+    shooting = ScriptedInput([((1, 0), True), ((-1, 0), True)], loop=True)
+    simulation.run(1500, shooting)
+
+    stats = simulation.game_state.allocation_stats()
+    assert stats['bullets_reused'] > stats['bullets_created']
+    late = list(simulation.profiler.frames)[-300:]
+    assert sum(frame['counts']['bullets_created'] for frame in late) == 0
@@ -0,0 +1,68 @@
+import numpy as np
+from src.state.GameState import GameState
+from src.entities.ParticleSystem import ParticleSystem
+
+
+def make_particles(capacity=4):
+    game_state = GameState()
+    return game_state, ParticleSystem(game_state, capacity=capacity)
+
+
+def test_reserve_grows_and_keeps_live_rows():
+    game_state, particles = make_particles(capacity=2)
+    particles.add([(1, 1), (2, 2)], [5, 6])
+    particles.add([(3, 3), (4, 4), (5, 5)], [7, 8, 9])
+
+    assert len(particles) == 5
+    assert len(particles.lifetimes) >= 5
+    assert particles.positions[:5, 0].tolist() == [1, 2, 3, 4, 5]
+    assert particles.lifetimes[:5].tolist() == [5, 6, 7, 8, 9]
+
+
+def test_update_ages_and_compacts_in_emission_order():
+    game_state, particles = make_particles()
+    particles.add([(0, 0), (1, 0), (2, 0), (3, 0)], [3, 1, 2, 1])
+
+    particles.update()
+
+    assert len(particles) == 2
+    assert particles.lifetimes[:2].tolist() == [2, 1]
+    assert np.floor(particles.positions[:2, 0]).tolist() == [0, 2]
+
+    particles.update()
+    assert len(particles) == 1
+    assert particles.lifetimes[:1].tolist() == [1]
+
+
+def test_update_moves_due_particles_and_reschedules():
+    game_state, particles = make_particles()
+    game_state.epoch = 100
+    particles.add([(5, 5)], [50])
+
+    particles.update()
+
+    assert tuple(particles.positions[0]) != (5, 5)
+    assert 110 <= particles.next_move_times[0] <= 114
+
+
+def test_blit_coordinates_scale_by_cell_size():
+    game_state, particles = make_particles()
+    particles.add([(1.5, 2.25)], [10])
+
+    assert particles.blit_coordinates((32, 32)).tolist() == [[48, 72]]
+
+
+def test_cap_evicts_oldest_particles_first():
+    game_state = GameState()
+    particles = ParticleSystem(game_state, capacity=4, max_particles=4)
+    particles.add([(0, 0), (1, 0), (2, 0)], [10, 11, 12])
+    particles.add([(3, 0), (4, 0)], [13, 14])
+
+    assert len(particles) == 4
+    assert particles.lifetimes[:4].tolist() == [11, 12, 13, 14]
+    assert particles.evicted == 1
+
+    particles.add([(float(x), 0) for x in range(6)], list(range(20, 26)))
+    assert particles.lifetimes[:4].tolist() == [22, 23, 24, 25]
+    assert particles.evicted == 7
+    assert len(particles.lifetimes) == 4
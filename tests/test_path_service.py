@@ -0,0 +1,95 @@
+import pickle
+import pytest
+from pygame import Vector2
+from src.ai.PathService import PathService
+from src.entities.Enemy import Enemy
+from src.simulation.Simulation import Simulation
+from src.state.GameState import GameState
+from src.state.Snapshot import Snapshot
+from src.state.TileMap import TileMap
+
+
+@pytest.fixture
+def game_state():
+    game_state = GameState(tile_map=TileMap(128, 128, seed=2), seed=1)
+    game_state.tile_map.generate_simple_map()
+    game_state.path_service = PathService(game_state.tile_map, workers=1, latency=3)
+    yield game_state
+    game_state.path_service.close()
+
+
+def far_enemy(game_state, position=(100, 100)):
+    enemy = Enemy(game_state, Vector2(position))
+    # Far enemies otherwise wait hundreds of ticks before their first replan
+    enemy.last_path_update = -1000
+    game_state.add_unit(enemy)
+    return enemy
+
+
+def test_paths_arrive_after_latency_and_match_inline_search(game_state):
+    service = game_state.path_service
+    enemy = far_enemy(game_state)
+    goal = game_state.player_unit.position
+    expected = enemy.find_path(enemy.position, goal)
+
+    service.request(enemy, goal, epoch=10)
+    for epoch in (10, 11, 12):
+        service.collect(epoch)
+        assert enemy.path == []
+    service.collect(13)
+    assert enemy.path == expected and expected
+    assert enemy.last_path_update == 10
+
+
+def test_newer_requests_supersede_and_repeats_hit_the_cache(game_state):
+    service = game_state.path_service
+    enemy = far_enemy(game_state)
+    service.request(enemy, Vector2(5, 5), epoch=0)
+    service.request(enemy, Vector2(6, 4), epoch=1)
+    service.collect(10)
+    assert service.superseded == 1 and service.completed == 1
+    assert enemy.path[0] == (6, 4)
+
+    enemy.path = []
+    service.request(enemy, Vector2(6, 4), epoch=20)
+    assert service.cache_hits == 1
+    # Still applied on schedule, so the cache never changes the outcome
+    service.collect(22)
+    assert enemy.path == []
+    service.collect(23)
+    assert enemy.path[0] == (6, 4)
+
+
+def test_worker_runs_are_deterministic_and_survive_snapshots(game_state):
+    for position in [(100, 100), (120, 30), (30, 120), (90, 60)]:
+        far_enemy(game_state, position)
+    game_state.player_unit.health = 10 ** 9
+    simulation = Simulation(game_state)
+    simulation.run(6)
+    assert game_state.path_service.pending
+    data = Snapshot.capture(game_state)
+    expected = []
+    for _ in range(60):
+        simulation.step()
+        expected.append(game_state.checksum())
+    assert game_state.path_service.completed
+
+    Snapshot.restore(game_state, data)
+    assert Snapshot.capture(game_state) == data
+    actual = []
+    for _ in range(60):
+        simulation.step()
+        actual.append(game_state.checksum())
+    assert actual == expected
+
+
+def test_tile_maps_pickle_without_generated_chunks():
+    tile_map = TileMap(96, 96, seed=3)
+    tile_map.generate_simple_map()
+    tiles = tile_map.region(0, 0, 96, 96)
+    tile_map.set_tile(4, 4, 1)
+    tiles[4, 4] = 1
+
+    copy = pickle.loads(pickle.dumps(tile_map))
+    assert list(copy.chunks) == [(0, 0)]
+    assert (copy.region(0, 0, 96, 96) == tiles).all()
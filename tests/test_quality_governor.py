@@ -0,0 +1,56 @@
+from pygame import Vector2
+from src.commands.MoveBulletsCommand import MoveBulletsCommand
+from src.state.GameState import GameState
+from src.state.QualityGovernor import QualityGovernor
+
+
+def feed(governor, seconds, frames):
+    for _ in range(frames):
+        governor.record_frame(seconds)
+
+
+def test_level_follows_frame_time_against_budget():
+    governor = QualityGovernor(budget=0.016, window=4, step=0.25, min_level=0.25)
+    feed(governor, 0.010, 4)
+    assert governor.level == 1.0
+
+    feed(governor, 0.030, 3)
+    assert governor.level == 1.0
+    feed(governor, 0.030, 1)
+    assert governor.level == 0.75
+    feed(governor, 0.030, 20)
+    assert governor.level == 0.25
+
+    # Between headroom and budget nothing changes; below headroom it recovers slowly
+    feed(governor, 0.012, 8)
+    assert governor.level == 0.25
+    feed(governor, 0.005, 8)
+    assert governor.level == 0.5
+    assert governor.stats() == {'quality': 0.5, 'frame_ms': 5.0, 'quality_adjustments': 5}
+
+
+def test_disabled_governor_keeps_full_quality():
+    governor = QualityGovernor(window=2)
+    governor.enabled = False
+    feed(governor, 1.0, 10)
+    assert governor.level == 1.0
+    assert governor.scale(25) == 25
+
+
+def impact_particles(level):
+    game_state = GameState(seed=3)
+    game_state.quality.level = level
+    player = game_state.player_unit
+    game_state.bullets.append(game_state.bullet_pool.acquire(game_state, player, Vector2(-1, 0)))
+    game_state.bullets[0].position = Vector2(0.1, 4)
+    MoveBulletsCommand(game_state).run()
+    particles = game_state.particles
+    return len(particles), particles.lifetimes[:len(particles)].max()
+
+
+def test_low_quality_emits_fewer_shorter_lived_particles():
+    full_count, full_lifetime = impact_particles(1.0)
+    low_count, low_lifetime = impact_particles(0.5)
+    assert full_count == MoveBulletsCommand.impact_particles
+    assert low_count == 13
+    assert full_lifetime > 150 >= low_lifetime
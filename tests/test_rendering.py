@@ -0,0 +1,88 @@
+import os
+import pygame
+from pygame import Vector2
+import pytest
+from src.ui.UserInterface import UserInterface
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def ui(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    ui = UserInterface()
+    yield ui
+    pygame.quit()
+
+
+def play(ui, ticks):
+    for tick in range(ticks):
+        ui.shoot = tick % 20 == 0
+        ui.direction = Vector2(1, 0) if tick < ticks // 2 else Vector2(0, 1)
+        ui.update()
+        ui.render()
+
+
+def test_dirty_rect_frames_match_full_redraw(ui):
+    play(ui, 120)
+    dirty_frame = pygame.image.tobytes(ui.window, "RGB")
+
+    ui.dirty_rects = False
+    ui.render()
+
+    assert pygame.image.tobytes(ui.window, "RGB") == dirty_frame
+
+
+def test_background_is_baked_once_until_map_changes(ui):
+    layer = ui.background_layer
+    first = layer.get_background()
+    play(ui, 5)
+    assert layer.get_background() is first
+
+    before = pygame.image.tobytes(first, "RGB")
+    tile_map = ui.game_state.tile_map
+    tile_map.set_tile(0, 0, 1 - tile_map.tile(0, 0))
+    assert layer.is_background_stale()
+    play(ui, 1)
+    # Redrawn into the same surface
+    assert layer.get_background() is first
+    assert pygame.image.tobytes(first, "RGB") != before
+
+
+def test_chunk_surfaces_are_bounded_by_the_viewport(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    ui = UserInterface(world_size=(512, 512))
+    try:
+        layer = ui.background_layer
+        assert layer.max_chunk_surfaces == 9
+        ui.player_unit.health = 10 ** 9
+        ui.player_unit.velocity = 2
+        for _ in range(200):
+            ui.direction = Vector2(1, 1)
+            ui.update()
+            ui.render()
+        assert ui.camera.offset[0] > 32 * 4 * ui.cell_size.x
+        assert len(layer.chunk_surfaces) <= 9
+    finally:
+        pygame.quit()
+
+
+def test_scrolling_world_matches_full_redraw(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    ui = UserInterface(world_size=(256, 256))
+    try:
+        ui.player_unit.health = 10 ** 9
+        ui.player_unit.velocity = 0.4
+        for tick in range(60):
+            ui.shoot = tick % 10 == 0
+            ui.direction = Vector2(1, 1)
+            ui.update()
+            ui.render()
+        assert ui.camera.offset != (0, 0)
+        dirty_frame = pygame.image.tobytes(ui.window, "RGB")
+
+        ui.dirty_rects = False
+        ui.render()
+        assert pygame.image.tobytes(ui.window, "RGB") == dirty_frame
+    finally:
+        pygame.quit()
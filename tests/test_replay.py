@@ -0,0 +1,65 @@
+import pytest
+from src.replay.InputLog import InputLog
+from src.replay.InputRecorder import InputRecorder
+from src.replay.ReplayPlayer import ReplayPlayer
+from src.simulation.ScriptedInput import ScriptedInput
+from src.simulation.Simulation import Simulation
+from src.state.GameState import GameState
+
+SCRIPT = [((1, 0), False)] * 40 + [((0, 1), True)] * 3 + [((-1, -1), False)] * 30 + [((0, 0), True)]
+
+
+def record(ticks=600, seed=1234):
+    simulation = Simulation(GameState(seed=seed))
+    simulation.recorder = InputRecorder(simulation.game_state, checksum_interval=50)
+    simulation.run(ticks, ScriptedInput(SCRIPT, loop=True))
+    return simulation, simulation.recorder.to_bytes()
+
+
+def test_input_encoding_round_trips():
+    for direction in [(-1, -1), (0, 0), (1, 0), (0, 1)]:
+        for shoot in (False, True):
+            assert InputLog.decode_input(InputLog.encode_input(direction, shoot)) == (direction, shoot)
+    with pytest.raises(ValueError):
+        InputLog.encode_input((0.5, 0), False)
+
+
+def test_varint_round_trips():
+    for value in (0, 1, 127, 128, 300, 2 ** 32):
+        encoded = InputLog.encode_varint(value)
+        assert InputLog.decode_varint(encoded, 0) == (value, len(encoded))
+
+
+def test_same_seed_and_inputs_give_same_state():
+    first, _ = record()
+    second, _ = record()
+    assert first.game_state.checksum() == second.game_state.checksum()
+    assert len(first.game_state.particles) > 0
+
+
+def test_replay_reproduces_recording():
+    simulation, data = record()
+    replay = ReplayPlayer(data)
+    replayed = replay.run()
+
+    assert replay.ticks == 600
+    assert replay.checkpoints == 12
+    assert replay.mismatches == []
+    assert replayed.game_state.checksum() == simulation.game_state.checksum()
+
+
+def test_replay_reports_divergence():
+    _, data = record()
+    replay = ReplayPlayer(data)
+    simulation = replay.create_simulation()
+    simulation.game_state.player_unit.health -= 1
+
+    replay.run(simulation)
+
+    assert replay.mismatches
+    assert replay.mismatches[0][0] == 50
+
+
+def test_log_is_compact():
+    _, data = record(ticks=6000)
+    assert len(data) < 6000 // 2
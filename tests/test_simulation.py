@@ -0,0 +1,71 @@
+import pygame
+from pygame import Vector2
+from src.simulation.ScriptedInput import ScriptedInput
+from src.simulation.Simulation import Simulation
+from src.state.GameState import GameState
+
+
+def test_step_applies_commands_without_a_display():
+    pygame.quit()
+    simulation = Simulation(GameState(seed=3))
+    player = simulation.player_unit
+    start = Vector2(player.position)
+
+    simulation.step(Vector2(1, 0))
+
+    assert not pygame.display.get_init()
+    assert simulation.game_state.epoch == 1
+    assert player.position.x > start.x and player.position.y == start.y
+    assert player.is_moving
+    assert simulation.commands == []
+    # The first shot is allowed once the bullet delay has passed
+    simulation.run(20, lambda epoch: (Vector2(0, 0), epoch == 16))
+    assert len(simulation.game_state.bullets) == 1
+
+
+def test_run_feeds_the_input_source_each_epoch():
+    simulation = Simulation(GameState(seed=3))
+    epochs = []
+
+    def input_source(epoch):
+        epochs.append(epoch)
+        return Vector2(0, 1) if epoch < 3 else Vector2(0, 0), False
+
+    simulation.run(5, input_source)
+
+    assert epochs == [0, 1, 2, 3, 4]
+    assert simulation.game_state.epoch == 5
+    assert not simulation.player_unit.is_moving
+    simulation.run(2)
+    assert simulation.game_state.epoch == 7
+
+
+def test_runs_with_the_same_seed_and_inputs_match():
+    script = [((1, 0), True)] * 20 + [((0, 1), False)] * 20
+    checksums = []
+    for _ in range(2):
+        simulation = Simulation(GameState(seed=8))
+        simulation.run(60, ScriptedInput(script, loop=True))
+        checksums.append(simulation.game_state.checksum())
+    assert checksums[0] == checksums[1]
+
+
+def test_scripted_input_loops_holds_or_idles():
+    script = [((1, 0), True), ((0, 1), False)]
+    looping = ScriptedInput(script, loop=True)
+    holding = ScriptedInput(script, hold_last=True)
+    idling = ScriptedInput(script)
+
+    assert [looping(epoch) for epoch in range(5)] == [
+        (Vector2(1, 0), True), (Vector2(0, 1), False), (Vector2(1, 0), True),
+        (Vector2(0, 1), False), (Vector2(1, 0), True)]
+    assert [holding(epoch) for epoch in range(4)][2:] == [(Vector2(0, 1), False)] * 2
+    assert [idling(epoch) for epoch in range(4)][2:] == [(Vector2(0, 0), False)] * 2
+    assert ScriptedInput([], loop=True)(0) == (Vector2(0, 0), False)
+
+
+def test_scripted_input_hands_out_copies():
+    scripted = ScriptedInput([((1, 0), False)], hold_last=True)
+    direction, _ = scripted(0)
+    direction.x = 5
+    assert scripted(1) == (Vector2(1, 0), False)
@@ -0,0 +1,97 @@
+import os
+import time
+import pygame
+from pygame import Vector2
+from src.simulation.RenderSnapshot import RenderSnapshot
+from src.simulation.Simulation import Simulation
+from src.simulation.SimulationThread import SimulationThread
+from src.state.GameState import GameState
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_snapshots_are_frozen_copies():
+    simulation = Simulation(GameState(seed=1))
+    simulation.game_state.particles.emit((4, 4), 10, 0.5)
+    snapshot = RenderSnapshot.capture(simulation.game_state, 0.0)
+    positions = snapshot.particles.copy()
+
+    simulation.run(30, lambda epoch: (Vector2(1, 0), epoch == 0))
+
+    assert not snapshot.particles.flags.writeable
+    assert (snapshot.particles == positions).all()
+    assert snapshot.units[0][2:4] == (5, 4)
+    assert snapshot.epoch == 0
+
+
+def test_renderer_interpolates_between_ticks():
+    simulation = Simulation(GameState(seed=1))
+    thread = SimulationThread(simulation, tick_rate=10)
+    game_state = simulation.game_state
+    previous = RenderSnapshot.capture(game_state, 1.0)
+    game_state.move_unit(game_state.player_unit, Vector2(6, 4))
+    latest = RenderSnapshot.capture(game_state, 1.1)
+    thread.snapshots = (previous, latest)
+    render_state = GameState(seed=1)
+    objects = {}
+
+    player = thread.interpolate(render_state, objects, now=1.15)
+    assert abs(player.position.x - 5.5) < 1e-9
+    assert render_state.player_unit is player
+    assert thread.interpolate(render_state, objects, now=1.5) is player
+    assert player.position.x == 6
+    assert len(render_state.units) == len(game_state.units)
+
+
+def test_render_stalls_do_not_change_game_speed():
+    simulation = Simulation(GameState(seed=1))
+    thread = SimulationThread(simulation, tick_rate=100)
+    thread.start()
+    try:
+        start = time.perf_counter()
+        for frame in range(6):
+            # A 150 ms render hiccup in the middle of steady frames
+            time.sleep(0.15 if frame == 3 else 0.05)
+        elapsed = time.perf_counter() - start
+    finally:
+        thread.stop()
+    assert abs(thread.ticks - elapsed * 100) < 15
+    assert thread.dropped_ticks == 0
+
+
+def test_snapshots_carry_the_moving_flag():
+    simulation = Simulation(GameState(seed=1))
+    thread = SimulationThread(simulation, tick_rate=200)
+    render_state = GameState(seed=1)
+    thread.set_input(Vector2(1, 0), False)
+    thread.start()
+    try:
+        time.sleep(0.05)
+        assert thread.snapshots[1].units[0][6]
+        assert thread.interpolate(render_state, {}).is_moving
+        thread.set_input(Vector2(0, 0), False)
+        time.sleep(0.05)
+        assert not thread.snapshots[1].units[0][6]
+    finally:
+        thread.stop()
+
+
+def test_threaded_ui_draws_interpolated_state(monkeypatch):
+    from src.ui.UserInterface import UserInterface
+    monkeypatch.chdir(REPO_ROOT)
+    ui = UserInterface(threaded=True, tick_rate=120)
+    try:
+        assert ui.game_state is not ui.simulation.game_state
+        ui.simulation_thread.start()
+        ui.direction = Vector2(1, 0)
+        for _ in range(20):
+            ui.update()
+            ui.render()
+            time.sleep(0.01)
+        assert ui.simulation_thread.ticks > 10
+        assert ui.player_unit is ui.game_state.player_unit
+        assert ui.player_unit is not ui.simulation.player_unit
+        assert ui.player_unit.position.x > 5
+    finally:
+        ui.simulation_thread.stop()
+        pygame.quit()
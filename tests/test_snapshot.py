@@ -0,0 +1,91 @@
+import pytest
+from src.simulation.ScriptedInput import ScriptedInput
+from src.simulation.Simulation import Simulation
+from src.state.GameState import GameState
+from src.state.Snapshot import Snapshot
+from src.state.SnapshotHistory import SnapshotHistory
+
+SCRIPT = [((1, 0), True)] * 20 + [((0, 1), True)] * 20 + [((-1, 0), False)] * 20
+
+
+def make_simulation():
+    simulation = Simulation(GameState(seed=5))
+    simulation.game_state.player_unit.health = 10 ** 9
+    return simulation
+
+
+def play(simulation, ticks):
+    script = ScriptedInput(SCRIPT, loop=True)
+    for _ in range(ticks):
+        simulation.step(*script(simulation.game_state.epoch))
+
+
+def checksums(simulation, ticks):
+    script = ScriptedInput(SCRIPT, loop=True)
+    result = []
+    for _ in range(ticks):
+        simulation.step(*script(simulation.game_state.epoch))
+        result.append(simulation.game_state.checksum())
+    return result
+
+
+def test_restore_replays_identically():
+    simulation = make_simulation()
+    play(simulation, 215)
+    game_state = simulation.game_state
+    player = game_state.player_unit
+    assert game_state.bullets and len(game_state.particles)
+    data = Snapshot.capture(game_state)
+
+    expected = checksums(simulation, 100)
+    Snapshot.restore(game_state, data)
+
+    assert game_state.epoch == 215
+    assert game_state.player_unit is player and game_state.units[0] is player
+    assert Snapshot.capture(game_state) == data
+    assert checksums(simulation, 100) == expected
+
+
+def test_delta_round_trip_is_small():
+    simulation = make_simulation()
+    play(simulation, 100)
+    base = Snapshot.capture(simulation.game_state)
+    play(simulation, 1)
+    data = Snapshot.capture(simulation.game_state)
+
+    delta = Snapshot.delta(base, data)
+
+    assert Snapshot.apply_delta(base, delta) == data
+    assert len(delta) < len(data) // 2
+
+
+def test_restore_rejects_foreign_data():
+    game_state = GameState(seed=1)
+    data = Snapshot.capture(game_state)
+    with pytest.raises(ValueError):
+        Snapshot.restore(game_state, b'x' * len(data))
+    with pytest.raises(ValueError):
+        Snapshot.restore(game_state, data[:-4])
+    game_state.tile_map.set_tile(0, 0, 1)
+    with pytest.raises(ValueError):
+        Snapshot.restore(game_state, data)
+
+
+def test_history_rolls_back_and_stays_bounded():
+    simulation = make_simulation()
+    history = SnapshotHistory(capacity=50, keyframe_interval=10)
+    states = {}
+    for _ in range(120):
+        play(simulation, 1)
+        history.push(simulation.game_state)
+        states[simulation.game_state.epoch] = simulation.game_state.checksum()
+
+    assert 50 <= len(history) < 60
+    assert history.epochs()[-1] == 120
+    with pytest.raises(KeyError):
+        history.get(5)
+
+    history.rollback(simulation.game_state, 97)
+    assert simulation.game_state.epoch == 97
+    assert simulation.game_state.checksum() == states[97]
+    assert history.epochs()[-1] == 97
@@ -0,0 +1,82 @@
+from pygame import Vector2
+from src.state.SpatialHash import SpatialHash
+
+
+class Unit:
+    def __init__(self, x, y):
+        self.position = Vector2(x, y)
+
+
+def test_move_rebuckets_unit():
+    index = SpatialHash()
+    unit = Unit(0.5, 0.5)
+    index.insert(unit)
+
+    unit.position = Vector2(5.5, 5.5)
+    index.move(unit)
+
+    assert index.unit_cells[unit] == (5, 5)
+    assert (0, 0) not in index.cells
+    assert index.query_radius((5, 5), 1) == [unit]
+    assert index.query_radius((0.5, 0.5), 1) == []
+
+
+def test_remove_drops_unit_and_empty_bucket():
+    index = SpatialHash()
+    unit = Unit(1.2, 1.2)
+    index.insert(unit)
+
+    index.remove(unit)
+    index.remove(unit)
+
+    assert unit not in index
+    assert len(index) == 0
+    assert index.cells == {}
+
+
+def test_query_radius_returns_all_within_strict_radius():
+    index = SpatialHash()
+    near = Unit(1.0, 1.0)
+    nearer = Unit(0.5, 0.0)
+    on_edge = Unit(1.0, 0.0)
+    for unit in (near, nearer, on_edge):
+        index.insert(unit)
+
+    found = index.query_radius((0, 0), 1.0)
+
+    assert set(found) == {nearer}
+    assert set(index.query_radius((0, 0), 1.5)) == {near, nearer, on_edge}
+
+
+def test_nearest_picks_closest_matching_predicate():
+    index = SpatialHash()
+    closest = Unit(0.2, 0.0)
+    other = Unit(0.6, 0.0)
+    index.insert(closest)
+    index.insert(other)
+
+    assert index.nearest((0, 0), 1.0) is closest
+    assert index.nearest((0, 0), 1.0, lambda unit: unit is not closest) is other
+    assert index.nearest((0, 0), 0.1) is None
+
+
+def test_queries_span_negative_cells():
+    index = SpatialHash(cell_size=2.0)
+    unit = Unit(-0.5, -0.5)
+    index.insert(unit)
+
+    assert index.query_radius((0.5, 0.5), 2.0) == [unit]
+
+
+def test_rebuild_matches_inserting_one_by_one():
+    units = [Unit(x * 0.7, -x * 1.3) for x in range(12)]
+    inserted = SpatialHash(cell_size=2.0)
+    for unit in units:
+        inserted.insert(unit)
+    rebuilt = SpatialHash(cell_size=2.0)
+    rebuilt.insert(Unit(50, 50))
+
+    rebuilt.rebuild(units, [(unit.position.x, unit.position.y) for unit in units])
+
+    assert rebuilt.unit_cells == inserted.unit_cells
+    assert rebuilt.cells == inserted.cells
@@ -0,0 +1,39 @@
+import pygame
+from src.layers.SpriteAtlas import SpriteAtlas
+from src.layers.SpriteEffectCache import SpriteEffectCache
+
+
+def make_sheet(path):
+    sheet = pygame.Surface((4, 2), pygame.SRCALPHA)
+    for x in range(4):
+        for y in range(2):
+            sheet.set_at((x, y), (x * 60, y * 100, 10, 255))
+    pygame.image.save(sheet, str(path))
+    return str(path)
+
+
+def test_tiles_are_sliced_once_by_index(tmp_path):
+    path = make_sheet(tmp_path / 'sheet.png')
+    atlas = SpriteAtlas((2, 1), SpriteEffectCache())
+
+    sprites = atlas.sprites(path)
+
+    assert atlas.sprites(path) is sprites
+    assert len(sprites) == 4
+    assert atlas.tile_index(path, (1, 1)) == 3
+    assert sprites[3].get_size() == (2, 1)
+    assert sprites[3].get_at((0, 0)) == (120, 100, 10, 255)
+    assert sprites[3].get_parent() is atlas.sheet(path)
+
+
+def test_effect_variants_are_sliced_from_the_effect_cache(tmp_path):
+    path = make_sheet(tmp_path / 'sheet.png')
+    effects = SpriteEffectCache()
+    atlas = SpriteAtlas((2, 1), effects, max_variants=1)
+
+    flash = atlas.sprites(path, 'flash')
+
+    assert flash[0].get_parent() is effects.get(atlas.sheet(path), 'flash')
+    assert flash[0].get_at((0, 0)) == (255, 255, 255, 255)
+    atlas.sprites(path)
+    assert len(atlas.slices) == 1
@@ -0,0 +1,42 @@
+import pygame
+from src.layers.SpriteEffectCache import SpriteEffectCache
+
+
+def make_tileset(color=(10, 20, 30, 255)):
+    tileset = pygame.Surface((4, 4), pygame.SRCALPHA)
+    tileset.fill(color)
+    return tileset
+
+
+def test_variants_are_built_once_and_reused():
+    cache = SpriteEffectCache()
+    tileset = make_tileset()
+
+    flash = cache.get(tileset, 'flash')
+
+    assert cache.get(tileset, 'flash') is flash
+    assert cache.get(tileset, None) is tileset
+    assert flash.get_at((0, 0)) == (255, 255, 255, 255)
+    assert tileset.get_at((0, 0)) == (10, 20, 30, 255)
+
+
+def test_damage_and_fade_variants():
+    cache = SpriteEffectCache()
+    tileset = make_tileset((200, 200, 200, 255))
+
+    assert cache.get(tileset, 'damage').get_at((0, 0)).g < 200
+    assert cache.get(tileset, 'fade').get_at((0, 0)).a < 255
+
+
+def test_cache_evicts_least_recently_used():
+    cache = SpriteEffectCache(max_entries=2)
+    first, second, third = make_tileset(), make_tileset(), make_tileset()
+
+    kept = cache.get(first, 'flash')
+    cache.get(second, 'flash')
+    cache.get(first, 'flash')
+    cache.get(third, 'flash')
+
+    assert len(cache) == 2
+    assert cache.get(first, 'flash') is kept
+    assert (second, 'flash') not in cache.variants
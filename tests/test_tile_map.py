@@ -0,0 +1,65 @@
+import threading
+import numpy as np
+from src.state.TileMap import TileMap
+
+
+def make_map(**kwargs):
+    tile_map = TileMap(256, 256, chunk_size=16, seed=7, **kwargs)
+    tile_map.generate_simple_map()
+    return tile_map
+
+
+def test_loaded_chunks_stay_bounded():
+    tile_map = make_map(max_loaded_chunks=8)
+    for x in range(0, 256, 16):
+        tile_map.tile(x, 0)
+
+    assert len(tile_map.chunks) == 8
+    assert tile_map.chunks_generated == 16
+
+
+def test_evicted_chunks_regenerate_identically():
+    tile_map = make_map(max_loaded_chunks=2)
+    before = tile_map.region(0, 0, 16, 16)
+    tile_map.tile(100, 100)
+    tile_map.tile(200, 200)
+    assert (0, 0) not in tile_map.chunks
+
+    assert np.array_equal(tile_map.region(0, 0, 16, 16), before)
+
+
+def test_modified_chunks_are_kept():
+    tile_map = make_map(max_loaded_chunks=1)
+    tile_map.set_tile(3, 3, 1)
+    tile_map.tile(100, 100)
+    tile_map.tile(200, 200)
+
+    assert tile_map.tile(3, 3) == 1
+    assert (0, 0) in tile_map.chunks
+
+
+def test_region_spans_chunks_and_clips_to_world():
+    tile_map = make_map()
+    region = tile_map.region(10, 10, 40, 20)
+    assert region.shape == (10, 30)
+    assert region[5, 20] == tile_map.tile(30, 15)
+
+    assert tile_map.region(250, 250, 300, 300).shape == (6, 6)
+
+
+def test_stream_loads_view_with_margin():
+    tile_map = make_map()
+    tile_map.stream(32, 32, 48, 48, margin=1)
+    assert set(tile_map.chunks) == {(x, y) for x in range(1, 4) for y in range(1, 4)}
+
+
+def test_chunk_cache_access_waits_for_the_lock():
+    tile_map = make_map(max_loaded_chunks=4)
+    with tile_map.lock:
+        reader = threading.Thread(target=tile_map.region, args=(0, 0, 256, 256))
+        reader.start()
+        reader.join(0.05)
+        # Blocked while another thread holds the LRU
+        assert reader.is_alive()
+    reader.join()
+    assert len(tile_map.chunks) == 4